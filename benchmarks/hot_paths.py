@@ -0,0 +1,303 @@
+"""
+Microbenchmarks of the local (non-network) hot paths of turbocase.
+
+Each benchmark runs against a generated project of 1k-100k test case files, and reports
+operations per second along with the memory allocated by a single operation.
+
+Usage:
+    python benchmarks/hot_paths.py                             # 1k and 10k files
+    python benchmarks/hot_paths.py --sizes 1000 100000
+    python benchmarks/hot_paths.py --save-baseline baseline.json
+    python benchmarks/hot_paths.py --compare baseline.json     # exits with 1 on regressions
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import toml  # noqa: E402
+import yaml  # noqa: E402
+from rich.console import Console  # noqa: E402
+from rich.table import Table  # noqa: E402
+from turbocase import utility  # noqa: E402
+from turbocase.enums import App, Project  # noqa: E402
+from turbocase.Testiny import Testiny  # noqa: E402
+
+DEFAULT_SIZES = [1000, 10000]
+DEFAULT_MIN_TIME = 1.0  # seconds per benchmark
+ROUNDS_N = 5
+DEFAULT_TOLERANCE = 0.15  # a slowdown above 15% is a regression
+NESTING_DEPTH = 20  # depth of the folder `get_turbocase_folder_path` starts from
+
+TEST_CASE = {
+    "preconditions": ["User logged in", "Cart is not empty"],
+    "steps": ["Click on checkout", "Fill credit card information", "Click on pay"],
+    "expected results": ["Response indicate success", "Receive booking email"],
+}
+
+
+def generate_project(project_path: str, files_n: int) -> None:
+    """
+    Generate a turbocase project with test case files spread over the folders of all apps.
+
+    Args:
+        project_path (str): The path of the project folder to create.
+        files_n (int): The number of test case files.
+    """
+    os.makedirs(os.path.join(project_path, ".turbocase"))
+    with open(os.path.join(project_path, ".turbocase", "project.toml"), "w") as file:
+        toml.dump(
+            {
+                "API_KEY": "benchmark",
+                "OWNER_USER_ID": 1,
+                **{project.name: i for i, project in enumerate(Project, 1)},
+            },
+            file,
+        )
+
+    content = yaml.safe_dump(TEST_CASE, sort_keys=False)
+    apps = list(App)
+    for app in apps:
+        os.makedirs(os.path.join(project_path, app.value.path), exist_ok=True)
+    for i in range(files_n):
+        app = apps[i % len(apps)]
+        with open(
+            os.path.join(project_path, app.value.path, f"Test case {i}.yaml"), "w"
+        ) as file:
+            file.write(content)
+
+    os.makedirs(os.path.join(project_path, *(["nested"] * NESTING_DEPTH)))
+
+
+def get_benchmarks(project_path: str, files_n: int) -> Dict[str, Callable[[], object]]:
+    """
+    Get the benchmarked operations on a generated project.
+
+    Args:
+        project_path (str): The path of the generated project.
+        files_n (int): The number of test case files of the project.
+
+    Returns:
+        Dict[str, Callable[[], object]]: The operation of each benchmark, by name.
+    """
+    read_test_case_file = Testiny._Testiny__read_test_case_file
+    test_case_file_path = os.path.join(
+        project_path, App.WEB.value.path, "Test case 3.yaml"
+    )
+    missing_file_name = f"Test case {files_n}.yaml"
+    nested_path = os.path.join(project_path, *(["nested"] * NESTING_DEPTH))
+
+    def yaml_load():
+        with open(test_case_file_path, "r", encoding="utf-8") as file:
+            return yaml.safe_load(file)
+
+    def file_exists_in_project_cold():
+        utility._test_files_index_cache.clear()
+        return utility.file_exists_in_project(missing_file_name, project_path)
+
+    def get_project_configuration_cold():
+        utility._configuration_cache.clear()
+        return utility.get_project_configuration("API_KEY")
+
+    return {
+        "yaml load": yaml_load,
+        "read test case file (load + validation)": lambda: read_test_case_file(
+            test_case_file_path, project_path
+        ),
+        "schema validation": lambda: Testiny.validate_test_case_content(TEST_CASE),
+        "file_exists_in_project (cold tree walk)": file_exists_in_project_cold,
+        "file_exists_in_project (warm index)": lambda: utility.file_exists_in_project(
+            missing_file_name, project_path
+        ),
+        "get_turbocase_folder_path": lambda: utility.get_turbocase_folder_path(
+            __current_dir=nested_path
+        ),
+        "get_project_configuration (cold)": get_project_configuration_cold,
+        "get_project_configuration (warm)": lambda: utility.get_project_configuration(
+            "API_KEY"
+        ),
+    }
+
+
+def measure(operation: Callable[[], object], min_time: float) -> Tuple[float, int, int]:
+    """
+    Measure an operation.
+
+    Args:
+        operation (Callable[[], object]): The operation.
+        min_time (float): The minimum total duration of the timed runs, in seconds.
+
+    Returns:
+        Tuple[float, int, int]: The operations per second, and the peak and retained memory
+            allocated by a single operation, in bytes.
+    """
+    operation()  # warm-up
+
+    tracemalloc.start()
+    memory_before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    operation()
+    memory_after, memory_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    peak_bytes = memory_peak - memory_before
+    retained_bytes = max(memory_after - memory_before, 0)
+
+    # the best of several rounds is the least disturbed by other processes
+    best_ops_per_sec = 0.0
+    for _ in range(ROUNDS_N):
+        runs_n = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time / ROUNDS_N:
+            operation()
+            runs_n += 1
+            elapsed = time.perf_counter() - start
+        best_ops_per_sec = max(best_ops_per_sec, runs_n / elapsed)
+
+    return best_ops_per_sec, peak_bytes, retained_bytes
+
+
+def run(sizes: List[int], min_time: float) -> Dict[str, Dict[str, float]]:
+    """
+    Run all benchmarks for each project size.
+
+    Args:
+        sizes (List[int]): The numbers of test case files of the generated projects.
+        min_time (float): The minimum duration of each benchmark, in seconds.
+
+    Returns:
+        Dict[str, Dict[str, float]]: The operations per second of each benchmark, by size then name.
+    """
+    console = Console()
+    results: Dict[str, Dict[str, float]] = {}
+    initial_dir = os.getcwd()
+
+    for files_n in sizes:
+        with tempfile.TemporaryDirectory() as project_path:
+            with console.status(f"Generating a project of {files_n} files..."):
+                generate_project(project_path, files_n)
+            os.chdir(project_path)
+
+            table = Table(title=f"{files_n} test case files")
+            table.add_column("Benchmark")
+            table.add_column("ops/sec", justify="right")
+            table.add_column("peak bytes/op", justify="right")
+            table.add_column("retained bytes/op", justify="right")
+
+            results[str(files_n)] = {}
+            for name, operation in get_benchmarks(project_path, files_n).items():
+                with console.status(f"Running `{name}`..."):
+                    ops_per_sec, peak_bytes, retained_bytes = measure(
+                        operation, min_time
+                    )
+                results[str(files_n)][name] = ops_per_sec
+                table.add_row(
+                    name,
+                    f"{ops_per_sec:,.1f}",
+                    f"{peak_bytes:,}",
+                    f"{retained_bytes:,}",
+                )
+
+            os.chdir(initial_dir)
+            console.print(table)
+
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> bool:
+    """
+    Compare results against a baseline and print the differences.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): The results of this run.
+        baseline (Dict[str, Dict[str, float]]): The results of the baseline run.
+        tolerance (float): The relative slowdown above which a benchmark is a regression.
+
+    Returns:
+        bool: True if no benchmark regressed.
+    """
+    console = Console()
+    table = Table(title="Comparison with the baseline")
+    table.add_column("Files", justify="right")
+    table.add_column("Benchmark")
+    table.add_column("Baseline ops/sec", justify="right")
+    table.add_column("ops/sec", justify="right")
+    table.add_column("Change", justify="right")
+
+    has_regressions = False
+    for files_n, benchmarks in results.items():
+        for name, ops_per_sec in benchmarks.items():
+            baseline_ops_per_sec = baseline.get(files_n, {}).get(name)
+            if baseline_ops_per_sec is None:
+                continue
+            change = ops_per_sec / baseline_ops_per_sec - 1
+            is_regression = change < -tolerance
+            has_regressions |= is_regression
+            color = (
+                "red" if is_regression else "green" if change > tolerance else "white"
+            )
+            table.add_row(
+                files_n,
+                name,
+                f"{baseline_ops_per_sec:,.1f}",
+                f"{ops_per_sec:,.1f}",
+                f"[{color}]{change:+.1%}",
+            )
+
+    console.print(table)
+    return not has_regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help=f"Numbers of test case files of the generated projects. Default: {DEFAULT_SIZES}",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=DEFAULT_MIN_TIME,
+        help=f"Minimum duration of each benchmark, in seconds. Default: {DEFAULT_MIN_TIME}",
+    )
+    parser.add_argument("--save-baseline", help="Save the results to this JSON file.")
+    parser.add_argument(
+        "--compare", help="Compare the results with this baseline JSON file."
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"Relative slowdown above which a benchmark is a regression. Default: {DEFAULT_TOLERANCE}",
+    )
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.min_time)
+
+    if args.save_baseline is not None:
+        with open(args.save_baseline, "w") as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare, "r") as baseline_file:
+            baseline = json.load(baseline_file)
+        if not compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
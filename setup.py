@@ -28,7 +28,7 @@ setup(
     package_data={"turbocase": ["Testiny_schema.json"]},
     entry_points={
         "console_scripts": [
-            "turbocase = turbocase.main:main",
+            "turbocase = turbocase.daemon:launch",
         ]
     },
 )
@@ -1,12 +1,23 @@
-from typing import Any, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Set, Tuple
 from urllib.parse import urljoin
 import jsonschema
 import requests
 import yaml
 import json
 import os
-from turbocase.utility import get_project_id_from_config_file, get_project_configuration
-from turbocase.enums import App, Project, UpsertAction
+from turbocase.utility import (
+    ConcurrentModificationError,
+    TestCaseLoader,
+    find_document,
+    get_project_id_from_config_file,
+    get_project_configuration,
+    read_document,
+    resolve_fragments,
+)
+from turbocase.enums import App, ConflictPolicy, Project, ResultStatus, UpsertAction
+from turbocase.backends import Backend, get_project_backend
+from turbocase.rate_budget import get_rate_budget
 
 
 class Testiny:
@@ -16,16 +27,164 @@ class Testiny:
 
     __CONTENT_TYPE = "application/json"
     __SCHEMA_FILE_PATH = os.path.join(
-        os.path.dirname(__file__), "testiny_schema.json"
+        os.path.dirname(__file__), "Testiny_schema.json"
     )  # .todo: write this in a better (safer) way
     __API_URL = "https://app.testiny.io/api/v1/"
+    __TIMEOUT = 10
+    DEFAULT_PAGE_SIZE = 100
+    # How many times an update is re-applied when the remote test case keeps changing
+    MAX_CONFLICT_RETRIES = 3
+
+    # Kept warm for the lifetime of the process (see `turbocase daemon`)
+    __session: requests.Session | None = None
+    __schema_validator: Any = None
+    # Overrides the backend of the projects (see `use_backend`)
+    __backend: Backend | None = None
+
+    @staticmethod
+    def use_backend(backend: Backend | None) -> None:
+        """Sends all API requests to a backend (e.g. a `LocalBackend`), whatever the configuration of the project.
+
+        Args:
+            backend (Backend | None): The backend. `None` restores the backend configured by each project.
+        """
+        Testiny.__backend = backend
+
+    @staticmethod
+    def __get_session(project_path: str | None = None) -> Backend | requests.Session:
+        """Get the backend of the API requests of a project.
+
+        This is the backend set with `use_backend`, else the one selected by the `BACKEND` configuration
+        of the project, else the HTTP session shared by all requests to the Testiny API, so that TLS
+        connections are reused.
+
+        Args:
+            project_path (str | None): The path to the project folder. Default: the project containing the current directory.
+
+        Returns:
+            Backend | requests.Session: The backend.
+        """
+        if Testiny.__backend is not None:
+            return Testiny.__backend
+        backend = get_project_backend(project_path)
+        if backend is not None:
+            return backend
+        if Testiny.__session is None:
+            Testiny.__session = requests.Session()
+        return Testiny.__session
+
+    @staticmethod
+    def __request(
+        method: str,
+        endpoint: str,
+        *,
+        api_key: str | None = None,
+        payload: Any = None,
+        project_path: str | None = None,
+    ) -> requests.Response:
+        """Sends a request to the Testiny API.
+
+        If the project configures a `RATE_LIMIT`, the request first waits for its turn in the rate budget
+        shared by all processes using the same API key (see `get_rate_budget`).
+
+        Args:
+            method (str): The HTTP method of the request.
+            endpoint (str): The endpoint, relative to the API URL.
+            api_key (str | None): The API key to use. Default: the `API_KEY` of the project configuration.
+            payload (Any): The JSON-serializable body of the request, if any.
+            project_path (str | None): The path to the project folder, whose configuration sets the API key,
+                backend and rate budget of the request. Default: the project containing the current directory.
+
+        Returns:
+            requests.Response: The (successful) response.
+
+        Raises:
+            requests.HTTPError: If the server responds with an error status.
+        """
+        headers = {
+            "Accept": Testiny.__CONTENT_TYPE,
+            "X-Api-Key": api_key or get_project_configuration("API_KEY", project_path),
+        }
+        data = None
+        if payload is not None:
+            headers["Content-Type"] = Testiny.__CONTENT_TYPE
+            data = json.dumps(payload)
+
+        rate_budget = get_rate_budget(project_path, headers["X-Api-Key"])
+        if rate_budget is not None:
+            rate_budget.acquire()
+
+        response = Testiny.__get_session(project_path).request(
+            method,
+            urljoin(Testiny.__API_URL, endpoint),
+            headers=headers,
+            data=data,
+            timeout=Testiny.__TIMEOUT,
+        )
+        response.raise_for_status()
+
+        return response
 
     @staticmethod
-    def __read_test_case_file(file_path: str) -> Dict[str, Any]:
-        """Reads a test case file in YAML format and validates it against a JSON schema
+    def __is_conflict(error: Exception) -> bool:
+        """Whether an error is the rejection of a write based on an outdated `_etag`.
+
+        Args:
+            error (Exception): The error.
+
+        Returns:
+            bool: Whether the server responded with `409 Conflict` or `412 Precondition Failed`.
+        """
+        return (
+            isinstance(error, requests.HTTPError)
+            and error.response is not None
+            and error.response.status_code in (409, 412)
+        )
+
+    @staticmethod
+    def __get_schema_validator() -> Any:
+        """Gets the validator of the test case schema, compiling it on first use.
+
+        Returns:
+            Any: The `jsonschema` validator of the test case schema.
+        """
+        if Testiny.__schema_validator is None:
+            with open(Testiny.__SCHEMA_FILE_PATH, "r", encoding="utf-8") as schema_file:
+                schema = json.load(schema_file)
+            validator_class = jsonschema.validators.validator_for(schema)
+            validator_class.check_schema(schema)
+            Testiny.__schema_validator = validator_class(schema)
+        return Testiny.__schema_validator
+
+    @staticmethod
+    def warm_up() -> None:
+        """Compiles the schema validator and creates the HTTP session ahead of the first use."""
+        Testiny.__get_schema_validator()
+        Testiny.__get_session()
+
+    @staticmethod
+    def validate_test_case_content(test_case_content: Any) -> None:
+        """Validates the content of a test case against the test case schema.
+
+        Args:
+            test_case_content (Any): The loaded content of a test case.
+
+        Raises:
+            jsonschema.ValidationError: If the content does not match the schema.
+        """
+        error = jsonschema.exceptions.best_match(
+            Testiny.__get_schema_validator().iter_errors(test_case_content)
+        )
+        if error is not None:
+            raise error
+
+    @staticmethod
+    def __read_test_case_file(file_path: str, project_path: str) -> Dict[str, Any]:
+        """Reads a test case file in YAML format, expands its shared fragments and validates it against a JSON schema
 
         Args:
             file_path (str): The path to the test case file.
+            project_path (str): The path to the project folder, holding the shared fragments.
 
         Returns:
             Dict[str, Any]: The content of the loaded test case.
@@ -37,24 +196,23 @@ class Testiny:
             raise ValueError("File path does not refer to a valid YAML file")
 
         with open(file_path, "r", encoding="utf-8") as file:
-            test_case_content = yaml.safe_load(file)
+            test_case_content = yaml.load(file, Loader=TestCaseLoader)
 
-        with open(Testiny.__SCHEMA_FILE_PATH, "r", encoding="utf-8") as schema_file:
-            schema = json.load(schema_file)
-
-        jsonschema.validate(test_case_content, schema)
+        test_case_content = resolve_fragments(test_case_content, project_path)
+        Testiny.validate_test_case_content(test_case_content)
 
         return test_case_content
 
     @staticmethod
     def __find_test_case_by_title(
-        title: str, projects_ids: List[int]
+        title: str, projects_ids: List[int], project_path: str | None = None
     ) -> List[Tuple[int, str]]:
         """Find a test case by its title.
 
         Args:
             title (str): The title of the test case.
             project (Project): The project to which the test case belongs.
+            project_path (str | None): The path to the project folder.
 
         Returns:
             List[Tuple[int, str]]: A list of tuples containing the ID and ETag of the found test case.
@@ -62,19 +220,10 @@ class Testiny:
         Raises:
             ValueError: If more than one test case is found with the given title.
         """
-        url = urljoin(Testiny.__API_URL, "testcase/find")
-
-        payload = json.dumps({"filter": {"title": title, "project_id": projects_ids}})
-        headers = {
-            "Content-Type": Testiny.__CONTENT_TYPE,
-            "Accept": Testiny.__CONTENT_TYPE,
-            "X-Api-Key": get_project_configuration("API_KEY"),
-        }
-
-        response = requests.request(
-            "POST", url, headers=headers, data=payload, timeout=10
+        payload = {"filter": {"title": title, "project_id": projects_ids}}
+        response = Testiny.__request(
+            "POST", "testcase/find", payload=payload, project_path=project_path
         )
-        response.raise_for_status()
 
         test_cases = response.json()["data"]
 
@@ -83,26 +232,502 @@ class Testiny:
         return results
 
     @staticmethod
-    def get_owner_user_id(api_key: str) -> int:
-        url = urljoin(Testiny.__API_URL, "account/me")
-        headers = {
-            "Accept": Testiny.__CONTENT_TYPE,
-            "X-Api-Key": api_key,
+    def __find_page(
+        entity: str,
+        query: Dict[str, Any],
+        offset: int,
+        limit: int,
+        api_key: str | None,
+        project_path: str | None = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Fetches a single page of a `find` query.
+
+        Args:
+            entity (str): The entity to find (e.g. `testcase`).
+            query (Dict[str, Any]): The query, without pagination.
+            offset (int): The number of entities to skip.
+            limit (int): The maximum number of entities to fetch.
+            api_key (str | None): The API key to use. Default: the `API_KEY` of the project configuration.
+            project_path (str | None): The path to the project folder.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: The entities of the page and the total number of matching entities.
+        """
+        payload = {**query, "pagination": {"offset": offset, "limit": limit}}
+        response = Testiny.__request(
+            "POST",
+            f"{entity}/find",
+            api_key=api_key,
+            payload=payload,
+            project_path=project_path,
+        )
+
+        content = response.json()
+        return content["data"], content["meta"]["count"]
+
+    @staticmethod
+    def __iter_pages(
+        entity: str,
+        query: Dict[str, Any],
+        *,
+        page_size: int,
+        prefetch: bool,
+        api_key: str | None = None,
+        project_path: str | None = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Lazily iterates over the pages of a `find` query, ordered by ID.
+
+        Args:
+            entity (str): The entity to find (e.g. `testcase`).
+            query (Dict[str, Any]): The query, without pagination.
+            page_size (int): The number of entities per page.
+            prefetch (bool): Whether to fetch the next page while the current one is consumed.
+            api_key (str | None): The API key to use. Default: the `API_KEY` of the project configuration.
+            project_path (str | None): The path to the project folder.
+
+        Yields:
+            List[Dict[str, Any]]: The entities of each page.
+        """
+        if page_size < 1:
+            raise ValueError("Page size must be a positive integer")
+
+        # ordering by ID keeps pages stable while entities are created concurrently
+        query = {"order": [{"column": "id", "order": "asc"}], **query}
+        if api_key is None:
+            api_key = get_project_configuration("API_KEY", project_path)
+
+        if not prefetch:
+            offset = 0
+            while True:
+                page, count = Testiny.__find_page(
+                    entity, query, offset, page_size, api_key, project_path
+                )
+                if page:
+                    yield page
+                offset += page_size
+                if len(page) < page_size or offset >= count:
+                    return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            offset = 0
+            future = executor.submit(
+                Testiny.__find_page,
+                entity,
+                query,
+                offset,
+                page_size,
+                api_key,
+                project_path,
+            )
+            while True:
+                page, count = future.result()
+                offset += page_size
+                is_last_page = len(page) < page_size or offset >= count
+                if not is_last_page:
+                    future = executor.submit(
+                        Testiny.__find_page,
+                        entity,
+                        query,
+                        offset,
+                        page_size,
+                        api_key,
+                        project_path,
+                    )
+                if page:
+                    yield page
+                if is_last_page:
+                    return
+
+    @staticmethod
+    def iter_test_cases(
+        project_id: int,
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        fields: List[str] | None = None,
+        prefetch: bool = False,
+        filter: Dict[str, Any] | None = None,
+        project_path: str | None = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Lazily iterates over the test cases of a project, fetching them page by page.
+
+        Args:
+            project_id (int): The ID of the project.
+            page_size (int): The number of test cases fetched per request. Default: 100.
+            fields (List[str] | None): The fields to keep of each test case (e.g. `["id", "title", "_etag"]`).
+                Default: all fields.
+            prefetch (bool): Whether to fetch the next page in the background while the current one is consumed.
+            filter (Dict[str, Any] | None): Extra filters of the `find` query (e.g. `{"title": "Login"}`).
+            project_path (str | None): The path to the project folder.
+
+        Yields:
+            Dict[str, Any]: The test cases, ordered by ID.
+        """
+        query = {"filter": {**(filter or {}), "project_id": project_id}}
+
+        for page in Testiny.__iter_pages(
+            "testcase",
+            query,
+            page_size=page_size,
+            prefetch=prefetch,
+            project_path=project_path,
+        ):
+            for test_case in page:
+                if fields is None:
+                    yield test_case
+                else:
+                    yield {field: test_case.get(field) for field in fields}
+
+    @staticmethod
+    def find_test_cases_by_titles(
+        titles: List[str], project_id: int, project_path: str | None = None
+    ) -> Dict[str, Tuple[int, str]]:
+        """Finds the test cases of a project matching any of the given titles (exactly).
+
+        Args:
+            titles (List[str]): The titles of the test cases.
+            project_id (int): The ID of the project.
+            project_path (str | None): The path to the project folder.
+
+        Returns:
+            Dict[str, Tuple[int, str]]: The ID and ETag of each found test case, by title.
+        """
+        if not titles:
+            return {}
+
+        return {
+            test_case["title"]: (test_case["id"], test_case["_etag"])
+            for test_case in Testiny.iter_test_cases(
+                project_id,
+                page_size=len(titles),
+                fields=["id", "title", "_etag"],
+                filter={"title": titles},
+                project_path=project_path,
+            )
         }
-        response = requests.request("GET", url, headers=headers, timeout=10)
-        response.raise_for_status()
 
-        response = response.json()
+    @staticmethod
+    def find_test_cases_ids_by_titles(
+        titles: List[str], project_id: int, project_path: str | None = None
+    ) -> Dict[str, int]:
+        """Finds the IDs of the test cases of a project matching any of the given titles (exactly).
+
+        Args:
+            titles (List[str]): The titles of the test cases.
+            project_id (int): The ID of the project.
+            project_path (str | None): The path to the project folder.
+
+        Returns:
+            Dict[str, int]: The ID of each found test case, by title.
+        """
+        return {
+            title: test_case_id
+            for title, (test_case_id, _) in Testiny.find_test_cases_by_titles(
+                titles, project_id, project_path
+            ).items()
+        }
+
+    @staticmethod
+    def upsert_test_cases_in_bulk(
+        test_cases: List[Tuple[str, Dict[str, Any]]],
+        app: App,
+        project_path: str,
+        *,
+        batch_size: int = DEFAULT_PAGE_SIZE,
+        conflict_policy: ConflictPolicy = ConflictPolicy.LOCAL_WINS,
+        on_conflict: Callable[[str, int], None] | None = None,
+    ) -> Dict[str, Tuple[UpsertAction, List[Tuple[int, Project]]]]:
+        """Creates or updates many test cases of an app, with a few bulk requests per batch and project.
+
+        In each project, test cases are matched by title: existing ones are updated and missing ones are created.
+        Updates rejected because test cases changed remotely since they were found are resolved with the
+        conflict policy (see `upsert_test_case`).
+
+        Args:
+            test_cases (List[Tuple[str, Dict[str, Any]]]): The title and loaded content of each test case.
+            app (App): The app to which the test cases belong.
+            project_path (str): The path to the project folder.
+            batch_size (int): The maximum number of test cases sent per request. Default: 100.
+            conflict_policy (ConflictPolicy): How to resolve conflicting updates. Default: `LOCAL_WINS`.
+            on_conflict (Callable[[str, int], None] | None): Called with the title and ID of each conflicting test case.
+
+        Returns:
+            Dict[str, Tuple[UpsertAction, List[Tuple[int, Project]]]]: By title, the action performed
+                (`KEEP_REMOTE` if the remote test case was kept in any project, else `CREATE` if the test case
+                was created in any project) and the IDs of the test case per project.
+        """
+        results: Dict[str, Tuple[UpsertAction, List[Tuple[int, Project]]]] = {
+            test_title: (UpsertAction.UPDATE, []) for test_title, _ in test_cases
+        }
+
+        for project in app.value.projects:
+            project_id = get_project_id_from_config_file(project, project_path)
+
+            for batch_start in range(0, len(test_cases), batch_size):
+                batch = test_cases[batch_start : batch_start + batch_size]
+                found_test_cases = Testiny.find_test_cases_by_titles(
+                    [test_title for test_title, _ in batch], project_id, project_path
+                )
+
+                updates = [
+                    (test_title, test_case_content)
+                    for test_title, test_case_content in batch
+                    if test_title in found_test_cases
+                ]
+                if updates:
+                    payload = [
+                        {
+                            **Testiny.__build_test_case_payload(
+                                test_title, project_id, test_case_content, project_path
+                            ),
+                            "id": found_test_cases[test_title][0],
+                            "_etag": found_test_cases[test_title][1],
+                        }
+                        for test_title, test_case_content in updates
+                    ]
+                    kept_remote_ids = Testiny.__update_test_cases_in_bulk(
+                        payload,
+                        project_id,
+                        project_path,
+                        conflict_policy=conflict_policy,
+                        on_conflict=on_conflict,
+                    )
+                    for test_title, _ in updates:
+                        test_case_id = found_test_cases[test_title][0]
+                        if test_case_id in kept_remote_ids:
+                            results[test_title] = (
+                                UpsertAction.KEEP_REMOTE,
+                                results[test_title][1],
+                            )
+                        results[test_title][1].append((test_case_id, project))
+
+                creations = [
+                    (test_title, test_case_content)
+                    for test_title, test_case_content in batch
+                    if test_title not in found_test_cases
+                ]
+                if creations:
+                    payload = [
+                        Testiny.__build_test_case_payload(
+                            test_title, project_id, test_case_content, project_path
+                        )
+                        for test_title, test_case_content in creations
+                    ]
+                    response = Testiny.__request(
+                        "POST",
+                        "testcase/bulk",
+                        payload=payload,
+                        project_path=project_path,
+                    )
+                    for (test_title, _), created_test_case in zip(
+                        creations, response.json()
+                    ):
+                        if results[test_title][0] == UpsertAction.UPDATE:
+                            results[test_title] = (
+                                UpsertAction.CREATE,
+                                results[test_title][1],
+                            )
+                        results[test_title][1].append(
+                            (created_test_case["id"], project)
+                        )
+
+        return results
+
+    @staticmethod
+    def __update_test_cases_in_bulk(
+        payload: List[Dict[str, Any]],
+        project_id: int,
+        project_path: str | None,
+        *,
+        conflict_policy: ConflictPolicy,
+        on_conflict: Callable[[str, int], None] | None,
+    ) -> Set[int]:
+        """Updates test cases of a project with a bulk request, resolving conflicts with a policy.
+
+        A conflict rejects the whole request without telling which test cases changed, so the current
+        `_etag` of the sent test cases is fetched with a single `find` request to tell them apart.
+
+        Args:
+            payload (List[Dict[str, Any]]): The test cases to update, with their `id` and `_etag`.
+            project_id (int): The ID of the project.
+            project_path (str | None): The path to the project folder.
+            conflict_policy (ConflictPolicy): How to resolve conflicting updates.
+            on_conflict (Callable[[str, int], None] | None): Called with the title and ID of each conflicting test case.
+
+        Returns:
+            Set[int]: The IDs of the test cases not updated, the remote ones being kept (`REMOTE_WINS`).
+
+        Raises:
+            ConcurrentModificationError: If a conflict is not resolved.
+        """
+        kept_remote_ids: Set[int] = set()
+        for _ in range(Testiny.MAX_CONFLICT_RETRIES + 1):
+            if not payload:
+                return kept_remote_ids
+            try:
+                Testiny.__request(
+                    "PUT", "testcase/bulk", payload=payload, project_path=project_path
+                )
+                return kept_remote_ids
+            except requests.HTTPError as e:
+                if not Testiny.__is_conflict(e):
+                    raise
+                conflict_error = e
+
+            current_etags = {
+                test_case["id"]: test_case["_etag"]
+                for test_case in Testiny.iter_test_cases(
+                    project_id,
+                    page_size=len(payload),
+                    fields=["id", "_etag"],
+                    filter={"id": [test_case["id"] for test_case in payload]},
+                    project_path=project_path,
+                )
+            }
+            conflicting = [
+                test_case
+                for test_case in payload
+                if current_etags.get(test_case["id"]) != test_case["_etag"]
+            ]
+            if not conflicting:
+                raise conflict_error
+
+            for test_case in conflicting:
+                if on_conflict is not None:
+                    on_conflict(test_case["title"], test_case["id"])
+                if test_case["id"] not in current_etags:
+                    raise ConcurrentModificationError(
+                        test_case["title"], test_case["id"], "was deleted remotely"
+                    )
+                if conflict_policy == ConflictPolicy.ABORT:
+                    raise ConcurrentModificationError(
+                        test_case["title"],
+                        test_case["id"],
+                        "was modified remotely since it was read",
+                    )
+                test_case["_etag"] = current_etags[test_case["id"]]
+            if conflict_policy == ConflictPolicy.REMOTE_WINS:
+                kept_remote_ids.update(test_case["id"] for test_case in conflicting)
+                payload = [
+                    test_case
+                    for test_case in payload
+                    if test_case["id"] not in kept_remote_ids
+                ]
+
+        raise ConcurrentModificationError(
+            conflicting[0]["title"],
+            conflicting[0]["id"],
+            f"kept changing remotely after {Testiny.MAX_CONFLICT_RETRIES} retries",
+        )
+
+    @staticmethod
+    def create_test_run(
+        title: str, project_id: int, project_path: str | None = None
+    ) -> int:
+        """Creates a test run in a project.
+
+        Args:
+            title (str): The title of the test run.
+            project_id (int): The ID of the project.
+            project_path (str | None): The path to the project folder.
+
+        Returns:
+            int: The ID of the created test run.
+        """
+        payload = {"title": title, "project_id": project_id}
+        response = Testiny.__request(
+            "POST", "testrun", payload=payload, project_path=project_path
+        )
+
+        return response.json()["id"]
+
+    @staticmethod
+    def add_test_run_results(
+        test_run_id: int,
+        results: List[Tuple[int, ResultStatus]],
+        project_path: str | None = None,
+    ) -> None:
+        """Adds (or updates) the results of many test cases in a test run, in a single request.
+
+        Args:
+            test_run_id (int): The ID of the test run.
+            results (List[Tuple[int, ResultStatus]]): The ID and result of each test case.
+            project_path (str | None): The path to the project folder.
+        """
+        payload = [
+            {
+                "ids": {"testcase_id": test_case_id, "testrun_id": test_run_id},
+                "mapped": {"result_status": result_status.value},
+            }
+            for test_case_id, result_status in results
+        ]
+        Testiny.__request(
+            "POST",
+            "testrun/mapping/bulk/testcase:testrun?op=add_or_update",
+            payload=payload,
+            project_path=project_path,
+        )
+
+    @staticmethod
+    def delete_test_cases(
+        test_cases: List[Tuple[int, str]], project_path: str | None = None
+    ) -> None:
+        """Deletes many test cases, in a single request.
+
+        The request is rejected if any of the test cases changed remotely since its `_etag` was fetched.
+
+        Args:
+            test_cases (List[Tuple[int, str]]): The ID and ETag of each test case.
+            project_path (str | None): The path to the project folder.
+        """
+        payload = [
+            {"id": test_case_id, "_etag": etag} for test_case_id, etag in test_cases
+        ]
+        Testiny.__request(
+            "DELETE", "testcase/bulk", payload=payload, project_path=project_path
+        )
+
+    @staticmethod
+    def get_owner_user_id(api_key: str) -> int:
+        response = Testiny.__request("GET", "account/me", api_key=api_key).json()
         if "error" in response.keys():
             raise ValueError("No user found associated with the given API key")
         return response["userId"]
 
+    @staticmethod
+    def __build_test_case_payload(
+        test_title: str,
+        project_id: int,
+        test_case_content: Dict[str, Any],
+        project_path: str | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Build the body of the API requests creating or updating a test case.
+
+        Args:
+            test_title (str): The title of the test case.
+            project_id (int): The ID of the project.
+            test_case_content (Dict[str, Any]): The content of the test case.
+            project_path (str | None): The path to the project folder.
+
+        Returns:
+            Dict[str, Any]: The test case, as expected by the API.
+        """
+        return {
+            "title": test_title,
+            "precondition_text": "\n".join(test_case_content["preconditions"]),
+            "steps_text": "\n".join(test_case_content["steps"]),
+            "expected_result_text": "\n".join(test_case_content["expected results"]),
+            "project_id": project_id,
+            "template": "TEXT",
+            "owner_user_id": get_project_configuration("OWNER_USER_ID", project_path),
+        }
+
     @staticmethod
     def __create_test_case_in_single_project(
         test_title: str,
         project_id: int,
         test_case_content: Dict[str, Any],
-        headers: Dict[str, Any],
+        project_path: str | None = None,
     ) -> int:
         """
         Create a test case in a single Testiny project.
@@ -111,31 +736,18 @@ class Testiny:
             test_title (str): The title of the test case.
             project_id (int): The ID of the project.
             test_case_content (Dict[str, Any]): The content of the test case.
-            headers (Dict[str, Any]): The headers for the API request.
+            project_path (str | None): The path to the project folder.
 
         Returns:
             int: The ID of the created test case.
         """
-        url = urljoin(Testiny.__API_URL, "testcase")
-
-        payload = json.dumps(
-            {
-                "title": test_title,
-                "precondition_text": "\n".join(test_case_content["preconditions"]),
-                "steps_text": "\n".join(test_case_content["steps"]),
-                "expected_result_text": "\n".join(
-                    test_case_content["expected results"]
-                ),
-                "project_id": project_id,
-                "template": "TEXT",
-                "owner_user_id": get_project_configuration("OWNER_USER_ID"),
-            }
+        payload = Testiny.__build_test_case_payload(
+            test_title, project_id, test_case_content, project_path
         )
 
-        response = requests.request(
-            "POST", url, headers=headers, data=payload, timeout=10
+        response = Testiny.__request(
+            "POST", "testcase", payload=payload, project_path=project_path
         )
-        response.raise_for_status()
 
         return response.json()["id"]
 
@@ -144,114 +756,174 @@ class Testiny:
         test_title: str,
         project_id: int,
         test_case_content: Dict[str, Any],
-        headers: Dict[str, Any],
         test_case_id: int,
         etag: str,
-    ) -> int:
+        project_path: str | None = None,
+        *,
+        conflict_policy: ConflictPolicy = ConflictPolicy.LOCAL_WINS,
+        on_conflict: Callable[[str, int], None] | None = None,
+    ) -> bool:
         """
         Update a test case in a single Testiny project.
 
+        If the test case changed remotely since the ETag was read, only this test case is fetched
+        again, and the conflict is resolved with the conflict policy.
+
         Args:
             test_title (str): The title of the test case.
             project_id (int): The ID of the project.
             test_case_content (Dict[str, Any]): The content of the test case.
-            headers (Dict[str, Any]): The headers for the API request.
             test_case_id (int): The ID of the test case to be updated.
             etag (str): The ETag value for optimistic concurrency control.
+            project_path (str | None): The path to the project folder.
+            conflict_policy (ConflictPolicy): How to resolve a conflicting update. Default: `LOCAL_WINS`.
+            on_conflict (Callable[[str, int], None] | None): Called with the title and ID of the test case on each conflict.
 
         Returns:
-            int: The ID of the updated test case.
-        """
-        url = urljoin(Testiny.__API_URL, f"testcase/{test_case_id}")
+            bool: Whether the test case was updated, `False` if the remote one was kept (`REMOTE_WINS`).
 
-        payload = json.dumps(
-            {
-                "title": test_title,
-                "precondition_text": "\n".join(test_case_content["preconditions"]),
-                "steps_text": "\n".join(test_case_content["steps"]),
-                "expected_result_text": "\n".join(
-                    test_case_content["expected results"]
-                ),
-                "project_id": project_id,
-                "template": "TEXT",
-                "owner_user_id": get_project_configuration("OWNER_USER_ID"),
-                "_etag": etag,
-            }
+        Raises:
+            ConcurrentModificationError: If a conflict is not resolved.
+        """
+        payload = Testiny.__build_test_case_payload(
+            test_title, project_id, test_case_content, project_path
         )
 
-        response = requests.request(
-            "PUT", url, headers=headers, data=payload, timeout=10
-        )
-        response.raise_for_status()
+        for _ in range(Testiny.MAX_CONFLICT_RETRIES + 1):
+            try:
+                Testiny.__request(
+                    "PUT",
+                    f"testcase/{test_case_id}",
+                    payload={**payload, "_etag": etag},
+                    project_path=project_path,
+                )
+                return True
+            except requests.HTTPError as e:
+                if not Testiny.__is_conflict(e):
+                    raise
 
-        return response.json()["id"]
+            if on_conflict is not None:
+                on_conflict(test_title, test_case_id)
+            if conflict_policy == ConflictPolicy.ABORT:
+                raise ConcurrentModificationError(
+                    test_title, test_case_id, "was modified remotely since it was read"
+                )
+            if conflict_policy == ConflictPolicy.REMOTE_WINS:
+                return False
+            etag = Testiny.get_test_case(test_case_id, project_path)["_etag"]
+
+        raise ConcurrentModificationError(
+            test_title,
+            test_case_id,
+            f"kept changing remotely after {Testiny.MAX_CONFLICT_RETRIES} retries",
+        )
 
     @staticmethod
-    def __get_test_case_json(test_case_id: int) -> Dict[str, Any]:
+    def get_test_case(
+        test_case_id: int, project_path: str | None = None
+    ) -> Dict[str, Any]:
         """Reads a test case using the passed API key
 
         Args:
             test_case_id (int): ID of the test case to read
+            project_path (str | None): The path to the project folder.
 
         Returns:
-            Dict[str, Any]: The content of the test case
+            Dict[str, Any]: The content of the test case, as returned by the API
         """
-        url = urljoin(Testiny.__API_URL, f"testcase/{test_case_id}")
-        headers = {
-            "Accept": Testiny.__CONTENT_TYPE,
-            "X-Api-Key": get_project_configuration("API_KEY"),
-        }
-
-        response = requests.request("GET", url, headers=headers, timeout=10)
-        response.raise_for_status()
+        response = Testiny.__request(
+            "GET", f"testcase/{test_case_id}", project_path=project_path
+        )
 
         return response.json()
 
+    @staticmethod
+    def load_test_case(test_title: str, app: App, project_path: str) -> Dict[str, Any]:
+        """Loads the test case file of a title and validates it against the test case schema
+
+        The test case is read from `<title>.yaml` in the folder of the app or, if there is no such file,
+        from the multi-document file of the folder holding a document with this title. Its shared fragments
+        (`!include <path>`) are expanded before the validation.
+
+        Args:
+            test_title (str): The title of the test case
+            app (App): The app to which the test case belongs
+            project_path (str): The path to the project folder
+
+        Returns:
+            Dict[str, Any]: The content of the loaded test case.
+        """
+        test_path = os.path.join(project_path, app.value.path, f"{test_title}.yaml")
+        if not os.path.exists(test_path):
+            document_file_path = find_document(project_path, app, test_title)
+            if document_file_path is not None:
+                test_case_content = resolve_fragments(
+                    read_document(document_file_path, test_title), project_path
+                )
+                Testiny.validate_test_case_content(test_case_content)
+                return test_case_content
+        return Testiny.__read_test_case_file(test_path, project_path)
+
     @staticmethod
     def upsert_test_case(
-        test_title: str, app: App, project_path: str
+        test_title: str,
+        app: App,
+        project_path: str,
+        test_case_content: Dict[str, Any] | None = None,
+        *,
+        conflict_policy: ConflictPolicy = ConflictPolicy.LOCAL_WINS,
+        on_conflict: Callable[[str, int], None] | None = None,
     ) -> Tuple[UpsertAction, List[Tuple[int, Project]]]:
         """Creates or updates a test case from a YAML file using the passed API key
 
+        If a test case changes remotely between the time it is found and updated (e.g. edited in Testiny,
+        or updated by a concurrent run), the conflict is resolved with the conflict policy: the local test
+        case is re-applied over the latest remote one (`LOCAL_WINS`), the remote one is kept (`REMOTE_WINS`),
+        or the upsert fails (`ABORT`).
+
         Args:
             file_path (str): path to the YAML file containing the test case
             app (str): The name of the app to which the test case belongs
             project_path (str): The path to the project folder
+            test_case_content (Dict[str, Any] | None): The already loaded content of the test case.
+                Default: loaded from the YAML file.
+            conflict_policy (ConflictPolicy): How to resolve conflicting updates. Default: `LOCAL_WINS`.
+            on_conflict (Callable[[str, int], None] | None): Called with the title and ID of the test case on each conflict.
 
         Returns:
             Tuple[UpsertAction, List[Tuple[int, Project]]]: A tuple containing the action performed
-                and a list of tuples containing the test case ID and project name of the created/updated test case
+                (`KEEP_REMOTE` if the remote test case was kept in any project) and a list of tuples
+                containing the test case ID and project name of the created/updated test case
         """
-        headers = {
-            "Content-Type": Testiny.__CONTENT_TYPE,
-            "Accept": Testiny.__CONTENT_TYPE,
-            "X-Api-Key": get_project_configuration("API_KEY"),
-        }
-
-        test_path = os.path.join(project_path, app.value.path, f"{test_title}.yaml")
-        test_case_content = Testiny.__read_test_case_file(test_path)
+        if test_case_content is None:
+            test_case_content = Testiny.load_test_case(test_title, app, project_path)
 
         projects_ids = [
             get_project_id_from_config_file(project, project_path)
             for project in app.value.projects
         ]
 
-        found_test_cases = Testiny.__find_test_case_by_title(test_title, projects_ids)
+        found_test_cases = Testiny.__find_test_case_by_title(
+            test_title, projects_ids, project_path
+        )
 
         if found_test_cases:
             test_cases_ids, etags = list(zip(*found_test_cases))
+            upsert_operation = UpsertAction.UPDATE
             for project_id, test_case_id, etag in zip(
                 projects_ids, test_cases_ids, etags
             ):
-                Testiny.__update_test_case_in_single_project(
+                if not Testiny.__update_test_case_in_single_project(
                     test_title,
                     project_id,
                     test_case_content,
-                    headers,
                     test_case_id,
                     etag,
-                )
-            upsert_operation = UpsertAction.UPDATE
+                    project_path,
+                    conflict_policy=conflict_policy,
+                    on_conflict=on_conflict,
+                ):
+                    upsert_operation = UpsertAction.KEEP_REMOTE
         else:
             test_cases_ids = []
             for project_id in projects_ids:
@@ -259,7 +931,7 @@ class Testiny:
                     test_title,
                     project_id,
                     test_case_content,
-                    headers,
+                    project_path,
                 )
                 test_cases_ids.append(test_case_id)
             upsert_operation = UpsertAction.CREATE
@@ -276,7 +948,7 @@ class Testiny:
         Returns:
             str: The test case in a human-readable format, with Rich colors
         """
-        test_case = Testiny.__get_test_case_json(test_case_id)
+        test_case = Testiny.get_test_case(test_case_id)
 
         format_list = lambda text: "\n".join(f"  - {line}" for line in text.split("\n"))
 
@@ -296,18 +968,10 @@ class Testiny:
         Returns:
             int: The ID of the project if found or None if no project is found.
         """
-        url = urljoin(Testiny.__API_URL, "project/find")
-        payload = json.dumps({"filter": {"name": project_name}, "idOnly": True})
-        headers = {
-            "Content-Type": Testiny.__CONTENT_TYPE,
-            "Accept": Testiny.__CONTENT_TYPE,
-            "X-Api-Key": api_key,
-        }
-
-        response = requests.request(
-            "POST", url, headers=headers, data=payload, timeout=10
+        payload = {"filter": {"name": project_name}, "idOnly": True}
+        response = Testiny.__request(
+            "POST", "project/find", api_key=api_key, payload=payload
         )
-        response.raise_for_status()
 
         meta, data = response.json().values()
 
@@ -317,17 +981,48 @@ class Testiny:
         return data[0]["id"]
 
     @staticmethod
-    def generate_test_case_template() -> str:
+    def get_projects_ids(api_key: str) -> Dict[str, int]:
+        """Lists all projects of the account once, to resolve many project names without a request each.
+
+        Args:
+            api_key (str): The API key to use.
+
+        Returns:
+            Dict[str, int]: The ID of each project, by name.
+        """
+        return {
+            project["name"]: project["id"]
+            for page in Testiny.__iter_pages(
+                "project",
+                {},
+                page_size=Testiny.DEFAULT_PAGE_SIZE,
+                prefetch=True,
+                api_key=api_key,
+            )
+            for project in page
+        }
+
+    @staticmethod
+    def generate_test_case_template(steps: List[str] | None = None) -> str:
         """Generates a test case template with the given title.
 
+        Args:
+            steps (List[str] | None): The steps to fill in. Default: an empty step.
+
         Returns:
             str: The generated test case template.
         """
+        formatted_steps = "  - \n"
+        if steps:
+            formatted_steps = "".join(
+                f"  {yaml.safe_dump([step], allow_unicode=True, width=float('inf'))}"
+                for step in steps
+            )
         return (
             "preconditions:\n"
             "  - \n"
             "steps:\n"
-            "  - \n"
+            f"{formatted_steps}"
             "expected results:\n"
             "  - \n"
         )
@@ -0,0 +1,388 @@
+import http
+import json
+import os
+import re
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+from urllib.parse import urlsplit
+import requests
+from turbocase.enums import Project
+from turbocase.utility import (
+    NotTurboCaseProject,
+    get_turbocase_folder_path,
+    load_configuration_file,
+)
+
+BACKENDS = ("testiny", "local")
+DEFAULT_BACKEND = "testiny"
+LOCAL_BACKEND_FILE_NAME = "local-backend.sqlite3"
+
+# The user owning the test cases of the local backend, whatever the API key
+LOCAL_OWNER_USER_ID = 1
+
+_API_PATH_PREFIX = "/api/v1/"
+_FIELD_PATTERN = re.compile(r"^\w+$")
+
+# The tables of the local backend
+_SCHEMA = [
+    "CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS entities ("
+    "entity TEXT NOT NULL, id INTEGER NOT NULL, data TEXT NOT NULL, PRIMARY KEY (entity, id))",
+    "CREATE INDEX IF NOT EXISTS entities_title ON entities (entity, json_extract(data, '$.title'))",
+    "CREATE TABLE IF NOT EXISTS mappings ("
+    "testcase_id INTEGER NOT NULL, testrun_id INTEGER NOT NULL, data TEXT NOT NULL, "
+    "PRIMARY KEY (testcase_id, testrun_id))",
+]
+
+# The local backend of each project, kept across calls (see `turbocase daemon`)
+_local_backends_cache: Dict[str, "LocalBackend"] = {}
+
+
+class Backend(ABC):
+    """
+    The transport of the Testiny API requests.
+
+    A backend has the interface of `requests.Session.request` that `Testiny` relies on, so that the
+    remote service can be replaced (e.g. by `LocalBackend`) without changing any request.
+    """
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str] | None = None,
+        data: str | None = None,
+        timeout: float | None = None,
+    ) -> requests.Response:
+        """
+        Send a request.
+
+        Args:
+            method (str): The HTTP method of the request.
+            url (str): The URL of the endpoint.
+            headers (Dict[str, str] | None): The headers of the request.
+            data (str | None): The JSON body of the request, if any.
+            timeout (float | None): The timeout of the request, in seconds.
+
+        Returns:
+            requests.Response: The response, which may have an error status.
+        """
+
+
+class LocalBackendError(Exception):
+    """An error response of the local backend."""
+
+    def __init__(self, status: http.HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class LocalBackend(Backend):
+    """
+    A fake of the Testiny API backed by a SQLite database, for offline and reproducible runs.
+
+    Entities (test cases, test runs, projects) are stored as JSON documents with sequential IDs.
+    Every write gives the entity a new `_etag`, and updates whose `_etag` is not the current one are
+    rejected with `409 Conflict`, as by Testiny. `find` queries support equality and `in` (list)
+    filters on any field, ordering and pagination.
+
+    The database starts with one project per Turbo-Case project, named after it (e.g. `WEB`).
+    Any API key is accepted.
+    """
+
+    def __init__(self, database_path: str = ":memory:"):
+        """
+        Args:
+            database_path (str): The path of the SQLite database, created if missing.
+                Default: `:memory:`, an in-process database discarded with the backend.
+        """
+        self.database_path = database_path
+        self.__lock = threading.Lock()
+        # transactions are explicit (see `__transaction`)
+        self.__connection = sqlite3.connect(
+            database_path, check_same_thread=False, timeout=30, isolation_level=None
+        )
+        with self.__transaction():
+            for statement in _SCHEMA:
+                self.__connection.execute(statement)
+            if self.__connection.execute("SELECT 1 FROM counters").fetchone() is None:
+                for project in Project:
+                    self.__create("project", {"name": project.name})
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Dict[str, str] | None = None,
+        data: str | None = None,
+        timeout: float | None = None,
+    ) -> requests.Response:
+        url_parts = urlsplit(url)
+        path = url_parts.path
+        if path.startswith(_API_PATH_PREFIX):
+            path = path[len(_API_PATH_PREFIX) :]
+        payload = json.loads(data) if data else None
+
+        try:
+            with self.__transaction():
+                status, body = self.__dispatch(method.upper(), path, payload)
+        except LocalBackendError as e:
+            status, body = e.status, {"error": e.status.phrase, "message": str(e)}
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = http.HTTPStatus(status).phrase
+        response.url = url
+        response.headers["Content-Type"] = "application/json"
+        response._content = json.dumps(body).encode("utf-8")
+        return response
+
+    @contextmanager
+    def __transaction(self) -> Iterator[None]:
+        """Run a request atomically, serialized with the other threads and processes using the database."""
+        with self.__lock:
+            self.__connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self.__connection.execute("ROLLBACK")
+                raise
+            self.__connection.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the database."""
+        self.__connection.close()
+
+    def __dispatch(
+        self, method: str, path: str, payload: Any
+    ) -> Tuple[http.HTTPStatus, Any]:
+        segments = path.strip("/").split("/")
+        if segments == ["account", "me"] and method == "GET":
+            return http.HTTPStatus.OK, {"userId": LOCAL_OWNER_USER_ID}
+        if segments[:2] == ["testrun", "mapping"] and method == "POST":
+            return http.HTTPStatus.OK, self.__add_mappings(payload)
+
+        entity = segments[0]
+        if len(segments) == 1 and method == "POST":
+            return http.HTTPStatus.OK, self.__create(entity, payload)
+        if len(segments) == 2 and segments[1] == "find" and method == "POST":
+            return http.HTTPStatus.OK, self.__find(entity, payload or {})
+        if len(segments) == 2 and segments[1] == "bulk":
+            if method == "POST":
+                return http.HTTPStatus.OK, [
+                    self.__create(entity, item) for item in payload
+                ]
+            if method == "PUT":
+                return http.HTTPStatus.OK, [
+                    self.__update(entity, item["id"], item) for item in payload
+                ]
+            if method == "DELETE":
+                return http.HTTPStatus.OK, [
+                    self.__delete(entity, item["id"], item.get("_etag"))
+                    for item in payload
+                ]
+        if len(segments) == 2 and segments[1].isdigit():
+            entity_id = int(segments[1])
+            if method == "GET":
+                return http.HTTPStatus.OK, self.__get(entity, entity_id)
+            if method == "PUT":
+                return http.HTTPStatus.OK, self.__update(entity, entity_id, payload)
+            if method == "DELETE":
+                return http.HTTPStatus.OK, self.__delete(entity, entity_id)
+
+        raise LocalBackendError(
+            http.HTTPStatus.NOT_FOUND, f"Unsupported request: {method} {path}"
+        )
+
+    def __increment(self, counter_name: str) -> int:
+        self.__connection.execute(
+            "INSERT INTO counters VALUES (?, 1) "
+            "ON CONFLICT (name) DO UPDATE SET value = value + 1",
+            (counter_name,),
+        )
+        (value,) = self.__connection.execute(
+            "SELECT value FROM counters WHERE name = ?", (counter_name,)
+        ).fetchone()
+        return value
+
+    def __next_etag(self) -> str:
+        # a single revision counter across entities, so that ETags are never reused
+        return f"{self.__increment('_etag'):08x}"
+
+    def __get(self, entity: str, entity_id: int) -> Dict[str, Any]:
+        row = self.__connection.execute(
+            "SELECT data FROM entities WHERE entity = ? AND id = ?",
+            (entity, entity_id),
+        ).fetchone()
+        if row is None:
+            raise LocalBackendError(
+                http.HTTPStatus.NOT_FOUND, f"No {entity} found with the ID: {entity_id}"
+            )
+        return json.loads(row[0])
+
+    def __create(self, entity: str, item: Dict[str, Any]) -> Dict[str, Any]:
+        # IDs are never reused, even after a deletion
+        entity_id = self.__increment(entity)
+        item = {
+            **{key: value for key, value in item.items() if key != "_etag"},
+            "id": entity_id,
+            "_etag": self.__next_etag(),
+        }
+        self.__connection.execute(
+            "INSERT INTO entities VALUES (?, ?, ?)",
+            (entity, entity_id, json.dumps(item)),
+        )
+        return item
+
+    def __update(
+        self, entity: str, entity_id: int, item: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        current_item = self.__get(entity, entity_id)
+        if item.get("_etag") != current_item["_etag"]:
+            raise LocalBackendError(
+                http.HTTPStatus.CONFLICT,
+                f"The {entity} with the ID {entity_id} was modified concurrently "
+                f"(expected `_etag` {current_item['_etag']}, got {item.get('_etag')})",
+            )
+        updated_item = {
+            **current_item,
+            **item,
+            "id": entity_id,
+            "_etag": self.__next_etag(),
+        }
+        self.__connection.execute(
+            "UPDATE entities SET data = ? WHERE entity = ? AND id = ?",
+            (json.dumps(updated_item), entity, entity_id),
+        )
+        return updated_item
+
+    def __delete(
+        self, entity: str, entity_id: int, etag: str | None = None
+    ) -> Dict[str, Any]:
+        current_item = self.__get(entity, entity_id)
+        if etag is not None and etag != current_item["_etag"]:
+            raise LocalBackendError(
+                http.HTTPStatus.CONFLICT,
+                f"The {entity} with the ID {entity_id} was modified concurrently "
+                f"(expected `_etag` {current_item['_etag']}, got {etag})",
+            )
+        self.__connection.execute(
+            "DELETE FROM entities WHERE entity = ? AND id = ?", (entity, entity_id)
+        )
+        return {"id": entity_id}
+
+    def __find(self, entity: str, query: Dict[str, Any]) -> Dict[str, Any]:
+        conditions = ["entity = ?"]
+        parameters: List[Any] = [entity]
+        for field, value in (query.get("filter") or {}).items():
+            column = self.__get_column(field)
+            values = value if isinstance(value, list) else [value]
+            if not values:
+                conditions.append("0")
+                continue
+            conditions.append(f"{column} IN ({', '.join('?' * len(values))})")
+            parameters.extend(values)
+        where = " AND ".join(conditions)
+
+        (count,) = self.__connection.execute(
+            f"SELECT COUNT(*) FROM entities WHERE {where}", parameters
+        ).fetchone()
+
+        orders = [
+            f"{self.__get_column(order['column'])} "
+            f"{'DESC' if str(order.get('order', 'asc')).lower() == 'desc' else 'ASC'}"
+            for order in query.get("order") or []
+        ]
+        sql = f"SELECT data FROM entities WHERE {where} ORDER BY {', '.join(orders + ['id'])}"
+        pagination = query.get("pagination") or {}
+        if "limit" in pagination or "offset" in pagination:
+            sql += " LIMIT ? OFFSET ?"
+            parameters += [pagination.get("limit", -1), pagination.get("offset", 0)]
+
+        items = [
+            json.loads(data) for (data,) in self.__connection.execute(sql, parameters)
+        ]
+        if query.get("idOnly"):
+            items = [{"id": item["id"]} for item in items]
+        return {"meta": {"count": count}, "data": items}
+
+    @staticmethod
+    def __get_column(field: str) -> str:
+        if not _FIELD_PATTERN.match(field):
+            raise LocalBackendError(
+                http.HTTPStatus.BAD_REQUEST, f"Invalid field: `{field}`"
+            )
+        return "id" if field == "id" else f"json_extract(data, '$.{field}')"
+
+    def __add_mappings(self, payload: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        for mapping in payload:
+            ids = mapping["ids"]
+            self.__get("testcase", ids["testcase_id"])
+            self.__get("testrun", ids["testrun_id"])
+            self.__connection.execute(
+                "INSERT OR REPLACE INTO mappings VALUES (?, ?, ?)",
+                (ids["testcase_id"], ids["testrun_id"], json.dumps(mapping["mapped"])),
+            )
+        return payload
+
+
+def get_local_backend(project_path: str) -> LocalBackend:
+    """
+    Get the local backend of a project, stored in `.turbocase/local-backend.sqlite3`.
+
+    Args:
+        project_path (str): The path to the project folder.
+
+    Returns:
+        LocalBackend: The local backend, opened once per process.
+    """
+    database_path = os.path.join(
+        os.path.abspath(project_path), ".turbocase", LOCAL_BACKEND_FILE_NAME
+    )
+    backend = _local_backends_cache.get(database_path)
+    if backend is None:
+        backend = LocalBackend(database_path)
+        _local_backends_cache[database_path] = backend
+    return backend
+
+
+def get_project_backend(project_path: str | None = None) -> Backend | None:
+    """
+    Get the backend selected by the `BACKEND` configuration of a project.
+
+    Args:
+        project_path (str | None): The path to the project folder.
+            Default: the project containing the current directory.
+
+    Returns:
+        Backend | None: The backend, or `None` for the Testiny API (the default, also used outside of projects).
+
+    Raises:
+        ValueError: If the configured backend is unknown.
+    """
+    try:
+        turbocase_folder_path = (
+            get_turbocase_folder_path()
+            if project_path is None
+            else os.path.join(project_path, ".turbocase")
+        )
+        configurations = load_configuration_file(
+            os.path.join(turbocase_folder_path, "project.toml")
+        )
+    except (NotTurboCaseProject, FileNotFoundError):
+        return None
+
+    backend_name = configurations.get("BACKEND", DEFAULT_BACKEND)
+    if backend_name == DEFAULT_BACKEND:
+        return None
+    if backend_name == "local":
+        return get_local_backend(os.path.dirname(turbocase_folder_path))
+    raise ValueError(
+        f"Unknown backend: [yellow]`{backend_name}`[/yellow]. Choose from: {', '.join(BACKENDS)}"
+    )
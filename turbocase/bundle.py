@@ -0,0 +1,232 @@
+import hashlib
+import json
+import mmap
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Tuple
+from turbocase.enums import App
+from turbocase.utility import get_test_case_path, list_test_titles, open_atomically
+from turbocase.Testiny import Testiny
+
+BUNDLE_FORMAT = "turbocase-bundle"
+BUNDLE_VERSION = 1
+DEFAULT_BUNDLE_PATH = os.path.join(".turbocase", "bundle.jsonl")
+
+# The header is padded to a fixed size, so that it can be rewritten once the index offset is known
+_HEADER_SIZE = 256
+
+
+def get_content_hash(test_case_content: Any) -> str:
+    """
+    Get a stable hash of the content of a test case.
+
+    Args:
+        test_case_content (Any): The loaded content of the test case.
+
+    Returns:
+        str: The SHA-256 hash of the canonical JSON form of the content.
+    """
+    canonical_json = json.dumps(
+        test_case_content, sort_keys=True, separators=(",", ":"), ensure_ascii=False
+    )
+    return hashlib.sha256(canonical_json.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class BundleSummary:
+    """
+    Represents the outcome of building a bundle.
+
+    Attributes:
+        bundled_n (int): The number of test cases written to the bundle.
+        errors (List[Tuple[App, str, Exception]]): The app, title and error of each invalid test case file.
+    """
+
+    bundled_n: int = 0
+    errors: List[Tuple[App, str, Exception]] = field(default_factory=list)
+
+
+def build_bundle(project_path: str, bundle_path: str) -> BundleSummary:
+    """
+    Compile the test case files of a project into a bundle.
+
+    A bundle is a JSON Lines file: a header line (padded to a fixed size), one line per test case
+    (`app`, `title`, `path`, `hash` and `content`), then an index line mapping each app and title
+    to the byte offset and length of its line. Test cases can thus be streamed or read at random
+    (e.g. through `mmap`) without parsing any YAML.
+
+    The bundle is only written if every test case file is valid.
+
+    Args:
+        project_path (str): The path to the project folder.
+        bundle_path (str): The path of the bundle to write.
+
+    Returns:
+        BundleSummary: The outcome of the build.
+    """
+    summary = BundleSummary()
+    records: List[Tuple[str, str, bytes]] = []
+    for app in App:
+        for test_title in list_test_titles(project_path, app):
+            try:
+                test_case_content = Testiny.load_test_case(
+                    test_title, app, project_path
+                )
+            except Exception as e:
+                summary.errors.append((app, test_title, e))
+                continue
+            record = {
+                "app": app.value.name,
+                "title": test_title,
+                "path": get_test_case_path(project_path, app, test_title),
+                "hash": get_content_hash(test_case_content),
+                "content": test_case_content,
+            }
+            records.append(
+                (
+                    app.value.name,
+                    test_title,
+                    json.dumps(
+                        record, separators=(",", ":"), ensure_ascii=False
+                    ).encode("utf-8")
+                    + b"\n",
+                )
+            )
+    if summary.errors:
+        return summary
+
+    with open_atomically(bundle_path, "wb") as bundle_file:
+        bundle_file.write(b" " * (_HEADER_SIZE - 1) + b"\n")
+        index: Dict[str, Dict[str, List[int]]] = {}
+        for app_name, test_title, record in records:
+            index.setdefault(app_name, {})[test_title] = [
+                bundle_file.tell(),
+                len(record),
+            ]
+            bundle_file.write(record)
+
+        index_offset = bundle_file.tell()
+        bundle_file.write(
+            json.dumps(index, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+            + b"\n"
+        )
+
+        header = json.dumps(
+            {
+                "format": BUNDLE_FORMAT,
+                "version": BUNDLE_VERSION,
+                "created_at": time.time(),
+                "records_n": len(records),
+                "index_offset": index_offset,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        bundle_file.seek(0)
+        bundle_file.write(header.ljust(_HEADER_SIZE - 1))
+
+    summary.bundled_n = len(records)
+    return summary
+
+
+class Bundle:
+    """
+    A bundle of test cases (see `build_bundle`), memory-mapped for random and streaming access.
+    """
+
+    def __init__(self, bundle_path: str):
+        """
+        Args:
+            bundle_path (str): The path of the bundle.
+
+        Raises:
+            ValueError: If the file is not a bundle of a supported version.
+        """
+        self.bundle_path = bundle_path
+        with open(bundle_path, "rb") as bundle_file:
+            self.__mmap = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self.header = json.loads(self.__mmap[:_HEADER_SIZE])
+        except ValueError:
+            self.header = None
+        if (
+            not isinstance(self.header, dict)
+            or self.header.get("format") != BUNDLE_FORMAT
+            or self.header.get("version") != BUNDLE_VERSION
+        ):
+            raise ValueError(
+                f"[yellow]`{bundle_path}`[/yellow] is not a turbocase bundle (version {BUNDLE_VERSION}). "
+                "Use [yellow]`turbocase bundle`[/yellow] to rebuild it."
+            )
+        self.index: Dict[str, Dict[str, List[int]]] = json.loads(
+            self.__mmap[self.header["index_offset"] :]
+        )
+
+    def __len__(self) -> int:
+        return self.header["records_n"]
+
+    def __read_record(self, offset: int, length: int) -> Dict[str, Any]:
+        return json.loads(self.__mmap[offset : offset + length])
+
+    def list_test_titles(self, app: App) -> List[str]:
+        """
+        List the titles of the test cases of an app in the bundle (excluding its sub-apps).
+
+        Args:
+            app (App): The app.
+
+        Returns:
+            List[str]: The titles of the test cases, sorted.
+        """
+        return sorted(self.index.get(app.value.name, {}))
+
+    def get_record(self, test_title: str, app: App) -> Dict[str, Any]:
+        """
+        Read the record of a test case.
+
+        Args:
+            test_title (str): The title of the test case.
+            app (App): The app of the test case.
+
+        Returns:
+            Dict[str, Any]: The record of the test case (`app`, `title`, `path`, `hash` and `content`).
+
+        Raises:
+            KeyError: If the test case is not in the bundle.
+        """
+        location = self.index.get(app.value.name, {}).get(test_title)
+        if location is None:
+            raise KeyError(
+                f"Test case [yellow]`{test_title}`[/yellow] of the `{app.value.name}` app is not in the bundle"
+            )
+        return self.__read_record(*location)
+
+    def load_test_case(self, test_title: str, app: App) -> Dict[str, Any]:
+        """
+        Read the content of a test case, as validated when the bundle was built.
+
+        Args:
+            test_title (str): The title of the test case.
+            app (App): The app of the test case.
+
+        Returns:
+            Dict[str, Any]: The content of the test case.
+
+        Raises:
+            KeyError: If the test case is not in the bundle.
+        """
+        return self.get_record(test_title, app)["content"]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Stream the records of the bundle, in order."""
+        offset = _HEADER_SIZE
+        index_offset = self.header["index_offset"]
+        while offset < index_offset:
+            end = self.__mmap.find(b"\n", offset, index_offset) + 1
+            yield json.loads(self.__mmap[offset:end])
+            offset = end
+
+    def close(self) -> None:
+        """Release the memory map of the bundle."""
+        self.__mmap.close()
@@ -0,0 +1,328 @@
+"""
+A background process that serves `turbocase` commands over a Unix domain socket.
+
+The daemon keeps the project configuration, the compiled schema validator, the test files
+index and the HTTP connections warm between commands. This module only imports the
+standard library at the top level, so that forwarding a command to a running daemon does
+not pay the import cost of the CLI itself.
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+
+SOCKET_FILE_NAME = "daemon.sock"
+LOG_FILE_NAME = "daemon.log"
+
+# Commands that always run in-process: they are interactive or manage the daemon itself
+LOCAL_COMMANDS = ("config", "daemon", "init")
+
+START_TIMEOUT = 10  # seconds
+
+
+def find_turbocase_folder_path(current_dir: str | None = None) -> str | None:
+    """
+    Find the `.turbocase` folder of the project containing a directory.
+
+    This mirrors `utility.get_turbocase_folder_path` without importing the CLI dependencies.
+
+    Args:
+        current_dir (str | None): The directory to start from. Default: the current directory.
+
+    Returns:
+        str | None: The path to the `.turbocase` folder, or None if not in a project.
+    """
+    current_dir = os.path.abspath(current_dir or os.getcwd())
+    while True:
+        turbocase_folder_path = os.path.join(current_dir, ".turbocase")
+        if os.path.isdir(turbocase_folder_path):
+            return turbocase_folder_path
+        if os.path.ismount(current_dir) or current_dir == "/":
+            return None
+        current_dir = os.path.dirname(current_dir)
+
+
+def _send_message(stream: Any, message: Dict[str, Any]) -> None:
+    stream.write(json.dumps(message).encode("utf-8") + b"\n")
+    stream.flush()
+
+
+def _request(turbocase_folder_path: str, message: Dict[str, Any]) -> Any:
+    """
+    Open a connection to the daemon of a project and send it a message.
+
+    Args:
+        turbocase_folder_path (str): The path to the `.turbocase` folder of the project.
+        message (Dict[str, Any]): The message to send.
+
+    Returns:
+        The file object of the connection, to read the replies from.
+
+    Raises:
+        OSError: If no daemon is listening on the socket of the project.
+    """
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        connection.connect(os.path.join(turbocase_folder_path, SOCKET_FILE_NAME))
+    except OSError:
+        connection.close()
+        raise
+    stream = connection.makefile("rwb")
+    connection.close()  # the file object keeps the connection open
+    _send_message(stream, message)
+    return stream
+
+
+def run_in_daemon(argv: List[str]) -> int | None:
+    """
+    Run a command in the daemon of the current project, if one is running.
+
+    Args:
+        argv (List[str]): The command line arguments (without the program name).
+
+    Returns:
+        int | None: The exit code of the command, or None if it must run in-process.
+    """
+    if not argv or argv[0].startswith("-") or argv[0] in LOCAL_COMMANDS:
+        return None
+
+    turbocase_folder_path = find_turbocase_folder_path()
+    if turbocase_folder_path is None:
+        return None
+
+    try:
+        width = os.get_terminal_size(sys.stdout.fileno()).columns
+    except (OSError, ValueError):
+        width = None
+
+    try:
+        stream = _request(
+            turbocase_folder_path,
+            {
+                "action": "run",
+                "argv": argv,
+                "cwd": os.getcwd(),
+                "is_terminal": sys.stdout.isatty(),
+                "width": width,
+            },
+        )
+    except OSError:
+        return None  # no daemon, or a stale socket left by a killed daemon
+
+    with stream:
+        for line in stream:
+            message = json.loads(line)
+            if "output" in message:
+                sys.stdout.write(message["output"])
+                sys.stdout.flush()
+            elif "exit" in message:
+                return message["exit"]
+
+    return 1  # the daemon died while running the command
+
+
+def get_daemon_status(turbocase_folder_path: str) -> Dict[str, Any] | None:
+    """
+    Get the status of the daemon of a project.
+
+    Args:
+        turbocase_folder_path (str): The path to the `.turbocase` folder of the project.
+
+    Returns:
+        Dict[str, Any] | None: The PID and number of served commands of the daemon,
+            or None if no daemon is running.
+    """
+    try:
+        with _request(turbocase_folder_path, {"action": "status"}) as stream:
+            return json.loads(stream.readline())
+    except (OSError, ValueError):
+        return None
+
+
+def start_daemon(turbocase_folder_path: str) -> int:
+    """
+    Start the daemon of a project in the background, unless it is already running.
+
+    Args:
+        turbocase_folder_path (str): The path to the `.turbocase` folder of the project.
+
+    Returns:
+        int: The PID of the daemon.
+
+    Raises:
+        TimeoutError: If the daemon does not start listening in time.
+    """
+    status = get_daemon_status(turbocase_folder_path)
+    if status is not None:
+        return status["pid"]
+
+    with open(os.path.join(turbocase_folder_path, LOG_FILE_NAME), "a") as log_file:
+        subprocess.Popen(
+            [sys.executable, "-m", "turbocase.daemon", turbocase_folder_path],
+            stdin=subprocess.DEVNULL,
+            stdout=log_file,
+            stderr=log_file,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        status = get_daemon_status(turbocase_folder_path)
+        if status is not None:
+            return status["pid"]
+        time.sleep(0.05)
+
+    raise TimeoutError(
+        f"The daemon did not start. See [yellow]`{os.path.join(turbocase_folder_path, LOG_FILE_NAME)}`[/yellow]."
+    )
+
+
+def stop_daemon(turbocase_folder_path: str) -> bool:
+    """
+    Stop the daemon of a project.
+
+    Args:
+        turbocase_folder_path (str): The path to the `.turbocase` folder of the project.
+
+    Returns:
+        bool: True if a daemon was stopped, False if none was running.
+    """
+    try:
+        with _request(turbocase_folder_path, {"action": "stop"}) as stream:
+            stream.readline()
+    except OSError:
+        return False
+    return True
+
+
+class _OutputWriter(io.TextIOBase):
+    """A text stream that forwards everything written to it to a daemon client."""
+
+    def __init__(self, stream: Any):
+        self.__stream = stream
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        if text:
+            _send_message(self.__stream, {"output": text})
+        return len(text)
+
+
+def _run_command(request: Dict[str, Any], stream: Any, parser: Any) -> int:
+    """
+    Run a CLI command in the daemon process, streaming its output to the client.
+
+    Args:
+        request (Dict[str, Any]): The request sent by the client.
+        stream: The file object of the client connection.
+        parser (argparse.ArgumentParser): The main argument parser object.
+
+    Returns:
+        int: The exit code of the command.
+    """
+    from rich.console import Console
+    from turbocase.main import parse_args
+
+    writer = _OutputWriter(stream)
+    console = Console(
+        file=writer,
+        force_terminal=request["is_terminal"],
+        width=request["width"],
+    )
+
+    try:
+        os.chdir(request["cwd"])
+        with contextlib.redirect_stdout(writer), contextlib.redirect_stderr(writer):
+            parse_args(parser, request["argv"], console=console)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        writer.write(f"{e.code}\n")
+        return 1
+    except Exception as e:
+        writer.write(f"Unexpected error in the daemon: {e!r}\n")
+        return 1
+    return 0
+
+
+def serve(turbocase_folder_path: str) -> None:
+    """
+    Serve CLI commands of a project over its Unix domain socket until asked to stop.
+
+    Commands are served one at a time, since they change the working directory of the process.
+
+    Args:
+        turbocase_folder_path (str): The path to the `.turbocase` folder of the project.
+    """
+    from turbocase.main import build_parser
+    from turbocase.utility import get_test_files_index, load_configuration_file
+    from turbocase.Testiny import Testiny
+
+    project_path = os.path.dirname(os.path.abspath(turbocase_folder_path))
+    socket_path = os.path.join(turbocase_folder_path, SOCKET_FILE_NAME)
+
+    parser = build_parser()
+    get_test_files_index(project_path)
+    config_file_path = os.path.join(turbocase_folder_path, "project.toml")
+    if os.path.exists(config_file_path):
+        load_configuration_file(config_file_path)
+    Testiny.warm_up()
+
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(socket_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    os.chmod(socket_path, 0o600)
+    server.listen()
+
+    served = 0
+    try:
+        while True:
+            connection, _ = server.accept()
+            with connection, connection.makefile("rwb") as stream:
+                try:
+                    request = json.loads(stream.readline())
+                    if request["action"] == "status":
+                        _send_message(stream, {"pid": os.getpid(), "served": served})
+                    elif request["action"] == "stop":
+                        _send_message(stream, {"stopped": True})
+                        break
+                    elif request["action"] == "run":
+                        exit_code = _run_command(request, stream, parser)
+                        served += 1
+                        _send_message(stream, {"exit": exit_code})
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"Dropped a request: {e!r}", file=sys.stderr, flush=True)
+    finally:
+        server.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(socket_path)
+
+
+def launch():
+    """
+    Entry point of the `turbocase` executable.
+
+    Forwards the command to the daemon of the current project when one is running,
+    and runs it in-process otherwise.
+    """
+    exit_code = run_in_daemon(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from turbocase.main import main
+
+    main()
+
+
+if __name__ == "__main__":
+    serve(sys.argv[1])
@@ -10,10 +10,27 @@ class UpsertAction(Enum):
     Possible values:
     - UPDATE: Indicates that the existing item was updated.
     - CREATE: Indicates that a new item was created.
+    - KEEP_REMOTE: Indicates that the existing item was kept as is, its update conflicting with remote changes.
     """
 
     UPDATE = auto()
     CREATE = auto()
+    KEEP_REMOTE = auto()
+
+
+class ConflictPolicy(Enum):
+    """
+    Enum representing how to resolve an update rejected because the remote test case changed since it was read.
+
+    Possible values:
+    - LOCAL_WINS: Re-apply the local test case over the latest remote one.
+    - REMOTE_WINS: Keep the remote test case, dropping the local changes.
+    - ABORT: Fail the update.
+    """
+
+    LOCAL_WINS = "local-wins"
+    REMOTE_WINS = "remote-wins"
+    ABORT = "abort"
 
 
 class Color(Enum):
@@ -65,3 +82,16 @@ class App(Enum):
     MOBILE = AppType("mobile", "app/mobile", [Project.ANDROID, Project.IOS])
     WEB = AppType("web", "app/web", [Project.WEB])
     APP = AppType("app", "app", [Project.IOS, Project.ANDROID, Project.WEB])
+
+
+class ResultStatus(Enum):
+    """
+    Enum representing the result of a test case in a test run.
+
+    The values are the result statuses of Testiny.
+    """
+
+    PASSED = "PASSED"
+    FAILED = "FAILED"
+    BLOCKED = "BLOCKED"
+    SKIPPED = "SKIPPED"
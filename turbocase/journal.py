@@ -0,0 +1,192 @@
+import fcntl
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List
+
+JOURNAL_FILE_NAME = "journal.jsonl"
+JOURNAL_LOCK_FILE_NAME = "journal.lock"
+
+
+@dataclass
+class JournalEntry:
+    """
+    Represents an outstanding upsert of a test case, coalesced over all its pending journal records.
+
+    Attributes:
+        app_name (str): The name of the app of the test case.
+        test_title (str): The title of the test case.
+        test_case_content (Dict[str, Any]): The latest recorded content of the test case.
+        records_ids (List[str]): The IDs of the pending records this entry replaces.
+    """
+
+    app_name: str
+    test_title: str
+    test_case_content: Dict[str, Any]
+    records_ids: List[str] = field(default_factory=list)
+
+
+class Journal:
+    """
+    An append-only journal of the upserts of a project, stored in `.turbocase/journal.jsonl`.
+
+    An upsert is recorded as pending before it is sent, and marked as done once it succeeds.
+    Upserts that never completed (e.g. because the network dropped, or because they were
+    queued with `upsert --queue`) can be replayed with `turbocase flush`.
+    """
+
+    def __init__(self, project_path: str):
+        self.journal_file_path = os.path.join(
+            project_path, ".turbocase", JOURNAL_FILE_NAME
+        )
+        self.lock_file_path = os.path.join(
+            project_path, ".turbocase", JOURNAL_LOCK_FILE_NAME
+        )
+
+    @contextmanager
+    def __locked(self) -> Iterator[None]:
+        """
+        Hold an exclusive lock on the journal across processes.
+
+        The lock is taken on a separate file, since `compact` replaces the journal file: a process
+        waiting for a lock on the journal itself would then append to the replaced file.
+        """
+        with open(self.lock_file_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def __append(self, records: List[Dict[str, Any]]) -> None:
+        with self.__locked():
+            with open(self.journal_file_path, "a", encoding="utf-8") as journal_file:
+                for record in records:
+                    journal_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+
+    def add_pending(
+        self, app_name: str, test_title: str, test_case_content: Dict[str, Any]
+    ) -> str:
+        """
+        Record an upsert as pending, durably, before it is sent.
+
+        Args:
+            app_name (str): The name of the app of the test case.
+            test_title (str): The title of the test case.
+            test_case_content (Dict[str, Any]): The content of the test case to send.
+
+        Returns:
+            str: The ID of the record, to mark it as done later.
+        """
+        record_id = uuid.uuid4().hex
+        self.__append(
+            [
+                {
+                    "type": "pending",
+                    "id": record_id,
+                    "time": time.time(),
+                    "app": app_name,
+                    "title": test_title,
+                    "content": test_case_content,
+                }
+            ]
+        )
+        return record_id
+
+    def mark_done(self, records_ids: List[str]) -> None:
+        """
+        Mark pending records as done.
+
+        Args:
+            records_ids (List[str]): The IDs of the records.
+        """
+        if records_ids:
+            self.__append([{"type": "done", "ids": records_ids}])
+
+    def get_outstanding(self) -> List[JournalEntry]:
+        """
+        Get the outstanding upserts, coalescing the pending records of the same test case into one.
+
+        A done record also completes the pending records of the same test case recorded before the one
+        it marks, since their content was superseded by the one sent.
+
+        Returns:
+            List[JournalEntry]: The outstanding upserts with their latest content, oldest first.
+        """
+        if not os.path.exists(self.journal_file_path):
+            return []
+
+        # the pending records of each test case, in the order they were recorded
+        pending_records: Dict[tuple, Dict[str, Dict[str, Any]]] = {}
+        records_keys: Dict[str, tuple] = {}
+        with open(self.journal_file_path, "r", encoding="utf-8") as journal_file:
+            for line in journal_file:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # a record torn by a crash while appending
+                if record["type"] == "pending":
+                    key = (record["app"], record["title"])
+                    # re-inserted, so test cases are ordered by latest record
+                    test_case_records = pending_records.pop(key, {})
+                    test_case_records[record["id"]] = record
+                    pending_records[key] = test_case_records
+                    records_keys[record["id"]] = key
+                elif record["type"] == "done":
+                    done_ids = set(record["ids"])
+                    for key in {
+                        records_keys.pop(record_id)
+                        for record_id in done_ids
+                        if record_id in records_keys
+                    }:
+                        test_case_records = pending_records[key]
+                        records_ids = list(test_case_records)
+                        last_done_index = max(
+                            index
+                            for index, record_id in enumerate(records_ids)
+                            if record_id in done_ids
+                        )
+                        for record_id in records_ids[: last_done_index + 1]:
+                            del test_case_records[record_id]
+                            records_keys.pop(record_id, None)
+                        if not test_case_records:
+                            del pending_records[key]
+
+        return [
+            JournalEntry(
+                app_name,
+                test_title,
+                list(test_case_records.values())[-1]["content"],
+                list(test_case_records),
+            )
+            for (app_name, test_title), test_case_records in pending_records.items()
+        ]
+
+    def compact(self) -> None:
+        """Rewrite the journal with only its outstanding records, dropping the completed ones."""
+        with self.__locked():
+            outstanding_records = [
+                {
+                    "type": "pending",
+                    "id": entry.records_ids[-1],
+                    "time": time.time(),
+                    "app": entry.app_name,
+                    "title": entry.test_title,
+                    "content": entry.test_case_content,
+                }
+                for entry in self.get_outstanding()
+            ]
+            temporary_file_path = f"{self.journal_file_path}.tmp"
+            with open(temporary_file_path, "w", encoding="utf-8") as temporary_file:
+                for record in outstanding_records:
+                    temporary_file.write(
+                        json.dumps(record, separators=(",", ":")) + "\n"
+                    )
+                temporary_file.flush()
+                os.fsync(temporary_file.fileno())
+            os.replace(temporary_file_path, self.journal_file_path)
@@ -0,0 +1,241 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Set, Tuple
+from xml.etree import ElementTree
+from turbocase.enums import App, Project, ResultStatus
+from turbocase.utility import get_project_id_from_config_file
+from turbocase.Testiny import Testiny
+
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_CONCURRENCY = 4
+
+# The maximum number of titles matching no remote test case listed after an upload
+MAX_LISTED_UNMATCHED_TITLES = 10
+
+# When a test case is reported more than once, the most severe result is kept
+_STATUS_SEVERITY = {
+    ResultStatus.PASSED: 0,
+    ResultStatus.SKIPPED: 1,
+    ResultStatus.BLOCKED: 2,
+    ResultStatus.FAILED: 3,
+}
+
+
+def iter_junit_results(file_path: str) -> Iterator[Tuple[str, ResultStatus]]:
+    """
+    Stream the results of the test cases of a JUnit XML report.
+
+    Elements are discarded as soon as they are parsed, so memory stays constant regardless of the report size.
+
+    Args:
+        file_path (str): The path to the JUnit XML report.
+
+    Yields:
+        Tuple[str, ResultStatus]: The name and result of each test case.
+    """
+    parents: List[ElementTree.Element] = []
+    for event, element in ElementTree.iterparse(file_path, events=("start", "end")):
+        if event == "start":
+            parents.append(element)
+            continue
+
+        parents.pop()
+        if element.tag != "testcase":
+            continue
+
+        children_tags = {child.tag for child in element}
+        if children_tags & {"failure", "error"}:
+            status = ResultStatus.FAILED
+        elif "skipped" in children_tags:
+            status = ResultStatus.SKIPPED
+        else:
+            status = ResultStatus.PASSED
+
+        yield element.get("name", ""), status
+
+        if parents:
+            parents[-1].remove(element)
+
+
+def iter_batches(
+    results: Iterator[Tuple[str, ResultStatus]],
+    batch_size: int,
+    late_results: Dict[str, ResultStatus],
+) -> Iterator[Dict[str, ResultStatus]]:
+    """
+    Group results into batches of distinct titles, keeping the most severe result of repeated titles.
+
+    Each title is yielded in a single batch. A title repeated after its batch was yielded is put into
+    `late_results` instead, if its result is more severe than the yielded one, to be uploaded over it.
+
+    Args:
+        results (Iterator[Tuple[str, ResultStatus]]): The results.
+        batch_size (int): The maximum number of titles per batch.
+        late_results (Dict[str, ResultStatus]): Filled with the more severe results of the titles
+            repeated after their batch.
+
+    Yields:
+        Dict[str, ResultStatus]: The result of each title of a batch.
+    """
+    yielded_results: Dict[str, ResultStatus] = {}
+    batch: Dict[str, ResultStatus] = {}
+    for title, status in results:
+        if title in yielded_results:
+            previous_status = late_results.get(title, yielded_results[title])
+            if _STATUS_SEVERITY[status] > _STATUS_SEVERITY[previous_status]:
+                late_results[title] = status
+            continue
+
+        previous_status = batch.get(title)
+        if (
+            previous_status is None
+            or _STATUS_SEVERITY[status] > _STATUS_SEVERITY[previous_status]
+        ):
+            batch[title] = status
+        if len(batch) >= batch_size:
+            yielded_results.update(batch)
+            yield batch
+            batch = {}
+    if batch:
+        yield batch
+
+
+@dataclass
+class UploadSummary:
+    """
+    Represents the outcome of uploading test results.
+
+    Attributes:
+        test_runs_ids (Dict[Project, int]): The ID of the test run created in each project.
+        results_n (int): The number of distinct test cases in the report.
+        uploaded_n (int): The number of results uploaded, over all projects.
+        unmatched_titles (List[str]): The titles that match no remote test case in any project.
+    """
+
+    test_runs_ids: Dict[Project, int] = field(default_factory=dict)
+    results_n: int = 0
+    uploaded_n: int = 0
+    unmatched_titles: List[str] = field(default_factory=list)
+
+
+def _upload_batch(
+    batch: Dict[str, ResultStatus],
+    test_runs: List[Tuple[int, int]],
+    project_path: str,
+) -> Tuple[int, Set[str]]:
+    """
+    Upload a batch of results to the test runs of the projects.
+
+    Args:
+        batch (Dict[str, ResultStatus]): The result of each title of the batch.
+        test_runs (List[Tuple[int, int]]): The project ID and test run ID of each project.
+        project_path (str): The path to the project folder.
+
+    Returns:
+        Tuple[int, Set[str]]: The number of uploaded results, and the titles matched in at least one project.
+    """
+    titles = list(batch)
+    uploaded_n = 0
+    matched_titles: Set[str] = set()
+    for project_id, test_run_id in test_runs:
+        test_cases_ids = Testiny.find_test_cases_ids_by_titles(
+            titles, project_id, project_path
+        )
+        results = [
+            (test_case_id, batch[title])
+            for title, test_case_id in test_cases_ids.items()
+        ]
+        if results:
+            Testiny.add_test_run_results(test_run_id, results, project_path)
+        uploaded_n += len(results)
+        matched_titles.update(test_cases_ids)
+    return uploaded_n, matched_titles
+
+
+def upload_junit_results(
+    file_path: str,
+    app: App,
+    project_path: str,
+    test_run_title: str,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    on_progress: Callable[[UploadSummary], None] | None = None,
+) -> UploadSummary:
+    """
+    Upload the results of a JUnit XML report to new test runs, one in each project of an app.
+
+    Test cases are matched to remote test cases by their exact title, as in `upsert`. Results are
+    uploaded in batches (one lookup and one bulk request per batch and project), with at most
+    `concurrency` batches in flight. A test case reported again after its batch was uploaded gets its
+    most severe result: it is uploaded again once all batches are, if more severe.
+
+    Args:
+        file_path (str): The path to the JUnit XML report.
+        app (App): The app whose projects receive the results.
+        project_path (str): The path to the project folder.
+        test_run_title (str): The title of the created test runs.
+        batch_size (int): The number of results per batch. Default: 500.
+        concurrency (int): The maximum number of batches uploaded at once. Default: 4.
+        on_progress (Callable[[UploadSummary], None] | None): Called after each uploaded batch.
+
+    Returns:
+        UploadSummary: The outcome of the upload.
+    """
+    summary = UploadSummary()
+    for project in app.value.projects:
+        project_id = get_project_id_from_config_file(project, project_path)
+        summary.test_runs_ids[project] = Testiny.create_test_run(
+            test_run_title, project_id, project_path
+        )
+    test_runs = [
+        (get_project_id_from_config_file(project, project_path), test_run_id)
+        for project, test_run_id in summary.test_runs_ids.items()
+    ]
+
+    def collect(future: Future, batch: Dict[str, ResultStatus]) -> None:
+        uploaded_n, matched_titles = future.result()
+        summary.results_n += len(batch)
+        summary.uploaded_n += uploaded_n
+        summary.unmatched_titles.extend(
+            title for title in batch if title not in matched_titles
+        )
+        if on_progress is not None:
+            on_progress(summary)
+
+    late_results: Dict[str, ResultStatus] = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        in_flight: Dict[Future, Dict[str, ResultStatus]] = {}
+        for batch in iter_batches(
+            iter_junit_results(file_path), batch_size, late_results
+        ):
+            if len(in_flight) >= concurrency:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    collect(future, in_flight.pop(future))
+            in_flight[
+                executor.submit(_upload_batch, batch, test_runs, project_path)
+            ] = batch
+
+        for future in list(in_flight):
+            collect(future, in_flight.pop(future))
+
+        # the earlier results of these titles are uploaded, so they can no longer overwrite them.
+        # These replace results already counted in the summary
+        late_titles = list(late_results)
+        late_futures = [
+            executor.submit(
+                _upload_batch,
+                {title: late_results[title] for title in titles},
+                test_runs,
+                project_path,
+            )
+            for titles in (
+                late_titles[batch_start : batch_start + batch_size]
+                for batch_start in range(0, len(late_titles), batch_size)
+            )
+        ]
+        for future in late_futures:
+            future.result()
+
+    return summary
@@ -1,25 +1,95 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import sys
+import time
+from typing import Dict, List, Tuple
 from rich_argparse import RichHelpFormatter, HelpPreviewAction
 import toml
 import os
 from rich.console import Console
-from turbocase.enums import App, Project
+from turbocase.enums import App, Color, ConflictPolicy, Project, UpsertAction
 from turbocase.utility import (
     HINT_PREFIX,
     FAILURE_PREFIX,
     SUCCESS_PREFIX,
     NotTurboCaseProject,
-    file_exists_in_project,
+    WARNING_PREFIX,
+    get_documents_titles,
+    get_test_case_path,
+    get_test_files_index,
+    load_generate_manifest,
+    get_project_id_from_config_file,
     get_turbocase_folder_path,
     print_banner,
     print_error_hints,
+    print_similar_titles_warning,
     get_result_color,
+    parse_project_name,
+    parse_positive_int,
+    parse_shard,
+    select_test_cases,
+    write_configuration_file,
+)
+from turbocase.journal import Journal, JournalEntry
+from turbocase.junit import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CONCURRENCY,
+    MAX_LISTED_UNMATCHED_TITLES,
+    upload_junit_results,
+)
+from turbocase.output import OUTPUT_FORMATS, get_result_writer
+from turbocase.reports import (
+    add_result,
+    count_successes,
+    create_report,
+    create_result,
+    load_report,
+    merge_reports,
+    write_report,
 )
 from turbocase.__init__ import __version__
+from turbocase.backends import (
+    BACKENDS,
+    DEFAULT_BACKEND,
+    LOCAL_BACKEND_FILE_NAME,
+    get_local_backend,
+)
+from turbocase.bundle import DEFAULT_BUNDLE_PATH, Bundle, build_bundle
+from turbocase.search_index import (
+    SEARCH_FIELDS_ALIASES,
+    SearchIndex,
+    get_search_index,
+)
+from turbocase.profiling import (
+    PROFILES,
+    CpuProfiler,
+    MemoryProfiler,
+    get_default_profile_path,
+    parse_interval,
+)
+from turbocase.rate_budget import parse_rate_limit
+from turbocase.prune import (
+    DEFAULT_MAX_DELETIONS,
+    DEFAULT_PRUNE_CONCURRENCY,
+    TooManyDeletionsError,
+    find_orphans,
+    prune_orphans,
+)
+from turbocase.sync import pull_test_cases
 from turbocase.Testiny import Testiny
+from turbocase.title_index import (
+    DEFAULT_SIMILARITY_THRESHOLD,
+    TitleEntry,
+    TitleIndex,
+    get_local_title_index,
+)
+from turbocase import daemon
 
 HELP_MESSAGE = "Show help"
 
+DEFAULT_SEARCH_LIMIT = 20
+
 # changing style of `back tick quoted text` in help messages
 RichHelpFormatter.styles["argparse.syntax"] = "bold yellow"
 
@@ -80,6 +150,29 @@ def add_global_options(parser: argparse.ArgumentParser):
         help="Show program's version",
     )
 
+    parser.add_argument(
+        "--profile",
+        choices=PROFILES,
+        help="Profile the command: `cpu` time per function (cProfile), or `mem` allocations per source line "
+        "(tracemalloc).",
+        metavar="<profile>",
+    )
+
+    parser.add_argument(
+        "--profile-output",
+        help="The file to write the profile to. Default: `turbocase-<command>-<time>.pstats` for `cpu`, "
+        "`.txt` for `mem`, in the current directory.",
+        metavar="<file_path>",
+    )
+
+    parser.add_argument(
+        "--profile-interval",
+        type=parse_interval,
+        help="With `--profile mem`, also sample the memory usage every this many seconds, and report the "
+        "top allocations of the largest sample instead of the end of the command.",
+        metavar="<seconds>",
+    )
+
 
 def add_read_command(subparsers: argparse._SubParsersAction):
     """
@@ -161,16 +254,71 @@ def add_upsert_command(subparsers: argparse._SubParsersAction):
         "-a",
         "--app",
         choices=[app.value.name for app in App],
-        help=f"The type of the app. Choose from: {', '.join([app.value.name for app in App])}. Default: app",
+        help=f"The type of the app. Choose from: {', '.join([app.value.name for app in App])}. "
+        "Default: app (all apps with `--all`)",
         metavar="<target_app>",
-        default="app",
     )
 
     upsert_parser.add_argument(
         "test_titles",
         help="The title of the test case",
         metavar="<test_title>",
-        nargs="+",
+        nargs="*",
+    )
+
+    upsert_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Upsert all test cases of the app instead of the given titles.",
+    )
+
+    upsert_parser.add_argument(
+        "-q",
+        "--queue",
+        action="store_true",
+        help="Only record the upserts in the project journal, to send them later with `turbocase flush`.",
+    )
+
+    upsert_parser.add_argument(
+        "--on-conflict",
+        choices=[policy.value for policy in ConflictPolicy],
+        help="How to resolve updates of test cases changed remotely since they were read: re-apply the local "
+        "test case (`local-wins`), keep the remote one (`remote-wins`) or fail (`abort`). Default: local-wins.",
+        metavar="<policy>",
+        default=ConflictPolicy.LOCAL_WINS.value,
+    )
+
+    upsert_parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        help="Only process the i-th of n disjoint slices of the test cases (e.g. `1/4`), to split runs across CI nodes.",
+        metavar="<i/n>",
+    )
+
+    upsert_parser.add_argument(
+        "--report",
+        help="Write a JSON result report to this path (see `turbocase merge-reports`).",
+        metavar="<report_path>",
+    )
+
+    upsert_parser.add_argument(
+        "--output",
+        choices=OUTPUT_FORMATS,
+        help="Stream one machine-readable record per test case to stdout instead of the formatted output. "
+        f"Choose from: {', '.join(OUTPUT_FORMATS)}.",
+        metavar="<format>",
+    )
+
+    upsert_parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Only print failures and the final summary.",
+    )
+
+    upsert_parser.add_argument(
+        "--bundle",
+        help="Read the test cases from this bundle (see `turbocase bundle`) instead of the YAML files.",
+        metavar="<bundle_path>",
     )
 
     upsert_parser.add_argument(
@@ -191,62 +339,222 @@ def handle_upsert_command(args: argparse.Namespace, *, console: Console):
     Returns:
         None
     """
+    bundle = open_bundle(args.bundle, console=console)
+    test_cases = get_selected_test_cases(args, console=console, bundle=bundle)
+    is_verbose = args.output is None and not args.quiet
+    title_index = get_local_title_index(args.project_path) if is_verbose else None
+    # results are only kept in memory when a report is requested
+    report = create_report("upsert", args.shard) if args.report is not None else None
+    journal = Journal(args.project_path)
+    writer = None
+    if args.output is not None:
+        writer = get_result_writer(args.output, sys.stdout, "upsert")
+        writer.start()
+
+    def record_result(app: App, test_title: str, start_time: float, **details):
+        details["duration"] = round(time.perf_counter() - start_time, 3)
+        if report is not None:
+            result = add_result(report, app.value.name, test_title, **details)
+        else:
+            result = create_result(app.value.name, test_title, **details)
+        if writer is not None:
+            writer.write(result)
+
+    conflict_policy = ConflictPolicy(args.on_conflict)
+    conflicts_ids: List[int] = []
     upserted_files_n = 0
-    for test_title in args.test_titles:
-        console.rule(f"[cyan]Test Case: [yellow]`{test_title}`[/yellow]")
+    kept_remote_n = 0
+    conflicts_n = 0
+    done_records_ids: List[str] = []
+    journaled_failures_n = 0
+    for app, test_title in test_cases:
+        start_time = time.perf_counter()
+        conflicts_ids.clear()
+        if is_verbose:
+            console.rule(f"[cyan]Test Case: [yellow]`{test_title}`[/yellow]")
+            print_similar_titles_warning(
+                test_title,
+                title_index.find_near_duplicates(test_title),
+                console=console,
+            )
+        record_id = None
         try:
-            upsert_operation, test_cases_ids = Testiny.upsert_test_case(
-                test_title, App[args.app.upper()], args.project_path
+            test_case_content = (
+                bundle.load_test_case(test_title, app)
+                if bundle is not None
+                else Testiny.load_test_case(test_title, app, args.project_path)
             )
-
-            formatted_ids = ", ".join(
-                [f"{id} ({project.name} project)" for id, project in test_cases_ids]
+            record_id = journal.add_pending(
+                app.value.name, test_title, test_case_content
             )
+            if args.queue:
+                if is_verbose:
+                    console.print(
+                        f"[green]{SUCCESS_PREFIX} Queued test case. "
+                        f"Use [yellow]`turbocase flush`[/yellow] to send it."
+                    )
+                    console.print()  # cosmetic
+                upserted_files_n += 1
+                record_result(app, test_title, start_time, operation="QUEUED")
+                continue
 
-            console.print(
-                f"[green]{SUCCESS_PREFIX} Successfully upserted test case "
-                f"with ID: [yellow]`{formatted_ids}`[/yellow]. Operation: [yellow]`{upsert_operation.name}`[/yellow]."
+            upsert_operation, test_cases_ids = Testiny.upsert_test_case(
+                test_title,
+                app,
+                args.project_path,
+                test_case_content,
+                conflict_policy=conflict_policy,
+                on_conflict=lambda _, test_case_id: conflicts_ids.append(test_case_id),
+            )
+            done_records_ids.append(record_id)
+
+            if is_verbose:
+                if conflicts_ids:
+                    console.print(
+                        f"[yellow]{WARNING_PREFIX} Test case changed remotely while updating it "
+                        f"(ID: [cyan]{', '.join(map(str, conflicts_ids))}[/cyan]). "
+                        f"Resolved with [yellow]`{conflict_policy.value}`[/yellow]."
+                    )
+                formatted_ids = ", ".join(
+                    [f"{id} ({project.name} project)" for id, project in test_cases_ids]
+                )
+                if upsert_operation == UpsertAction.KEEP_REMOTE:
+                    console.print(
+                        f"[yellow]{WARNING_PREFIX} Kept the remote test case "
+                        f"with ID: [yellow]`{formatted_ids}`[/yellow]. The local changes were discarded."
+                    )
+                else:
+                    console.print(
+                        f"[green]{SUCCESS_PREFIX} Successfully upserted test case "
+                        f"with ID: [yellow]`{formatted_ids}`[/yellow]. Operation: [yellow]`{upsert_operation.name}`[/yellow]."
+                    )
+            if upsert_operation == UpsertAction.KEEP_REMOTE:
+                kept_remote_n += 1
+            else:
+                upserted_files_n += 1
+            record_result(
+                app,
+                test_title,
+                start_time,
+                operation=upsert_operation.name,
+                ids={project.name: id for id, project in test_cases_ids},
+                conflicts=len(conflicts_ids),
             )
-            upserted_files_n += 1
         except Exception as e:
+            if record_id is not None:
+                journaled_failures_n += 1
+            if args.output is None:
+                console.print(
+                    f"[red]{FAILURE_PREFIX} Failed to upsert test case from file: "
+                    f"[yellow]`{test_title}[/yellow]. Reason:\n[dark_orange]{e}"
+                )
+                print_error_hints(e, console=console)
+            record_result(
+                app, test_title, start_time, error=e, conflicts=len(conflicts_ids)
+            )
+        conflicts_n += len(conflicts_ids)
+        if is_verbose:
+            console.print()  # cosmetic
+
+    # a pending record must be durable before its upsert is sent, but a lost `done` record only
+    # replays the upsert, so they are written once per run
+    journal.mark_done(done_records_ids)
+    journal.compact()
+
+    if writer is not None:
+        writer.finish()
+    else:
+        if len(test_cases) > 1 or args.quiet:
+            if is_verbose:
+                console.rule("[cyan]Results", characters="═")
+            color = get_result_color(upserted_files_n, len(test_cases))
             console.print(
-                f"[red]{FAILURE_PREFIX} Failed to upsert test case from file: "
-                f"[yellow]`{test_title}[/yellow]. Reason:\n[dark_orange]{e}"
+                f"[{color.value}]{'Queued' if args.queue else 'Upserted'} "
+                f"[cyan]{upserted_files_n}/{len(test_cases)}[/cyan] test cases."
             )
-            print_error_hints(e, console=console)
-        console.print()  # cosmetic
-    if len(args.test_titles) > 1:
-        console.rule("[cyan]Results", characters="═")
-        color = get_result_color(upserted_files_n, len(args.test_titles))
+            print_conflicts_summary(
+                conflicts_n,
+                conflict_policy,
+                kept_remote_n=kept_remote_n,
+                console=console,
+            )
+        if journaled_failures_n and not args.queue:
+            console.print(
+                f"{HINT_PREFIX} Failed upserts are kept in the project journal. "
+                "Use [yellow]`turbocase flush`[/yellow] to retry them."
+            )
+    if report is not None:
+        write_report(args.report, report)
+
+
+def print_conflicts_summary(
+    conflicts_n: int,
+    conflict_policy: ConflictPolicy,
+    *,
+    kept_remote_n: int = 0,
+    console: Console,
+) -> None:
+    """
+    Print how many updates conflicted with remote changes, if any.
+
+    Args:
+        conflicts_n (int): The number of conflicts.
+        conflict_policy (ConflictPolicy): The policy the conflicts were resolved with.
+        kept_remote_n (int): The number of test cases whose remote version was kept (`REMOTE_WINS`).
+        console (Console): The rich console object.
+    """
+    if not conflicts_n:
+        return
+    resolution = (
+        "aborting them"
+        if conflict_policy == ConflictPolicy.ABORT
+        else f"resolved with [yellow]`{conflict_policy.value}`[/yellow]"
+    )
+    console.print(
+        f"[yellow]{WARNING_PREFIX} [cyan]{conflicts_n}[/cyan] update(s) conflicted with remote changes, "
+        f"{resolution}."
+    )
+    if kept_remote_n:
         console.print(
-            f"[{color.value}]Upserted [cyan]{upserted_files_n}/{len(args.test_titles)}[/cyan] test cases."
+            f"[yellow]{WARNING_PREFIX} Kept the remote version of [cyan]{kept_remote_n}[/cyan] test case(s), "
+            "discarding their local changes."
         )
 
 
-def add_init_command(subparsers: argparse._SubParsersAction):
+def add_flush_command(subparsers: argparse._SubParsersAction):
     """
-    Add the 'init' command to the subparsers.
+    Add the 'flush' command to the subparsers.
 
     Args:
         subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
     """
-    init_parser = subparsers.add_parser(
-        "init",
-        help="Create an empty test management project repository.",
-        description="Create an empty test management project repository.",
+    flush_parser = subparsers.add_parser(
+        "flush",
+        help="Send the queued and failed upserts recorded in the project journal",
+        description="Send the queued and failed upserts recorded in the project journal, in bulk. "
+        "Multiple pending edits of the same test case are sent as one.",
         add_help=False,
         formatter_class=RichHelpFormatter,
     )
 
-    init_parser.add_argument(
-        "directory",
-        help="Path of the project. Default: current directory.",
-        metavar="<director>",
-        nargs="?",
+    flush_parser.add_argument(
+        "-p",
+        "--project-path",
+        help="Path of the project. Default: current directory",
+        metavar="<project_path>",
         default=".",
     )
 
-    init_parser.add_argument(
+    flush_parser.add_argument(
+        "--on-conflict",
+        choices=[policy.value for policy in ConflictPolicy],
+        help="How to resolve updates of test cases changed remotely since they were read: re-apply the local "
+        "test case (`local-wins`), keep the remote one (`remote-wins`) or fail (`abort`). Default: local-wins.",
+        metavar="<policy>",
+        default=ConflictPolicy.LOCAL_WINS.value,
+    )
+
+    flush_parser.add_argument(
         "-h",
         "--help",
         action="help",
@@ -254,9 +562,9 @@ def add_init_command(subparsers: argparse._SubParsersAction):
     )
 
 
-def handle_init_command(args: argparse.Namespace, *, console: Console):
+def handle_flush_command(args: argparse.Namespace, *, console: Console):
     """
-    Handles the 'int' command by creating folders and files for the project.
+    Handles the 'flush' command by replaying the outstanding upserts of the project journal.
 
     Args:
         args (argparse.Namespace): The parsed command-line arguments.
@@ -265,63 +573,196 @@ def handle_init_command(args: argparse.Namespace, *, console: Console):
     Returns:
         None
     """
+    journal = Journal(args.project_path)
+    entries = journal.get_outstanding()
+    if not entries:
+        journal.compact()  # drops the completed records
+        console.print(f"[green]{SUCCESS_PREFIX} Nothing to flush.")
+        return
+
+    entries_by_app: Dict[str, List[JournalEntry]] = {}
+    for entry in entries:
+        entries_by_app.setdefault(entry.app_name, []).append(entry)
+
+    conflict_policy = ConflictPolicy(args.on_conflict)
+    conflicts: List[Tuple[str, int]] = []
+    flushed_entries_n = 0
+    kept_remote_n = 0
+    for app_name, app_entries in entries_by_app.items():
+        try:
+            results = Testiny.upsert_test_cases_in_bulk(
+                [(entry.test_title, entry.test_case_content) for entry in app_entries],
+                App[app_name.upper()],
+                args.project_path,
+                conflict_policy=conflict_policy,
+                on_conflict=lambda test_title, test_case_id: conflicts.append(
+                    (test_title, test_case_id)
+                ),
+            )
+        except Exception as e:
+            console.print(
+                f"[red]{FAILURE_PREFIX} Failed to flush [cyan]{len(app_entries)}[/cyan] test case(s) "
+                f"of the [yellow]`{app_name}`[/yellow] app. Reason:\n[dark_orange]{e}"
+            )
+            print_error_hints(e, console=console)
+            continue
+
+        journal.mark_done(
+            [record_id for entry in app_entries for record_id in entry.records_ids]
+        )
+        flushed_entries_n += len(app_entries)
+        for test_title, (upsert_operation, test_cases_ids) in results.items():
+            if upsert_operation == UpsertAction.KEEP_REMOTE:
+                kept_remote_n += 1
+            formatted_ids = ", ".join(
+                [f"{id} ({project.name} project)" for id, project in test_cases_ids]
+            )
+            console.print(
+                f"[green]{SUCCESS_PREFIX} [yellow]`{test_title}`[/yellow]: "
+                f"[yellow]`{formatted_ids}`[/yellow]. Operation: [yellow]`{upsert_operation.name}`[/yellow]."
+            )
+
+    journal.compact()
+
+    console.rule("[cyan]Results", characters="═")
+    color = get_result_color(flushed_entries_n, len(entries))
+    console.print(
+        f"[{color.value}]Flushed [cyan]{flushed_entries_n}/{len(entries)}[/cyan] test cases."
+    )
+    print_conflicts_summary(
+        len(conflicts), conflict_policy, kept_remote_n=kept_remote_n, console=console
+    )
+
+
+def open_bundle(bundle_path: str | None, *, console: Console) -> Bundle | None:
+    """
+    Open the bundle given with the `--bundle` argument of a command, exiting if it cannot be read.
+
+    Args:
+        bundle_path (str | None): The path of the bundle, if any.
+        console (Console): The rich console object.
 
+    Returns:
+        Bundle | None: The bundle, or `None` if no path is given.
+    """
+    if bundle_path is None:
+        return None
     try:
-        os.chdir(args.directory)
+        return Bundle(bundle_path)
+    except Exception as e:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to open the bundle [yellow]`{bundle_path}`[/yellow]. "
+            f"Reason:\n[dark_orange]{e}"
+        )
+        exit(1)
 
-        for app in App:
-            os.makedirs(app.value.path, exist_ok=True)
 
-        os.makedirs(".turbocase", exist_ok=True)
+def get_selected_test_cases(
+    args: argparse.Namespace, *, console: Console, bundle: Bundle | None = None
+) -> List[Tuple[App, str]]:
+    """
+    Get the test cases selected by the `test_titles`, `--app`, `--all` and `--shard` arguments of a command.
 
-        console.print(f"[green]{SUCCESS_PREFIX} Successfully initialized project.")
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        console (Console): The rich console object.
+        bundle (Bundle | None): The bundle to select all test cases from. Default: the test case files.
+
+    Returns:
+        List[Tuple[App, str]]: The selected test cases.
+    """
+    if not args.test_titles and not args.all:
         console.print(
-            f"{HINT_PREFIX} Use [yellow]`turbocase config`[/yellow] to configure the project."
+            f"[red]{FAILURE_PREFIX} No test case titles given.\n"
+            f"{HINT_PREFIX} Pass one or more titles, or use [yellow]`--all`[/yellow] to select all test cases."
         )
-    except Exception as e:
+        exit(1)
+
+    test_cases = select_test_cases(
+        args.project_path,
+        args.app,
+        args.test_titles,
+        select_all=args.all,
+        shard=args.shard,
+        list_titles=bundle.list_test_titles if bundle is not None else None,
+    )
+
+    # with `--output`, the standard output only holds the results
+    if args.shard is not None and getattr(args, "output", None) is None:
+        index, count = args.shard
         console.print(
-            f"[red]{FAILURE_PREFIX} Failed to initialize project. Reason:\n[dark_orange]{e}"
+            f"{HINT_PREFIX} Processing shard [cyan]{index}/{count}[/cyan]: "
+            f"[cyan]{len(test_cases)}[/cyan] test case(s)."
         )
-        print_error_hints(e, console=console)
 
+    return test_cases
 
-def add_generate_command(subparsers: argparse._SubParsersAction):
+
+def add_validate_command(subparsers: argparse._SubParsersAction):
     """
-    Add the 'generate' command to the subparsers.
+    Add the 'validate' command to the subparsers.
 
     Args:
         subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
     """
-    generate_parser = subparsers.add_parser(
-        "generate",
-        help="Generate test case template",
-        description="Generate test case template",
+    validate_parser = subparsers.add_parser(
+        "validate",
+        help="Validate test case files against the test case schema",
+        description="Validate test case files against the test case schema",
         add_help=False,
         formatter_class=RichHelpFormatter,
     )
 
-    generate_parser.add_argument(
-        "app",
+    validate_parser.add_argument(
+        "-p",
+        "--project-path",
+        help="Path of the project. Default: current directory",
+        metavar="<project_path>",
+        default=".",
+    )
+
+    validate_parser.add_argument(
+        "-a",
+        "--app",
         choices=[app.value.name for app in App],
-        help=f"The type of the app. Choose from: {', '.join([app.value.name for app in App])}.",
+        help=f"The type of the app. Choose from: {', '.join([app.value.name for app in App])}. "
+        "Default: app (all apps with `--all`)",
         metavar="<target_app>",
     )
 
-    generate_parser.add_argument(
-        "test_title",
+    validate_parser.add_argument(
+        "test_titles",
         help="The title of the test case",
         metavar="<test_title>",
+        nargs="*",
     )
 
-    generate_parser.add_argument(
-        "project_path",
-        help="Path of the project. Default: current directory",
-        metavar="<project_path>",
-        nargs="?",
-        default=".",
+    validate_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Validate all test cases of the app instead of the given titles.",
     )
 
-    generate_parser.add_argument(
+    validate_parser.add_argument(
+        "--bundle",
+        help="Validate the test cases of this bundle (see `turbocase bundle`) instead of the YAML files.",
+        metavar="<bundle_path>",
+    )
+
+    validate_parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        help="Only process the i-th of n disjoint slices of the test cases (e.g. `1/4`), to split runs across CI nodes.",
+        metavar="<i/n>",
+    )
+
+    validate_parser.add_argument(
+        "--report",
+        help="Write a JSON result report to this path (see `turbocase merge-reports`).",
+        metavar="<report_path>",
+    )
+
+    validate_parser.add_argument(
         "-h",
         "--help",
         action="help",
@@ -329,9 +770,9 @@ def add_generate_command(subparsers: argparse._SubParsersAction):
     )
 
 
-def handle_generate_command(args: argparse.Namespace, *, console: Console):
+def handle_validate_command(args: argparse.Namespace, *, console: Console):
     """
-    Handles the 'generate' command by creating a test case template in the corresponding app folder.
+    Handles the 'validate' command by validating the selected test case files.
 
     Args:
         args (argparse.Namespace): The parsed command-line arguments.
@@ -340,78 +781,76 @@ def handle_generate_command(args: argparse.Namespace, *, console: Console):
     Returns:
         None
     """
-    try:
-        os.chdir(args.project_path)
+    bundle = open_bundle(args.bundle, console=console)
+    test_cases = get_selected_test_cases(args, console=console, bundle=bundle)
+    report = create_report("validate", args.shard)
 
-        folder_name = file_exists_in_project(
-            f"{args.test_title}.yaml", args.project_path
-        )
-        if folder_name is not None:
+    valid_files_n = 0
+    for app, test_title in test_cases:
+        try:
+            if bundle is not None:
+                # the schema may have changed since the bundle was built
+                Testiny.validate_test_case_content(
+                    bundle.load_test_case(test_title, app)
+                )
+            else:
+                Testiny.load_test_case(test_title, app, args.project_path)
+            valid_files_n += 1
+            add_result(report, app.value.name, test_title)
+        except Exception as e:
+            test_case_path = (
+                get_test_case_path(args.project_path, app, test_title)
+                if bundle is None
+                else os.path.join(app.value.path, f"{test_title}.yaml")
+            )
             console.print(
-                f"[red]{FAILURE_PREFIX} Test case with the given title already exists in the project (Under `{folder_name}`).\n"
-                f"{HINT_PREFIX} Consider using the app and/or project names in the title to avoid conflicts."
+                f"[red]{FAILURE_PREFIX} Invalid test case file: "
+                f"[yellow]`{test_case_path}`[/yellow]. Reason:\n[dark_orange]{e}"
             )
-            exit(1)
-
-        template_path = os.path.join(
-            App[args.app.upper()].value.path, f"{args.test_title}.yaml"
-        )
-
-        template = Testiny.generate_test_case_template()
+            add_result(report, app.value.name, test_title, error=e)
 
-        with open(template_path, "w") as template_file:
-            template_file.write(template)
-
-        console.print(
-            f"[green]{SUCCESS_PREFIX} Successfully generated test case template."
-        )
-    except Exception as e:
-        console.print(
-            f"[red]{FAILURE_PREFIX} Failed to generate test case template. Reason:\n[dark_orange]{e}"
-        )
-        print_error_hints(e, console=console)
+    color = get_result_color(valid_files_n, len(test_cases))
+    console.print(
+        f"[{color.value}]Validated [cyan]{valid_files_n}/{len(test_cases)}[/cyan] test cases."
+    )
+    if args.report is not None:
+        write_report(args.report, report)
+    if valid_files_n != len(test_cases):
+        exit(1)
 
 
-def add_config_command(subparsers: argparse._SubParsersAction):
+def add_bundle_command(subparsers: argparse._SubParsersAction):
     """
-    Add the 'config' command to the subparsers.
+    Add the 'bundle' command to the subparsers.
 
     Args:
         subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
     """
-    config_parser = subparsers.add_parser(
-        "config",
-        help="Configure the project",
-        description="Configure the project",
+    bundle_parser = subparsers.add_parser(
+        "bundle",
+        help="Compile all test case files into a single indexed bundle",
+        description="Validate all test case files and compile them into a single indexed file, "
+        "which `upsert`, `validate` and `search` can read with `--bundle` instead of parsing every YAML file.",
         add_help=False,
         formatter_class=RichHelpFormatter,
     )
 
-    config_parser.add_argument(
-        "--tool",
-        choices=("Testiny",),
-        help="The test management tool to use. Default: Testiny.",
-        metavar="<tool>",
-        default="Testiny",
-        required=True,
-    )
-
-    config_parser.add_argument(
-        "-e",
-        "--env-var",
-        action="store_true",
-        help="Use the environment variable `TURBOCASE_API_KEY` instead of entering the API key.",
+    bundle_parser.add_argument(
+        "-p",
+        "--project-path",
+        help="Path of the project. Default: current directory",
+        metavar="<project_path>",
+        default=".",
     )
 
-    config_parser.add_argument(
-        "directory",
-        help="Path of the project. Default: current directory.",
-        metavar="<directory>",
-        nargs="?",
-        default=".",
+    bundle_parser.add_argument(
+        "-o",
+        "--output",
+        help=f"Write the bundle to this path. Default: {DEFAULT_BUNDLE_PATH} in the project",
+        metavar="<bundle_path>",
     )
 
-    config_parser.add_argument(
+    bundle_parser.add_argument(
         "-h",
         "--help",
         action="help",
@@ -419,9 +858,9 @@ def add_config_command(subparsers: argparse._SubParsersAction):
     )
 
 
-def handle_config_command(args: argparse.Namespace, *, console: Console):
+def handle_bundle_command(args: argparse.Namespace, *, console: Console):
     """
-    Handles the 'config' command by writing configurations in the `.turbocase` folder.
+    Handles the 'bundle' command by compiling the test case files of the project into a bundle.
 
     Args:
         args (argparse.Namespace): The parsed command-line arguments.
@@ -430,56 +869,1120 @@ def handle_config_command(args: argparse.Namespace, *, console: Console):
     Returns:
         None
     """
+    bundle_path = args.output or os.path.join(args.project_path, DEFAULT_BUNDLE_PATH)
+    try:
+        summary = build_bundle(args.project_path, bundle_path)
+    except Exception as e:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to build the bundle. Reason:\n[dark_orange]{e}"
+        )
+        print_error_hints(e, console=console)
+        exit(1)
 
-    def get_project_id(project: Project, api_key: str) -> int:
-        while True:
-            full_project_name = console.input(
-                f"[green]Enter the full project name of the [yellow]`{project.name}`[/yellow] App in Testiny: "
-            )
+    for app, test_title, e in summary.errors:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Invalid test case file: "
+            f"[yellow]`{get_test_case_path(args.project_path, app, test_title)}`[/yellow]. "
+            f"Reason:\n[dark_orange]{e}"
+        )
+    if summary.errors:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Did not write the bundle: "
+            f"[cyan]{len(summary.errors)}[/cyan] invalid test case file(s)."
+        )
+        exit(1)
 
-            project_id = Testiny.get_project_id(full_project_name, api_key)
-            if project_id:
-                console.print(
-                    f"[green]{SUCCESS_PREFIX} Project found with ID: [yellow]`{project_id}`[/yellow].\n"
-                )
-                return project_id
+    console.print(
+        f"[green]{SUCCESS_PREFIX} Bundled [cyan]{summary.bundled_n}[/cyan] test cases "
+        f"into [yellow]`{bundle_path}`[/yellow]."
+    )
 
-            console.print(
-                f"[red]{FAILURE_PREFIX} No project found with the given name. Try again."
-            )
 
-    def get_api_key(args, console) -> str:
-        if args.env_var:
-            api_key = os.environ.get("TURBOCASE_API_KEY")
-            if api_key is None:
-                console.print(
-                    f"[red]{FAILURE_PREFIX} Environment variable [yellow]`TURBOCASE_API_KEY`[/yellow] not found. "
-                    "Please set the environment variable or remove [yellow]`--env-var`[/yellow] flag and try again."
+def add_merge_reports_command(subparsers: argparse._SubParsersAction):
+    """
+    Add the 'merge-reports' command to the subparsers.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
+    """
+    merge_reports_parser = subparsers.add_parser(
+        "merge-reports",
+        help="Combine the result reports of sharded runs into one result",
+        description="Combine the result reports written with `--report` by sharded runs into one result",
+        add_help=False,
+        formatter_class=RichHelpFormatter,
+    )
+
+    merge_reports_parser.add_argument(
+        "report_paths",
+        help="The paths of the reports to merge",
+        metavar="<report_path>",
+        nargs="+",
+    )
+
+    merge_reports_parser.add_argument(
+        "-o",
+        "--output",
+        help="Write the merged report to this path.",
+        metavar="<output_path>",
+    )
+
+    merge_reports_parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help=HELP_MESSAGE,
+    )
+
+
+def handle_merge_reports_command(args: argparse.Namespace, *, console: Console):
+    """
+    Handles the 'merge-reports' command by combining the reports of sharded runs.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        console (Console): The rich console object.
+
+    Returns:
+        None
+    """
+    try:
+        reports = [load_report(report_path) for report_path in args.report_paths]
+        merged_report, missing_shards = merge_reports(reports)
+    except Exception as e:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to merge reports. Reason:\n[dark_orange]{e}"
+        )
+        exit(1)
+
+    for result in merged_report["results"]:
+        if result["status"] == "failure":
+            console.print(
+                f"[red]{FAILURE_PREFIX} [yellow]`{result['title']}`[/yellow] ({result['app']}): "
+                f"[dark_orange]{result['error']}"
+            )
+    if missing_shards:
+        console.print(
+            f"[yellow]{WARNING_PREFIX} Missing reports of shard(s): {', '.join(missing_shards)}."
+        )
+
+    if args.output is not None:
+        write_report(args.output, merged_report)
+
+    succeeded_n = count_successes(merged_report)
+    total_n = len(merged_report["results"])
+    console.rule("[cyan]Results", characters="═")
+    color = get_result_color(succeeded_n, total_n)
+    if missing_shards and color == Color.GREEN:
+        color = Color.YELLOW
+    console.print(
+        f"[{color.value}]{merged_report['command'].capitalize()}: "
+        f"[cyan]{succeeded_n}/{total_n}[/cyan] test cases succeeded."
+    )
+    if color != Color.GREEN:
+        exit(1)
+
+
+def add_init_command(subparsers: argparse._SubParsersAction):
+    """
+    Add the 'init' command to the subparsers.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
+    """
+    init_parser = subparsers.add_parser(
+        "init",
+        help="Create an empty test management project repository.",
+        description="Create an empty test management project repository.",
+        add_help=False,
+        formatter_class=RichHelpFormatter,
+    )
+
+    init_parser.add_argument(
+        "directory",
+        help="Path of the project. Default: current directory.",
+        metavar="<director>",
+        nargs="?",
+        default=".",
+    )
+
+    init_parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help=HELP_MESSAGE,
+    )
+
+
+def handle_init_command(args: argparse.Namespace, *, console: Console):
+    """
+    Handles the 'int' command by creating folders and files for the project.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        console (Console): The rich console object.
+
+    Returns:
+        None
+    """
+
+    try:
+        os.chdir(args.directory)
+
+        for app in App:
+            os.makedirs(app.value.path, exist_ok=True)
+
+        os.makedirs(".turbocase", exist_ok=True)
+
+        console.print(f"[green]{SUCCESS_PREFIX} Successfully initialized project.")
+        console.print(
+            f"{HINT_PREFIX} Use [yellow]`turbocase config`[/yellow] to configure the project."
+        )
+    except Exception as e:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to initialize project. Reason:\n[dark_orange]{e}"
+        )
+        print_error_hints(e, console=console)
+
+
+def add_generate_command(subparsers: argparse._SubParsersAction):
+    """
+    Add the 'generate' command to the subparsers.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
+    """
+    generate_parser = subparsers.add_parser(
+        "generate",
+        help="Generate test case templates",
+        description="Generate test case templates, one per title or per test case of a manifest",
+        add_help=False,
+        formatter_class=RichHelpFormatter,
+    )
+
+    generate_parser.add_argument(
+        "app",
+        choices=[app.value.name for app in App],
+        help=f"The type of the app (the default app of the test cases of a manifest). "
+        f"Choose from: {', '.join([app.value.name for app in App])}.",
+        metavar="<target_app>",
+    )
+
+    generate_parser.add_argument(
+        "test_titles",
+        help="The titles of the test cases",
+        metavar="<test_title>",
+        nargs="*",
+    )
+
+    generate_parser.add_argument(
+        "-m",
+        "--manifest",
+        help="A CSV or YAML file of test cases to generate, with a `title` and optional `app` and `steps`.",
+        metavar="<manifest_path>",
+    )
+
+    generate_parser.add_argument(
+        "-p",
+        "--project-path",
+        help="Path of the project. Default: current directory",
+        metavar="<project_path>",
+        default=".",
+    )
+
+    generate_parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help=HELP_MESSAGE,
+    )
+
+
+def handle_generate_command(args: argparse.Namespace, *, console: Console):
+    """
+    Handles the 'generate' command by creating test case templates in the corresponding app folders.
+
+    All titles are checked against the existing files and against each other before any template is written.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        console (Console): The rich console object.
+
+    Returns:
+        None
+    """
+    try:
+        test_cases = [(args.app, test_title, None) for test_title in args.test_titles]
+        if args.manifest is not None:
+            test_cases += [
+                (app_name or args.app, test_title, steps)
+                for app_name, test_title, steps in load_generate_manifest(args.manifest)
+            ]
+        if not test_cases:
+            console.print(
+                f"[red]{FAILURE_PREFIX} No test case to generate.\n"
+                f"{HINT_PREFIX} Pass the titles of the test cases, or a manifest with [yellow]`--manifest`[/yellow]."
+            )
+            exit(1)
+
+        _, files_index = get_test_files_index(args.project_path)
+        documents_titles = get_documents_titles(args.project_path)
+        title_index = get_local_title_index(args.project_path)
+        batch_title_index = TitleIndex()
+        batch_files_names = set()
+        templates: List[Tuple[str, str]] = []
+        skipped_titles_n = 0
+
+        for app_name, test_title, steps in test_cases:
+            file_name = f"{test_title}.yaml"
+            template_path = os.path.join(
+                args.project_path, App[app_name.upper()].value.path, file_name
+            )
+            if files_index.get(file_name):
+                console.print(
+                    f"[red]{FAILURE_PREFIX} Test case [yellow]`{test_title}`[/yellow] already exists in the project "
+                    f"(Under `{os.path.basename(files_index[file_name][0])}`)."
+                )
+                skipped_titles_n += 1
+                continue
+            if test_title in documents_titles:
+                console.print(
+                    f"[red]{FAILURE_PREFIX} Test case [yellow]`{test_title}`[/yellow] already exists in the project "
+                    f"(In `{documents_titles[test_title][0]}`)."
+                )
+                skipped_titles_n += 1
+                continue
+            if file_name in batch_files_names:
+                console.print(
+                    f"[red]{FAILURE_PREFIX} Test case [yellow]`{test_title}`[/yellow] is given more than once."
+                )
+                skipped_titles_n += 1
+                continue
+
+            print_similar_titles_warning(
+                test_title,
+                title_index.find_near_duplicates(test_title)
+                + batch_title_index.find_near_duplicates(test_title),
+                console=console,
+            )
+            batch_files_names.add(file_name)
+            batch_title_index.add(TitleEntry(test_title, "this batch"))
+            templates.append(
+                (template_path, Testiny.generate_test_case_template(steps))
+            )
+
+        for template_path, template in templates:
+            with open(template_path, "w") as template_file:
+                template_file.write(template)
+
+        if len(test_cases) == 1 and not skipped_titles_n:
+            console.print(
+                f"[green]{SUCCESS_PREFIX} Successfully generated test case template."
+            )
+        else:
+            color = get_result_color(len(templates), len(test_cases))
+            console.print(
+                f"[{color.value}]Generated [cyan]{len(templates)}/{len(test_cases)}[/cyan] test case templates."
+            )
+        if skipped_titles_n:
+            console.print(
+                f"{HINT_PREFIX} Consider using the app and/or project names in the title to avoid conflicts."
+            )
+            exit(1)
+    except Exception as e:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to generate test case template. Reason:\n[dark_orange]{e}"
+        )
+        print_error_hints(e, console=console)
+
+
+def add_results_command(subparsers: argparse._SubParsersAction):
+    """
+    Add the 'results' command to the subparsers.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
+    """
+    results_parser = subparsers.add_parser(
+        "results",
+        help="Upload test results (JUnit XML) to new test runs",
+        description="Upload the results of a JUnit XML report to a new test run in each project of the app. "
+        "Test cases are matched to remote test cases by their title.",
+        add_help=False,
+        formatter_class=RichHelpFormatter,
+    )
+
+    results_parser.add_argument(
+        "action",
+        choices=("upload",),
+        help="The action to perform. Choose from: upload.",
+        metavar="<action>",
+    )
+
+    results_parser.add_argument(
+        "report_path",
+        help="The path to the JUnit XML report",
+        metavar="<report_path>",
+    )
+
+    results_parser.add_argument(
+        "-p",
+        "--project-path",
+        help="Path of the project. Default: current directory",
+        metavar="<project_path>",
+        default=".",
+    )
+
+    results_parser.add_argument(
+        "-a",
+        "--app",
+        choices=[app.value.name for app in App],
+        help=f"The type of the app. Choose from: {', '.join([app.value.name for app in App])}. Default: app",
+        metavar="<target_app>",
+        default="app",
+    )
+
+    results_parser.add_argument(
+        "-t",
+        "--run-title",
+        help="The title of the test run. Default: the name of the report and the current time.",
+        metavar="<run_title>",
+    )
+
+    results_parser.add_argument(
+        "--batch-size",
+        type=int,
+        help=f"The number of results uploaded per request. Default: {DEFAULT_BATCH_SIZE}",
+        metavar="<batch_size>",
+        default=DEFAULT_BATCH_SIZE,
+    )
+
+    results_parser.add_argument(
+        "--concurrency",
+        type=int,
+        help=f"The maximum number of batches uploaded at once. Default: {DEFAULT_CONCURRENCY}",
+        metavar="<concurrency>",
+        default=DEFAULT_CONCURRENCY,
+    )
+
+    results_parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help=HELP_MESSAGE,
+    )
+
+
+def handle_results_command(args: argparse.Namespace, *, console: Console):
+    """
+    Handles the 'results' command by uploading the results of a JUnit XML report.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        console (Console): The rich console object.
+
+    Returns:
+        None
+    """
+    run_title = args.run_title
+    if run_title is None:
+        run_title = (
+            f"{os.path.basename(args.report_path)} ({datetime.now():%Y-%m-%d %H:%M})"
+        )
+
+    try:
+        summary = upload_junit_results(
+            args.report_path,
+            App[args.app.upper()],
+            args.project_path,
+            run_title,
+            batch_size=args.batch_size,
+            concurrency=args.concurrency,
+        )
+    except Exception as e:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to upload test results from: "
+            f"[yellow]`{args.report_path}`[/yellow]. Reason:\n[dark_orange]{e}"
+        )
+        print_error_hints(e, console=console)
+        exit(1)
+
+    for title in summary.unmatched_titles[:MAX_LISTED_UNMATCHED_TITLES]:
+        console.print(
+            f"[yellow]{WARNING_PREFIX} No remote test case found with the title: [cyan]`{title}`"
+        )
+    if len(summary.unmatched_titles) > MAX_LISTED_UNMATCHED_TITLES:
+        console.print(
+            f"[yellow]{WARNING_PREFIX} ... and {len(summary.unmatched_titles) - MAX_LISTED_UNMATCHED_TITLES} more."
+        )
+
+    formatted_ids = ", ".join(
+        f"{id} ({project.name} project)"
+        for project, id in summary.test_runs_ids.items()
+    )
+    matched_n = summary.results_n - len(summary.unmatched_titles)
+    color = get_result_color(matched_n, summary.results_n)
+    console.print(
+        f"[{color.value}]Uploaded results of [cyan]{matched_n}/{summary.results_n}[/cyan] test cases "
+        f"to test run(s) with ID: [yellow]`{formatted_ids}`[/yellow]."
+    )
+
+
+def add_pull_command(subparsers: argparse._SubParsersAction):
+    """
+    Add the 'pull' command to the subparsers.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
+    """
+    pull_parser = subparsers.add_parser(
+        "pull",
+        help="Update the local test case files with the remote changes since the last pull",
+        description="Update the local test case files with the test cases modified in Testiny since the last pull. "
+        "Files changed both locally and remotely are reported as conflicts and left untouched.",
+        add_help=False,
+        formatter_class=RichHelpFormatter,
+    )
+
+    pull_parser.add_argument(
+        "-p",
+        "--project-path",
+        help="Path of the project. Default: current directory",
+        metavar="<project_path>",
+        default=".",
+    )
+
+    pull_parser.add_argument(
+        "-a",
+        "--app",
+        choices=[app.value.name for app in App],
+        help=f"Only pull from the projects of this app. Choose from: {', '.join([app.value.name for app in App])}. "
+        "Default: app (all projects)",
+        metavar="<target_app>",
+        default="app",
+    )
+
+    pull_parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help=HELP_MESSAGE,
+    )
+
+
+def handle_pull_command(args: argparse.Namespace, *, console: Console):
+    """
+    Handles the 'pull' command by pulling the remote changes into the local test case files.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        console (Console): The rich console object.
+
+    Returns:
+        None
+    """
+    try:
+        summary = pull_test_cases(
+            args.project_path, App[args.app.upper()].value.projects
+        )
+    except Exception as e:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to pull test cases. Reason:\n[dark_orange]{e}"
+        )
+        print_error_hints(e, console=console)
+        exit(1)
+
+    for path in summary.created_paths:
+        console.print(f"[green]{SUCCESS_PREFIX} Created [yellow]`{path}`")
+    for path in summary.updated_paths:
+        console.print(f"[green]{SUCCESS_PREFIX} Updated [yellow]`{path}`")
+    for path, test_case_id, project in summary.conflicts:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Conflict: [yellow]`{path}`[/yellow] changed both locally and "
+            f"remotely (ID: [yellow]`{test_case_id}`[/yellow], {project.name} project). Left untouched."
+        )
+    for test_case_id, project, e in summary.errors:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to pull test case with ID: "
+            f"[yellow]`{test_case_id}`[/yellow] ({project.name} project). Reason:\n[dark_orange]{e}"
+        )
+
+    changed_n = len(summary.created_paths) + len(summary.updated_paths)
+    console.print(
+        f"[cyan]Pulled {changed_n} changed test case(s), "
+        f"{summary.unchanged_n} unchanged, {len(summary.conflicts)} conflict(s)."
+    )
+    if summary.conflicts:
+        console.print(
+            f"{HINT_PREFIX} Resolve a conflict by using [yellow]`turbocase upsert`[/yellow] to keep the local file, "
+            "or by deleting or reverting the local file and pulling again to keep the remote test case."
+        )
+    if summary.conflicts or summary.errors:
+        exit(1)
+
+
+def add_prune_command(subparsers: argparse._SubParsersAction):
+    """
+    Add the 'prune' command to the subparsers.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
+    """
+    prune_parser = subparsers.add_parser(
+        "prune",
+        help="Delete the remote test cases whose local test case file was deleted",
+        description="Delete the remote test cases that have no local test case file with the same title, "
+        "in bulk requests. Use `--dry-run` to list them first.",
+        add_help=False,
+        formatter_class=RichHelpFormatter,
+    )
+
+    prune_parser.add_argument(
+        "-p",
+        "--project-path",
+        help="Path of the project. Default: current directory",
+        metavar="<project_path>",
+        default=".",
+    )
+
+    prune_parser.add_argument(
+        "-a",
+        "--app",
+        choices=[app.value.name for app in App],
+        help=f"Only prune the projects of this app. Choose from: {', '.join([app.value.name for app in App])}. "
+        "Default: app (all projects)",
+        metavar="<target_app>",
+        default="app",
+    )
+
+    prune_parser.add_argument(
+        "-n",
+        "--dry-run",
+        action="store_true",
+        help="Only list the remote test cases that would be deleted.",
+    )
+
+    prune_parser.add_argument(
+        "--max-deletions",
+        type=parse_positive_int,
+        help="Delete nothing if there are more remote test cases to delete than this. "
+        f"Default: {DEFAULT_MAX_DELETIONS}",
+        metavar="<max_deletions>",
+        default=DEFAULT_MAX_DELETIONS,
+    )
+
+    prune_parser.add_argument(
+        "--concurrency",
+        type=parse_positive_int,
+        help=f"The maximum number of deletion requests at once. Default: {DEFAULT_PRUNE_CONCURRENCY}",
+        metavar="<concurrency>",
+        default=DEFAULT_PRUNE_CONCURRENCY,
+    )
+
+    prune_parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help=HELP_MESSAGE,
+    )
+
+
+def handle_prune_command(args: argparse.Namespace, *, console: Console):
+    """
+    Handles the 'prune' command by deleting the remote test cases without a local test case file.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        console (Console): The rich console object.
+
+    Returns:
+        None
+    """
+    try:
+        orphans = find_orphans(args.project_path, App[args.app.upper()].value.projects)
+    except Exception as e:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to list the remote test cases. Reason:\n[dark_orange]{e}"
+        )
+        print_error_hints(e, console=console)
+        exit(1)
+
+    if args.dry_run:
+        for orphan in orphans:
+            console.print(
+                f"[cyan]`{orphan.title}`[/cyan] (ID: [yellow]`{orphan.id}`[/yellow], {orphan.project.name} project)"
+            )
+        console.print(
+            f"[cyan]Found {len(orphans)} remote test case(s) without a local file."
+        )
+        return
+
+    if not orphans:
+        console.print(
+            f"[green]{SUCCESS_PREFIX} No remote test case without a local file."
+        )
+        return
+
+    try:
+        summary = prune_orphans(
+            orphans,
+            args.project_path,
+            max_deletions=args.max_deletions,
+            concurrency=args.concurrency,
+        )
+    except TooManyDeletionsError as e:
+        console.print(f"[red]{FAILURE_PREFIX} {e}.")
+        console.print(
+            f"{HINT_PREFIX} List them with [yellow]`turbocase prune --dry-run`[/yellow], "
+            "then raise the limit with [yellow]`--max-deletions`[/yellow] if they are all to be deleted."
+        )
+        exit(1)
+
+    for orphan in summary.deleted:
+        console.print(
+            f"[green]{SUCCESS_PREFIX} Deleted [cyan]`{orphan.title}`[/cyan] "
+            f"(ID: [yellow]`{orphan.id}`[/yellow], {orphan.project.name} project)"
+        )
+    for batch, e in summary.errors:
+        formatted_ids = ", ".join(str(orphan.id) for orphan in batch)
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to delete test cases with ID: "
+            f"[yellow]`{formatted_ids}`[/yellow]. Reason:\n[dark_orange]{e}"
+        )
+
+    color = get_result_color(len(summary.deleted), len(orphans))
+    console.print(
+        f"[{color.value}]Deleted [cyan]{len(summary.deleted)}/{len(orphans)}[/cyan] remote test case(s) "
+        "without a local file."
+    )
+    if summary.errors:
+        exit(1)
+
+
+def add_search_command(subparsers: argparse._SubParsersAction):
+    """
+    Add the 'search' command to the subparsers.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
+    """
+    search_parser = subparsers.add_parser(
+        "search",
+        help="Search the local test cases",
+        description="Search the titles, preconditions, steps and expected results of the local test cases. "
+        "A term can be restricted to a field with `field:term` (e.g. `steps:refund`). "
+        f"Fields: {', '.join(SEARCH_FIELDS_ALIASES)}.",
+        add_help=False,
+        formatter_class=RichHelpFormatter,
+    )
+
+    search_parser.add_argument(
+        "query",
+        help="The terms to search for. Test cases must contain all of them.",
+        metavar="<query>",
+        nargs="+",
+    )
+
+    search_parser.add_argument(
+        "-p",
+        "--project-path",
+        help="Path of the project. Default: current directory",
+        metavar="<project_path>",
+        default=".",
+    )
+
+    search_parser.add_argument(
+        "-a",
+        "--app",
+        choices=[app.value.name for app in App],
+        help=f"Only search the test cases of this app. Choose from: {', '.join([app.value.name for app in App])}. "
+        "Default: app (all apps)",
+        metavar="<target_app>",
+    )
+
+    search_parser.add_argument(
+        "-f",
+        "--field",
+        choices=list(SEARCH_FIELDS_ALIASES),
+        action="append",
+        help=f"Only search this field (can be repeated). Choose from: {', '.join(SEARCH_FIELDS_ALIASES)}. "
+        "Default: all fields",
+        metavar="<field>",
+    )
+
+    search_parser.add_argument(
+        "-n",
+        "--limit",
+        type=int,
+        help=f"The maximum number of results. Default: {DEFAULT_SEARCH_LIMIT}",
+        metavar="<limit>",
+        default=DEFAULT_SEARCH_LIMIT,
+    )
+
+    search_parser.add_argument(
+        "--bundle",
+        help="Search the test cases of this bundle (see `turbocase bundle`) instead of the local files.",
+        metavar="<bundle_path>",
+    )
+
+    search_parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help=HELP_MESSAGE,
+    )
+
+
+def handle_search_command(args: argparse.Namespace, *, console: Console):
+    """
+    Handles the 'search' command by printing the local test cases matching a query, most relevant first.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        console (Console): The rich console object.
+
+    Returns:
+        None
+    """
+    bundle = open_bundle(args.bundle, console=console)
+    try:
+        search_index = (
+            SearchIndex.from_bundle(bundle)
+            if bundle is not None
+            else get_search_index(args.project_path)
+        )
+        results = search_index.search(
+            " ".join(args.query),
+            fields=(
+                [SEARCH_FIELDS_ALIASES[field] for field in args.field]
+                if args.field
+                else None
+            ),
+            app=App[args.app.upper()] if args.app is not None else None,
+        )
+    except Exception as e:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to search test cases. Reason:\n[dark_orange]{e}"
+        )
+        print_error_hints(e, console=console)
+        exit(1)
+
+    for result in results[: args.limit]:
+        console.print(
+            f"[yellow]`{result.title}`[/yellow] ({result.path}) "
+            f"[cyan]{result.score:.2f}[/cyan] [dim]{', '.join(result.fields)}",
+            highlight=False,
+        )
+
+    color = Color.GREEN if results else Color.YELLOW
+    console.print(
+        f"[{color.value}]Found [cyan]{len(results)}[/cyan] matching test case(s)"
+        + (f", showing the first {args.limit}." if len(results) > args.limit else ".")
+    )
+
+
+def add_dedupe_command(subparsers: argparse._SubParsersAction):
+    """
+    Add the 'dedupe' command to the subparsers.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
+    """
+    dedupe_parser = subparsers.add_parser(
+        "dedupe",
+        help="List clusters of test cases with similar titles",
+        description="List clusters of test cases whose titles are equal or similar once case and whitespace are folded",
+        add_help=False,
+        formatter_class=RichHelpFormatter,
+    )
+
+    dedupe_parser.add_argument(
+        "-p",
+        "--project-path",
+        help="Path of the project. Default: current directory",
+        metavar="<project_path>",
+        default=".",
+    )
+
+    dedupe_parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        help=f"The minimum similarity (between 0 and 1) of two titles of a cluster. Default: {DEFAULT_SIMILARITY_THRESHOLD}",
+        metavar="<threshold>",
+        default=DEFAULT_SIMILARITY_THRESHOLD,
+    )
+
+    dedupe_parser.add_argument(
+        "-r",
+        "--remote",
+        action="store_true",
+        help="Also include the titles of the remote test cases that do not exist locally.",
+    )
+
+    dedupe_parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help=HELP_MESSAGE,
+    )
+
+
+def handle_dedupe_command(args: argparse.Namespace, *, console: Console):
+    """
+    Handles the 'dedupe' command by printing the clusters of similar titles of the project.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        console (Console): The rich console object.
+
+    Returns:
+        None
+    """
+    try:
+        local_title_index = get_local_title_index(args.project_path)
+        title_index = TitleIndex(local_title_index.entries)
+
+        if args.remote:
+            local_titles = {entry.title for entry in local_title_index.entries}
+            remote_locations = {}
+            for project in Project:
+                project_id = get_project_id_from_config_file(project, args.project_path)
+                for test_case in Testiny.iter_test_cases(
+                    project_id,
+                    fields=["id", "title"],
+                    prefetch=True,
+                    project_path=args.project_path,
+                ):
+                    # remote copies of local test cases are expected, not duplicates
+                    if test_case["title"] not in local_titles:
+                        remote_locations.setdefault(test_case["title"], []).append(
+                            f"ID {test_case['id']} ({project.name} project)"
+                        )
+            for title, locations in remote_locations.items():
+                title_index.add(TitleEntry(title, f"remote: {', '.join(locations)}"))
+
+        clusters = title_index.find_clusters(args.threshold)
+
+        for cluster_n, cluster in enumerate(clusters, start=1):
+            console.rule(f"[cyan]Cluster {cluster_n}")
+            for entry in cluster:
+                console.print(
+                    f"  - [yellow]`{entry.title}`[/yellow] ({entry.location})",
+                    highlight=False,
+                )
+            console.print()  # cosmetic
+
+        console.rule("[cyan]Results", characters="═")
+        color = Color.GREEN if not clusters else Color.YELLOW
+        console.print(
+            f"[{color.value}]Found [cyan]{len(clusters)}[/cyan] cluster(s) of similar titles "
+            f"among [cyan]{len(title_index.entries)}[/cyan] test cases."
+        )
+    except Exception as e:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to find similar titles. Reason:\n[dark_orange]{e}"
+        )
+        print_error_hints(e, console=console)
+        exit(1)
+
+
+def add_config_command(subparsers: argparse._SubParsersAction):
+    """
+    Add the 'config' command to the subparsers.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
+    """
+    config_parser = subparsers.add_parser(
+        "config",
+        help="Configure the project",
+        description="Configure the project",
+        add_help=False,
+        formatter_class=RichHelpFormatter,
+    )
+
+    config_parser.add_argument(
+        "--tool",
+        choices=("Testiny",),
+        help="The test management tool to use. Default: Testiny.",
+        metavar="<tool>",
+        default="Testiny",
+        required=True,
+    )
+
+    config_parser.add_argument(
+        "-e",
+        "--env-var",
+        action="store_true",
+        help="Use the environment variable `TURBOCASE_API_KEY` instead of entering the API key.",
+    )
+
+    config_parser.add_argument(
+        "directory",
+        help="Path of the project. Default: current directory.",
+        metavar="<directory>",
+        nargs="?",
+        default=".",
+    )
+
+    config_parser.add_argument(
+        "-n",
+        "--project-name",
+        type=parse_project_name,
+        action="append",
+        default=[],
+        help="The full name in Testiny of the project of an App (e.g. `IOS=Shop iOS`), instead of entering it. "
+        "Can be repeated.",
+        metavar="<PROJECT=name>",
+    )
+
+    config_parser.add_argument(
+        "--projects-file",
+        help='A TOML file with the full name in Testiny of the project of each App (e.g. `IOS = "Shop iOS"`), '
+        "instead of entering them.",
+        metavar="<file_path>",
+    )
+
+    config_parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        help="Where to send the API requests: `testiny`, or `local` for an offline fake of Testiny stored in "
+        f"the project (`.turbocase/{LOCAL_BACKEND_FILE_NAME}`). Default: {DEFAULT_BACKEND}.",
+        metavar="<backend>",
+        default=DEFAULT_BACKEND,
+    )
+
+    config_parser.add_argument(
+        "--rate-limit",
+        type=parse_rate_limit,
+        help="The maximum number of API requests per second, shared by all turbocase processes of the host "
+        "using the same API key. Default: unlimited.",
+        metavar="<requests_per_second>",
+    )
+
+    config_parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help=HELP_MESSAGE,
+    )
+
+
+def handle_config_command(args: argparse.Namespace, *, console: Console):
+    """
+    Handles the 'config' command by writing configurations in the `.turbocase` folder.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        console (Console): The rich console object.
+
+    Returns:
+        None
+    """
+
+    def get_project_id(project: Project, available_projects_ids: Dict[str, int]) -> int:
+        while True:
+            full_project_name = console.input(
+                f"[green]Enter the full project name of the [yellow]`{project.name}`[/yellow] App in Testiny: "
+            )
+
+            project_id = available_projects_ids.get(full_project_name)
+            if project_id:
+                console.print(
+                    f"[green]{SUCCESS_PREFIX} Project found with ID: [yellow]`{project_id}`[/yellow].\n"
+                )
+                return project_id
+
+            console.print(
+                f"[red]{FAILURE_PREFIX} No project found with the given name. Try again."
+            )
+
+    def get_api_key(args, console) -> str:
+        if args.backend == "local":
+            return "local"  # any API key is accepted
+        if args.env_var:
+            api_key = os.environ.get("TURBOCASE_API_KEY")
+            if api_key is None:
+                console.print(
+                    f"[red]{FAILURE_PREFIX} Environment variable [yellow]`TURBOCASE_API_KEY`[/yellow] not found. "
+                    "Please set the environment variable or remove [yellow]`--env-var`[/yellow] flag and try again."
                 )
                 exit(1)
         else:
             api_key = console.input("[green]Enter your Testiny API key: ")
         return api_key
 
+    def get_projects_names(args) -> Dict[str, str]:
+        projects_names = {}
+        if args.projects_file is not None:
+            with open(args.projects_file, "r") as projects_file:
+                for project, name in toml.load(projects_file).items():
+                    projects_names.update([parse_project_name(f"{project}={name}")])
+        projects_names.update(args.project_name)
+        return projects_names
+
     try:
         os.chdir(args.directory)
+        if args.backend == "local":
+            Testiny.use_backend(get_local_backend("."))
+
+        projects_names = get_projects_names(args)
+        is_interactive = not projects_names
+        if not is_interactive:
+            missing_projects = [
+                project.name
+                for project in Project
+                if project.name not in projects_names
+            ]
+            if missing_projects:
+                raise ValueError(
+                    f"Missing the project name of: [yellow]`{', '.join(missing_projects)}`[/yellow]"
+                )
+            args.env_var = True  # nothing can be entered in non-interactive mode
 
         api_key = get_api_key(args, console)
 
-        owner_user_id = Testiny.get_owner_user_id(api_key)
-
-        projects_ids = {
-            project.name: get_project_id(project, api_key) for project in Project
-        }
+        # a single listing of the projects resolves all names, along with the owner
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            owner_user_id_future = executor.submit(Testiny.get_owner_user_id, api_key)
+            available_projects_ids_future = executor.submit(
+                Testiny.get_projects_ids, api_key
+            )
+            owner_user_id = owner_user_id_future.result()
+            available_projects_ids = available_projects_ids_future.result()
+
+        if is_interactive:
+            projects_ids = {
+                project.name: get_project_id(project, available_projects_ids)
+                for project in Project
+            }
+        else:
+            unknown_names = [
+                name
+                for name in projects_names.values()
+                if name not in available_projects_ids
+            ]
+            if unknown_names:
+                raise ValueError(
+                    f"No project found with the name: [yellow]`{'`, `'.join(unknown_names)}`[/yellow]"
+                )
+            projects_ids = {
+                project.name: available_projects_ids[projects_names[project.name]]
+                for project in Project
+            }
 
         project_configurations = {
             "API_KEY": api_key,
             "OWNER_USER_ID": owner_user_id,
             **projects_ids,
         }
+        if args.backend != DEFAULT_BACKEND:
+            project_configurations["BACKEND"] = args.backend
+        if args.rate_limit is not None:
+            project_configurations["RATE_LIMIT"] = args.rate_limit
 
-        with open(".turbocase/project.toml", "w") as project_configuration_file:
-            toml.dump(project_configurations, project_configuration_file)
+        write_configuration_file(".turbocase/project.toml", project_configurations)
 
         console.rule("[cyan]Results", characters="═", style="cyan")
         console.print(f"[green]{SUCCESS_PREFIX} Successfully configured project.")
@@ -491,20 +1994,102 @@ def handle_config_command(args: argparse.Namespace, *, console: Console):
             f"[red]{FAILURE_PREFIX} Failed to configure project. Reason:\n[dark_orange]{e}"
         )
         print_error_hints(e, console=console)
+        exit(1)
+    finally:
+        Testiny.use_backend(None)  # the daemon serves other commands afterwards
+
+
+def add_daemon_command(subparsers: argparse._SubParsersAction):
+    """
+    Add the 'daemon' command to the subparsers.
+
+    Args:
+        subparsers (argparse._SubParsersAction): The subparsers object to add the command to.
+    """
+    daemon_parser = subparsers.add_parser(
+        "daemon",
+        help="Manage a background process that keeps the project warm between commands",
+        description="Manage a background process that keeps the configuration, schema, test files index "
+        "and HTTP connections warm. While it runs, `turbocase` commands are served by it.",
+        add_help=False,
+        formatter_class=RichHelpFormatter,
+    )
+
+    daemon_parser.add_argument(
+        "action",
+        choices=("start", "stop", "status"),
+        help="The action to perform. Choose from: start, stop, status.",
+        metavar="<action>",
+    )
+
+    daemon_parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help=HELP_MESSAGE,
+    )
+
+
+def handle_daemon_command(args: argparse.Namespace, *, console: Console):
+    """
+    Handles the 'daemon' command by starting, stopping or querying the daemon of the project.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments.
+        console (Console): The rich console object.
+
+    Returns:
+        None
+    """
+    turbocase_folder_path = get_turbocase_folder_path()
+    try:
+        if args.action == "start":
+            pid = daemon.start_daemon(turbocase_folder_path)
+            console.print(
+                f"[green]{SUCCESS_PREFIX} Daemon is running with PID: [yellow]`{pid}`[/yellow]."
+            )
+        elif args.action == "stop":
+            if daemon.stop_daemon(turbocase_folder_path):
+                console.print(f"[green]{SUCCESS_PREFIX} Daemon stopped.")
+            else:
+                console.print(f"{HINT_PREFIX} No daemon is running.")
+        elif args.action == "status":
+            status = daemon.get_daemon_status(turbocase_folder_path)
+            if status is None:
+                console.print(f"{HINT_PREFIX} No daemon is running.")
+            else:
+                console.print(
+                    f"[green]{SUCCESS_PREFIX} Daemon is running with PID: [yellow]`{status['pid']}`[/yellow] "
+                    f"(served [cyan]{status['served']}[/cyan] commands)."
+                )
+    except Exception as e:
+        console.print(
+            f"[red]{FAILURE_PREFIX} Failed to {args.action} the daemon. Reason:\n[dark_orange]{e}"
+        )
+        print_error_hints(e, console=console)
+        exit(1)
 
 
-def parse_args(parser: argparse.ArgumentParser):
+def parse_args(
+    parser: argparse.ArgumentParser,
+    argv: List[str] | None = None,
+    *,
+    console: Console | None = None,
+):
     """
     Parse the command line arguments and execute the corresponding command.
 
     Args:
         parser (argparse.ArgumentParser): The main argument parser object.
+        argv (List[str] | None): The arguments to parse. Default: `sys.argv[1:]`.
+        console (Console | None): The rich console object to print to. Default: a new console.
 
     Returns:
         None
     """
-    args = parser.parse_args()
-    console = Console()
+    args = parser.parse_args(argv)
+    if console is None:
+        console = Console()
 
     try:
         get_turbocase_folder_path()
@@ -514,6 +2099,67 @@ def parse_args(parser: argparse.ArgumentParser):
             print_error_hints(e, console=console)
             exit(1)
 
+    if args.profile is None:
+        dispatch_command(parser, args, console=console)
+        return
+
+    profile_path = os.path.abspath(
+        args.profile_output
+        or get_default_profile_path(args.profile, args.selected_command)
+    )
+    if args.profile == "cpu":
+        profiler = CpuProfiler()
+    else:
+        command_line = " ".join(sys.argv[1:] if argv is None else argv)
+        profiler = MemoryProfiler(
+            title=f"Memory profile of `turbocase {command_line}`",
+            interval=args.profile_interval,
+        )
+
+    # the profile is written even if the command fails or exits, whose outcome then propagates.
+    # It is reported on the standard error, keeping the standard output of `--output` machine-readable
+    profile_console = Console(stderr=True)
+    profiler.start()
+    try:
+        dispatch_command(parser, args, console=console)
+    finally:
+        profiler.stop()
+        try:
+            profiler.write(profile_path)
+            is_written = True
+        except OSError as e:
+            is_written = False
+            profile_console.print(
+                f"[red]{FAILURE_PREFIX} Failed to write the profile to [yellow]`{profile_path}`[/yellow]. "
+                f"Reason:\n[dark_orange]{e}"
+            )
+        else:
+            profile_console.print(
+                f"[green]{SUCCESS_PREFIX} Wrote the {'CPU' if args.profile == 'cpu' else 'memory'} profile to "
+                f"[yellow]`{profile_path}`[/yellow]."
+            )
+            if args.profile == "cpu":
+                profile_console.print(
+                    f"{HINT_PREFIX} Use [yellow]`python -m pstats {profile_path}`[/yellow] to browse it."
+                )
+    if not is_written:
+        exit(1)
+
+
+def dispatch_command(
+    parser: argparse.ArgumentParser, args: argparse.Namespace, *, console: Console
+):
+    """
+    Execute the command selected by the parsed command line arguments.
+
+    Args:
+        parser (argparse.ArgumentParser): The main argument parser object.
+        args (argparse.Namespace): The parsed command-line arguments.
+        console (Console): The rich console object.
+
+    Returns:
+        None
+    """
     if args.selected_command is None:
         print_banner()
         print()
@@ -524,8 +2170,11 @@ def parse_args(parser: argparse.ArgumentParser):
             handle_read_command(args, console=console)
 
     elif args.selected_command == "upsert":
-        with console.status("[bold green]Upserting test cases..."):
+        if args.output is not None or args.quiet:
             handle_upsert_command(args, console=console)
+        else:
+            with console.status("[bold green]Upserting test cases..."):
+                handle_upsert_command(args, console=console)
 
     elif args.selected_command == "init":
         handle_init_command(args, console=console)
@@ -536,8 +2185,50 @@ def parse_args(parser: argparse.ArgumentParser):
     elif args.selected_command == "config":
         handle_config_command(args, console=console)
 
+    elif args.selected_command == "daemon":
+        handle_daemon_command(args, console=console)
 
-def main():
+    elif args.selected_command == "flush":
+        with console.status("[bold green]Flushing the journal..."):
+            handle_flush_command(args, console=console)
+
+    elif args.selected_command == "validate":
+        handle_validate_command(args, console=console)
+
+    elif args.selected_command == "bundle":
+        with console.status("[bold green]Bundling test cases..."):
+            handle_bundle_command(args, console=console)
+
+    elif args.selected_command == "merge-reports":
+        handle_merge_reports_command(args, console=console)
+
+    elif args.selected_command == "results":
+        with console.status("[bold green]Uploading test results..."):
+            handle_results_command(args, console=console)
+
+    elif args.selected_command == "pull":
+        with console.status("[bold green]Pulling test cases..."):
+            handle_pull_command(args, console=console)
+
+    elif args.selected_command == "prune":
+        with console.status("[bold green]Pruning test cases..."):
+            handle_prune_command(args, console=console)
+
+    elif args.selected_command == "search":
+        handle_search_command(args, console=console)
+
+    elif args.selected_command == "dedupe":
+        with console.status("[bold green]Looking for similar titles..."):
+            handle_dedupe_command(args, console=console)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the main parser of the Turbo-Case CLI app with all of its commands.
+
+    Returns:
+        parser (argparse.ArgumentParser): The main parser object.
+    """
     parser, subparsers = create_main_and_sub_parsers()
 
     add_global_options(parser)
@@ -550,8 +2241,34 @@ def main():
 
     add_upsert_command(subparsers)
 
+    add_flush_command(subparsers)
+
+    add_validate_command(subparsers)
+
+    add_bundle_command(subparsers)
+
     add_read_command(subparsers)
 
+    add_pull_command(subparsers)
+
+    add_prune_command(subparsers)
+
+    add_results_command(subparsers)
+
+    add_search_command(subparsers)
+
+    add_dedupe_command(subparsers)
+
+    add_merge_reports_command(subparsers)
+
+    add_daemon_command(subparsers)
+
+    return parser
+
+
+def main():
+    parser = build_parser()
+
     try:
         parse_args(parser)
     except KeyboardInterrupt:
@@ -0,0 +1,115 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+OUTPUT_FORMATS = ("ndjson", "json", "junit")
+
+
+class ResultWriter(ABC):
+    """
+    Streams the result records of a command (see `reports.create_result`) to a file, one at a time.
+
+    Nothing is buffered beyond the current record, so memory stays constant regardless of the
+    number of results. Subclasses implement the formats of `--output`.
+    """
+
+    def __init__(self, file: TextIO):
+        self.file = file
+
+    def start(self) -> None:
+        """Write what precedes the first result."""
+
+    @abstractmethod
+    def write(self, result: Dict[str, Any]) -> None:
+        """
+        Write a single result.
+
+        Args:
+            result (Dict[str, Any]): The result.
+        """
+
+    def finish(self) -> None:
+        """Write what follows the last result."""
+
+    def _emit(self, text: str) -> None:
+        self.file.write(text)
+        self.file.flush()
+
+
+class NdjsonResultWriter(ResultWriter):
+    """Writes each result as a compact JSON object on its own line."""
+
+    def write(self, result: Dict[str, Any]) -> None:
+        self._emit(json.dumps(result, separators=(",", ":")) + "\n")
+
+
+class JsonResultWriter(ResultWriter):
+    """Writes the results as a single JSON array, element by element."""
+
+    def start(self) -> None:
+        self.__separator = ""
+        self._emit("[")
+
+    def write(self, result: Dict[str, Any]) -> None:
+        self._emit(self.__separator + json.dumps(result, separators=(",", ":")))
+        self.__separator = ",\n"
+
+    def finish(self) -> None:
+        self._emit("]\n")
+
+
+class JunitResultWriter(ResultWriter):
+    """Writes the results as a JUnit XML test suite, with one test case per result."""
+
+    def __init__(self, file: TextIO, suite_name: str):
+        super().__init__(file)
+        self.suite_name = suite_name
+
+    def start(self) -> None:
+        self._emit(
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            f"<testsuites>\n<testsuite name={quoteattr(self.suite_name)}>\n"
+        )
+
+    def write(self, result: Dict[str, Any]) -> None:
+        attributes = (
+            f"classname={quoteattr(result['app'])} name={quoteattr(result['title'])}"
+        )
+        if result.get("duration") is not None:
+            attributes += f' time="{result["duration"]:.3f}"'
+
+        if result["status"] == "success":
+            self._emit(f"<testcase {attributes}/>\n")
+        else:
+            self._emit(
+                f"<testcase {attributes}><failure message={quoteattr(result['error'])}>"
+                f"{escape(result['error'])}</failure></testcase>\n"
+            )
+
+    def finish(self) -> None:
+        self._emit("</testsuite>\n</testsuites>\n")
+
+
+def get_result_writer(output_format: str, file: TextIO, command: str) -> ResultWriter:
+    """
+    Get the result writer of an output format.
+
+    Args:
+        output_format (str): One of `OUTPUT_FORMATS`.
+        file (TextIO): The file to write to.
+        command (str): The name of the command (e.g. `upsert`), used as the JUnit suite name.
+
+    Returns:
+        ResultWriter: The result writer.
+
+    Raises:
+        ValueError: If the output format is not supported.
+    """
+    if output_format == "ndjson":
+        return NdjsonResultWriter(file)
+    if output_format == "json":
+        return JsonResultWriter(file)
+    if output_format == "junit":
+        return JunitResultWriter(file, f"turbocase {command}")
+    raise ValueError(f"Unsupported output format: {output_format}")
@@ -0,0 +1,176 @@
+from argparse import ArgumentTypeError
+from datetime import datetime
+from typing import List, Tuple
+import cProfile
+import threading
+import time
+import tracemalloc
+
+PROFILES = ("cpu", "mem")
+
+# The number of source lines listed in a memory profile
+TOP_ALLOCATIONS_N = 25
+
+
+def parse_interval(interval: str) -> float:
+    """
+    Parse a sampling interval, in seconds.
+
+    Args:
+        interval (str): The interval.
+
+    Returns:
+        float: The number of seconds.
+
+    Raises:
+        ArgumentTypeError: If the interval is not a positive number.
+    """
+    try:
+        seconds = float(interval)
+    except ValueError:
+        seconds = 0.0
+    if not 0 < seconds < float("inf"):
+        raise ArgumentTypeError(
+            f"invalid interval `{interval}`, expected a positive number of seconds"
+        )
+    return seconds
+
+
+def get_default_profile_path(profile: str, command: str | None) -> str:
+    """
+    Get the default path of the profile of a command.
+
+    Args:
+        profile (str): One of `PROFILES`.
+        command (str | None): The name of the command (e.g. `upsert`).
+
+    Returns:
+        str: The path, in the current directory (e.g. `turbocase-upsert-20240101-120000.pstats`).
+    """
+    extension = "pstats" if profile == "cpu" else "txt"
+    return f"turbocase-{command or 'help'}-{datetime.now():%Y%m%d-%H%M%S}.{extension}"
+
+
+class CpuProfiler:
+    """
+    Profiles the time spent per function with `cProfile`.
+    """
+
+    def __init__(self):
+        self.__profiler = cProfile.Profile()
+
+    def start(self) -> None:
+        """Start profiling the current thread."""
+        self.__profiler.enable()
+
+    def stop(self) -> None:
+        """Stop profiling."""
+        self.__profiler.disable()
+
+    def write(self, output_path: str) -> None:
+        """
+        Dump the statistics of the profile.
+
+        Args:
+            output_path (str): The path of the `.pstats` file to write (see the `pstats` module).
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        self.__profiler.dump_stats(output_path)
+
+
+def _format_size(size: int) -> str:
+    return f"{size / 1024 ** 2:.1f} MiB"
+
+
+class MemoryProfiler:
+    """
+    Profiles the allocations per source line with `tracemalloc`.
+
+    The top allocations are the ones still alive when profiling stops or, with a sampling interval,
+    the ones of the sample using the most memory. Each sample also records the current and peak memory.
+    """
+
+    def __init__(self, *, title: str = "Memory profile", interval: float | None = None):
+        """
+        Args:
+            title (str): The first line of the report.
+            interval (float | None): The time between samples, in seconds. Default: no samples.
+        """
+        self.title = title
+        self.interval = interval
+        self.__samples: List[Tuple[float, int, int]] = []
+        self.__largest_sample: Tuple[int, float, tracemalloc.Snapshot] | None = None
+        self.__stop_sampling = threading.Event()
+        self.__sampler: threading.Thread | None = None
+        self.__start_time = 0.0
+        self.__peak = 0
+        self.__snapshot: tracemalloc.Snapshot | None = None
+        self.__snapshot_label = "the end"
+
+    def __sample(self) -> None:
+        while not self.__stop_sampling.wait(self.interval):
+            current, peak = tracemalloc.get_traced_memory()
+            elapsed = time.monotonic() - self.__start_time
+            self.__samples.append((elapsed, current, peak))
+            if self.__largest_sample is None or current > self.__largest_sample[0]:
+                self.__largest_sample = (current, elapsed, tracemalloc.take_snapshot())
+
+    def start(self) -> None:
+        """Start tracing the allocations."""
+        self.__start_time = time.monotonic()
+        tracemalloc.start()
+        if self.interval is not None:
+            self.__sampler = threading.Thread(target=self.__sample, daemon=True)
+            self.__sampler.start()
+
+    def stop(self) -> None:
+        """Stop tracing the allocations, keeping what the report needs."""
+        self.__stop_sampling.set()
+        if self.__sampler is not None:
+            self.__sampler.join()
+        _, self.__peak = tracemalloc.get_traced_memory()
+        if self.__largest_sample is not None:
+            _, elapsed, self.__snapshot = self.__largest_sample
+            self.__snapshot_label = f"the largest sample, {elapsed:.2f} s"
+        else:
+            self.__snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+    def write(self, output_path: str) -> None:
+        """
+        Write the report of the profile.
+
+        Args:
+            output_path (str): The path of the text report to write.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        snapshot = self.__snapshot.filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        with open(output_path, "w", encoding="utf-8") as report_file:
+            report_file.write(
+                f"{self.title}\n\nPeak traced memory: {_format_size(self.__peak)}\n"
+            )
+            if self.__samples:
+                report_file.write(f"\nSamples (every {self.interval:g} s):\n")
+                for elapsed, current, sample_peak in self.__samples:
+                    report_file.write(
+                        f"  {elapsed:8.2f} s  current {_format_size(current):>10}  "
+                        f"peak {_format_size(sample_peak):>10}\n"
+                    )
+
+            statistics = snapshot.statistics("lineno")
+            report_file.write(
+                f"\nTop {min(TOP_ALLOCATIONS_N, len(statistics))} allocations "
+                f"(at {self.__snapshot_label}):\n"
+            )
+            for statistic in statistics[:TOP_ALLOCATIONS_N]:
+                frame = statistic.traceback[0]
+                report_file.write(
+                    f"  {_format_size(statistic.size):>10}  {statistic.count:>8} blocks  "
+                    f"{frame.filename}:{frame.lineno}\n"
+                )
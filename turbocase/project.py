@@ -0,0 +1,299 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Tuple
+import os
+from turbocase.enums import App, ConflictPolicy, Project, UpsertAction
+from turbocase.utility import (
+    NotTurboCaseProject,
+    get_project_id_from_config_file,
+    select_test_cases,
+)
+from turbocase.Testiny import Testiny
+
+DEFAULT_READ_CONCURRENCY = 4
+
+
+@dataclass
+class TestCaseResult:
+    """
+    Represents the outcome of an operation on a single local test case.
+
+    Attributes:
+        app (App): The app of the test case.
+        title (str): The title of the test case.
+        error (Exception | None): The error that occurred, if the operation failed.
+        action (UpsertAction | None): The action performed (or planned), for `upsert_many` and `plan`.
+        ids (Dict[Project, int]): The ID of the test case in each project, when known.
+        conflicts_n (int): The number of updates that conflicted with remote changes, for `upsert_many`.
+    """
+
+    app: App
+    title: str
+    error: Exception | None = None
+    action: UpsertAction | None = None
+    ids: Dict[Project, int] = field(default_factory=dict)
+    conflicts_n: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded."""
+        return self.error is None
+
+
+class TurboCaseProject:
+    """
+    A turbocase project, for use as a library instead of through the `turbocase` command.
+
+    Every call is independent of the current directory, and results are returned as data instead of
+    being printed.
+
+    Example:
+        project = TurboCaseProject("path/to/project")
+        results = project.upsert_many(project.select(App.WEB, select_all=True))
+    """
+
+    def __init__(self, project_path: str = "."):
+        """
+        Args:
+            project_path (str): The path to the project folder (containing `.turbocase`). Default: `.`.
+
+        Raises:
+            NotTurboCaseProject: If the folder is not a turbocase project.
+        """
+        self.project_path = os.path.abspath(project_path)
+        config_file_path = os.path.join(self.project_path, ".turbocase", "project.toml")
+        if not os.path.exists(config_file_path):
+            raise NotTurboCaseProject(
+                f"Could not find a `.turbocase` folder in `{self.project_path}`."
+            )
+
+    def select(
+        self,
+        app: App,
+        test_titles: List[str] | None = None,
+        *,
+        select_all: bool = False,
+        shard: Tuple[int, int] | None = None,
+    ) -> List[Tuple[App, str]]:
+        """
+        Select test cases of an app, as the `upsert` and `validate` commands do.
+
+        Args:
+            app (App): The app of the test cases.
+            test_titles (List[str] | None): The titles of the test cases.
+            select_all (bool): Whether to select all test cases of the app (and its sub-apps).
+            shard (Tuple[int, int] | None): Only select the test cases of this shard (1-based index, count).
+
+        Returns:
+            List[Tuple[App, str]]: The app and title of each selected test case.
+        """
+        return select_test_cases(
+            self.project_path,
+            app.value.name,
+            test_titles or [],
+            select_all=select_all,
+            shard=shard,
+        )
+
+    def get_project_id(self, project: Project) -> int:
+        """
+        Get the Testiny ID of a project.
+
+        Args:
+            project (Project): The project.
+
+        Returns:
+            int: The ID of the project.
+        """
+        return get_project_id_from_config_file(project, self.project_path)
+
+    def __load(
+        self, test_cases: List[Tuple[App, str]]
+    ) -> Tuple[List[TestCaseResult], Dict[Tuple[App, str], Dict[str, Any]]]:
+        results = []
+        contents = {}
+        for app, test_title in test_cases:
+            result = TestCaseResult(app, test_title)
+            try:
+                contents[(app, test_title)] = Testiny.load_test_case(
+                    test_title, app, self.project_path
+                )
+            except Exception as e:
+                result.error = e
+            results.append(result)
+        return results, contents
+
+    def validate(self, test_cases: List[Tuple[App, str]]) -> List[TestCaseResult]:
+        """
+        Validate test case files against the test case schema.
+
+        Args:
+            test_cases (List[Tuple[App, str]]): The app and title of each test case.
+
+        Returns:
+            List[TestCaseResult]: The result of each test case, in order.
+        """
+        results, _ = self.__load(test_cases)
+        return results
+
+    def plan(self, test_cases: List[Tuple[App, str]]) -> List[TestCaseResult]:
+        """
+        Find what `upsert_many` would do, without changing anything remotely.
+
+        A test case is planned for `CREATE` if it is missing from any project of its app,
+        otherwise for `UPDATE`. The IDs of the existing remote test cases are reported.
+
+        Args:
+            test_cases (List[Tuple[App, str]]): The app and title of each test case.
+
+        Returns:
+            List[TestCaseResult]: The result of each test case, in order.
+        """
+        results, _ = self.__load(test_cases)
+
+        titles_by_project: Dict[Project, List[str]] = {}
+        for result in results:
+            if result.ok:
+                for project in result.app.value.projects:
+                    titles_by_project.setdefault(project, []).append(result.title)
+
+        found_ids: Dict[Project, Dict[str, int]] = {}
+        for project, titles in titles_by_project.items():
+            project_id = self.get_project_id(project)
+            found_ids[project] = {}
+            for batch_start in range(0, len(titles), Testiny.DEFAULT_PAGE_SIZE):
+                found_ids[project].update(
+                    Testiny.find_test_cases_ids_by_titles(
+                        titles[batch_start : batch_start + Testiny.DEFAULT_PAGE_SIZE],
+                        project_id,
+                        self.project_path,
+                    )
+                )
+
+        for result in results:
+            if not result.ok:
+                continue
+            for project in result.app.value.projects:
+                test_case_id = found_ids[project].get(result.title)
+                if test_case_id is not None:
+                    result.ids[project] = test_case_id
+            result.action = (
+                UpsertAction.UPDATE
+                if len(result.ids) == len(result.app.value.projects)
+                else UpsertAction.CREATE
+            )
+        return results
+
+    def upsert_many(
+        self,
+        test_cases: List[Tuple[App, str]],
+        *,
+        batch_size: int = Testiny.DEFAULT_PAGE_SIZE,
+        conflict_policy: ConflictPolicy = ConflictPolicy.LOCAL_WINS,
+    ) -> List[TestCaseResult]:
+        """
+        Create or update test cases in all projects of their apps, with bulk requests.
+
+        Invalid test case files are reported and skipped. If the requests of an app fail,
+        all valid test cases of that app are reported with the error.
+
+        Args:
+            test_cases (List[Tuple[App, str]]): The app and title of each test case.
+            batch_size (int): The maximum number of test cases sent per request. Default: 100.
+            conflict_policy (ConflictPolicy): How to resolve updates of test cases changed remotely
+                in the meantime. Default: `LOCAL_WINS`.
+
+        Returns:
+            List[TestCaseResult]: The result of each test case, in order.
+        """
+        results, contents = self.__load(test_cases)
+
+        results_by_app: Dict[App, List[TestCaseResult]] = {}
+        for result in results:
+            if result.ok:
+                results_by_app.setdefault(result.app, []).append(result)
+
+        for app, app_results in results_by_app.items():
+            results_by_title = {result.title: result for result in app_results}
+
+            def count_conflict(test_title: str, test_case_id: int) -> None:
+                results_by_title[test_title].conflicts_n += 1
+
+            try:
+                upserted = Testiny.upsert_test_cases_in_bulk(
+                    [
+                        (result.title, contents[(app, result.title)])
+                        for result in app_results
+                    ],
+                    app,
+                    self.project_path,
+                    batch_size=batch_size,
+                    conflict_policy=conflict_policy,
+                    on_conflict=count_conflict,
+                )
+            except Exception as e:
+                for result in app_results:
+                    result.error = e
+                continue
+
+            for result in app_results:
+                action, ids = upserted[result.title]
+                result.action = action
+                result.ids = {project: test_case_id for test_case_id, project in ids}
+        return results
+
+    def read_many(
+        self,
+        test_cases_ids: List[int],
+        *,
+        concurrency: int = DEFAULT_READ_CONCURRENCY,
+    ) -> Dict[int, Dict[str, Any] | Exception]:
+        """
+        Read remote test cases by ID, with bounded concurrency.
+
+        Args:
+            test_cases_ids (List[int]): The IDs of the test cases.
+            concurrency (int): The maximum number of requests in flight. Default: 4.
+
+        Returns:
+            Dict[int, Dict[str, Any] | Exception]: By ID, the test case as returned by the API,
+                or the error that occurred while reading it.
+        """
+
+        def read(test_case_id: int) -> Dict[str, Any] | Exception:
+            try:
+                return Testiny.get_test_case(test_case_id, self.project_path)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            return dict(zip(test_cases_ids, executor.map(read, test_cases_ids)))
+
+    def iter_remote(
+        self,
+        project: Project,
+        *,
+        page_size: int = Testiny.DEFAULT_PAGE_SIZE,
+        fields: List[str] | None = None,
+        filter: Dict[str, Any] | None = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the remote test cases of a project, page by page.
+
+        Args:
+            project (Project): The project.
+            page_size (int): The number of test cases fetched per request. Default: 100.
+            fields (List[str] | None): Only keep these fields of each test case. Default: all fields.
+            filter (Dict[str, Any] | None): Extra filters of the `find` query (e.g. `{"title": "Login"}`).
+
+        Yields:
+            Dict[str, Any]: The test cases, in increasing ID order.
+        """
+        yield from Testiny.iter_test_cases(
+            self.get_project_id(project),
+            page_size=page_size,
+            fields=fields,
+            prefetch=True,
+            filter=filter,
+            project_path=self.project_path,
+        )
@@ -0,0 +1,167 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, List, Set, Tuple
+from turbocase.enums import App, Project
+from turbocase.utility import get_project_id_from_config_file, list_test_titles
+from turbocase.Testiny import Testiny
+
+# The maximum number of remote test cases deleted by a single prune, unless raised explicitly
+DEFAULT_MAX_DELETIONS = 50
+DEFAULT_PRUNE_CONCURRENCY = 4
+
+
+class TooManyDeletionsError(Exception):
+    """Raised when a prune would delete more test cases than its maximum."""
+
+    def __init__(self, deletions_n: int, max_deletions: int):
+        self.deletions_n = deletions_n
+        self.max_deletions = max_deletions
+        super().__init__(
+            f"Refusing to delete {deletions_n} test cases, more than the maximum of {max_deletions}"
+        )
+
+
+@dataclass
+class OrphanTestCase:
+    """
+    Represents a remote test case without a local test case file.
+
+    Attributes:
+        project (Project): The project of the test case.
+        id (int): The ID of the test case.
+        title (str): The title of the test case.
+        etag (str): The `_etag` of the test case when it was listed.
+    """
+
+    project: Project
+    id: int
+    title: str
+    etag: str
+
+
+@dataclass
+class PruneSummary:
+    """
+    Represents the outcome of a prune.
+
+    Attributes:
+        deleted (List[OrphanTestCase]): The deleted test cases.
+        errors (List[Tuple[List[OrphanTestCase], Exception]]): The batches of test cases that could not
+            be deleted, with the error.
+    """
+
+    deleted: List[OrphanTestCase] = field(default_factory=list)
+    errors: List[Tuple[List[OrphanTestCase], Exception]] = field(default_factory=list)
+
+
+def get_local_titles(project_path: str, project: Project) -> Set[str]:
+    """
+    Get the titles of the local test cases uploaded to a project.
+
+    Args:
+        project_path (str): The path to the project folder.
+        project (Project): The project.
+
+    Returns:
+        Set[str]: The titles of the test cases of all apps of the project (e.g. `app/mobile/ios`,
+            `app/mobile` and `app` for the `IOS` project).
+    """
+    return {
+        test_title
+        for app in App
+        if project in app.value.projects
+        for test_title in list_test_titles(project_path, app)
+    }
+
+
+def find_orphans(project_path: str, projects: List[Project]) -> List[OrphanTestCase]:
+    """
+    Find the remote test cases whose local test case file was deleted (or never existed).
+
+    The test cases of each project are listed page by page, and matched to the local test cases by title,
+    as in `upsert`.
+
+    Args:
+        project_path (str): The path to the project folder.
+        projects (List[Project]): The projects to look in.
+
+    Returns:
+        List[OrphanTestCase]: The remote test cases without a local file, ordered by project and ID.
+    """
+    orphans = []
+    for project in projects:
+        local_titles = get_local_titles(project_path, project)
+        project_id = get_project_id_from_config_file(project, project_path)
+        for test_case in Testiny.iter_test_cases(
+            project_id,
+            fields=["id", "title", "_etag"],
+            prefetch=True,
+            project_path=project_path,
+        ):
+            if test_case["title"] not in local_titles:
+                orphans.append(
+                    OrphanTestCase(
+                        project, test_case["id"], test_case["title"], test_case["_etag"]
+                    )
+                )
+    return orphans
+
+
+def prune_orphans(
+    orphans: List[OrphanTestCase],
+    project_path: str,
+    *,
+    max_deletions: int = DEFAULT_MAX_DELETIONS,
+    batch_size: int = Testiny.DEFAULT_PAGE_SIZE,
+    concurrency: int = DEFAULT_PRUNE_CONCURRENCY,
+    on_progress: Callable[[PruneSummary], None] | None = None,
+) -> PruneSummary:
+    """
+    Delete remote test cases, in bulk requests of `batch_size` test cases with at most `concurrency`
+    requests in flight.
+
+    A test case modified remotely since it was listed is not deleted: its whole batch fails.
+
+    Args:
+        orphans (List[OrphanTestCase]): The test cases to delete (see `find_orphans`).
+        project_path (str): The path to the project folder.
+        max_deletions (int): The maximum number of test cases deleted at once. Default: 50.
+        batch_size (int): The maximum number of test cases deleted per request. Default: 100.
+        concurrency (int): The maximum number of requests in flight. Default: 4.
+        on_progress (Callable[[PruneSummary], None] | None): Called after each batch.
+
+    Returns:
+        PruneSummary: The outcome of the prune.
+
+    Raises:
+        TooManyDeletionsError: If there are more test cases to delete than `max_deletions`.
+            Nothing is deleted then.
+    """
+    if len(orphans) > max_deletions:
+        raise TooManyDeletionsError(len(orphans), max_deletions)
+
+    summary = PruneSummary()
+    batches = [
+        orphans[batch_start : batch_start + batch_size]
+        for batch_start in range(0, len(orphans), batch_size)
+    ]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(
+                Testiny.delete_test_cases,
+                [(orphan.id, orphan.etag) for orphan in batch],
+                project_path,
+            ): batch
+            for batch in batches
+        }
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                summary.errors.append((batch, e))
+            else:
+                summary.deleted.extend(batch)
+            if on_progress is not None:
+                on_progress(summary)
+    return summary
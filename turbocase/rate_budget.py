@@ -0,0 +1,158 @@
+from argparse import ArgumentTypeError
+import fcntl
+import hashlib
+import os
+import struct
+import threading
+import time
+from typing import Dict, Tuple
+from turbocase.utility import (
+    NotTurboCaseProject,
+    get_turbocase_folder_path,
+    load_configuration_file,
+)
+
+RATE_BUDGETS_FOLDER_NAME = "rate-budgets"
+
+# The state of a budget file: the available tokens (negative when requests are waiting for theirs),
+# and the time they were counted at
+_STATE_FORMAT = "<dd"
+_STATE_SIZE = struct.calcsize(_STATE_FORMAT)
+
+# Rate budgets, keyed by file path and rate, so that the threads of a process share them.
+_rate_budgets_cache: Dict[Tuple[str, float], "RateBudget"] = {}
+
+
+class RateBudget:
+    """
+    A token bucket of API requests, shared by all processes of the host through a file locked with `flock`.
+
+    Each request takes a token, and tokens are refilled at `rate` per second, up to `burst`. A request
+    finding no token reserves the next one: the count goes negative and the request waits until its
+    token is refilled. Requests are thus served in turn, whatever process they come from, and together
+    never exceed the rate.
+    """
+
+    def __init__(self, file_path: str, rate: float, burst: float | None = None):
+        """
+        Args:
+            file_path (str): The path of the file holding the state of the budget (created if needed).
+            rate (float): The number of requests per second.
+            burst (float | None): The maximum number of requests sent at once after an idle period.
+                Default: one second of requests.
+        """
+        self.file_path = file_path
+        self.rate = rate
+        self.burst = max(1.0, rate) if burst is None else burst
+        # `flock` only excludes other processes, not the other threads of this one
+        self.__lock = threading.Lock()
+        self.__file_descriptor: int | None = None
+
+    def acquire(self) -> float:
+        """
+        Take a token, waiting for it if needed.
+
+        Returns:
+            float: The time waited, in seconds.
+        """
+        with self.__lock:
+            if self.__file_descriptor is None:
+                os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+                self.__file_descriptor = os.open(
+                    self.file_path, os.O_RDWR | os.O_CREAT, 0o600
+                )
+            file_descriptor = self.__file_descriptor
+
+            fcntl.flock(file_descriptor, fcntl.LOCK_EX)
+            try:
+                now = time.time()
+                state = os.pread(file_descriptor, _STATE_SIZE, 0)
+                if len(state) == _STATE_SIZE:
+                    tokens, counted_at = struct.unpack(_STATE_FORMAT, state)
+                    tokens = min(
+                        self.burst, tokens + max(0.0, now - counted_at) * self.rate
+                    )
+                else:
+                    tokens = self.burst  # a new budget
+                tokens -= 1
+                os.pwrite(file_descriptor, struct.pack(_STATE_FORMAT, tokens, now), 0)
+            finally:
+                fcntl.flock(file_descriptor, fcntl.LOCK_UN)
+
+        delay = max(0.0, -tokens / self.rate)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+def parse_rate_limit(rate_limit: str) -> float:
+    """
+    Parse a rate limit, in requests per second.
+
+    Args:
+        rate_limit (str): The rate limit.
+
+    Returns:
+        float: The number of requests per second.
+
+    Raises:
+        ArgumentTypeError: If the rate limit is not a positive number.
+    """
+    try:
+        rate = float(rate_limit)
+    except ValueError:
+        rate = 0.0
+    if not 0 < rate < float("inf"):
+        raise ArgumentTypeError(
+            f"invalid rate limit `{rate_limit}`, expected a positive number of requests per second"
+        )
+    return rate
+
+
+def get_rate_budget(project_path: str | None, api_key: str) -> RateBudget | None:
+    """
+    Get the rate budget of the API requests sent with an API key, as configured by the `RATE_LIMIT`
+    (requests per second) of a project.
+
+    The budget is stored in `.turbocase/rate-budgets/`, in a file named after a hash of the API key,
+    so that all processes using the same key split the rate between them.
+
+    Args:
+        project_path (str | None): The path to the project folder.
+            Default: the project containing the current directory.
+        api_key (str): The API key of the requests.
+
+    Returns:
+        RateBudget | None: The rate budget, or `None` if the requests are not limited (the default,
+            also used outside of projects).
+    """
+    try:
+        turbocase_folder_path = (
+            get_turbocase_folder_path()
+            if project_path is None
+            else os.path.join(project_path, ".turbocase")
+        )
+        configurations = load_configuration_file(
+            os.path.join(turbocase_folder_path, "project.toml")
+        )
+    except (NotTurboCaseProject, FileNotFoundError):
+        return None
+
+    rate_limit = configurations.get("RATE_LIMIT")
+    if not rate_limit:
+        return None
+
+    file_path = os.path.abspath(
+        os.path.join(
+            turbocase_folder_path,
+            RATE_BUDGETS_FOLDER_NAME,
+            hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16],
+        )
+    )
+    key = (file_path, float(rate_limit))
+    rate_budget = _rate_budgets_cache.get(key)
+    if rate_budget is None:
+        rate_budget = _rate_budgets_cache[key] = RateBudget(
+            file_path, float(rate_limit)
+        )
+    return rate_budget
@@ -0,0 +1,174 @@
+import json
+from typing import Any, Dict, List, Tuple
+
+REPORT_VERSION = 1
+
+
+def create_report(command: str, shard: Tuple[int, int] | None) -> Dict[str, Any]:
+    """
+    Create an empty result report of a command.
+
+    Reports written by the shards of a command can be combined with `merge_reports`.
+
+    Args:
+        command (str): The name of the command (e.g. `upsert`).
+        shard (Tuple[int, int] | None): The shard processed by the command, if any.
+
+    Returns:
+        Dict[str, Any]: The report.
+    """
+    return {
+        "version": REPORT_VERSION,
+        "command": command,
+        "shard": list(shard) if shard is not None else None,
+        "results": [],
+    }
+
+
+def create_result(
+    app_name: str,
+    test_title: str,
+    *,
+    error: Exception | None = None,
+    **details: Any,
+) -> Dict[str, Any]:
+    """
+    Create the result record of a single test case, as stored in reports and streamed by `--output`.
+
+    Args:
+        app_name (str): The name of the app of the test case.
+        test_title (str): The title of the test case.
+        error (Exception | None): The error that occurred, if the test case failed.
+        **details (Any): JSON-serializable details of the result (e.g. the IDs of the test case).
+
+    Returns:
+        Dict[str, Any]: The result.
+    """
+    return {
+        "app": app_name,
+        "title": test_title,
+        "status": "failure" if error is not None else "success",
+        "error": str(error) if error is not None else None,
+        **details,
+    }
+
+
+def add_result(
+    report: Dict[str, Any],
+    app_name: str,
+    test_title: str,
+    *,
+    error: Exception | None = None,
+    **details: Any,
+) -> Dict[str, Any]:
+    """
+    Add the result of a single test case to a report.
+
+    Args:
+        report (Dict[str, Any]): The report.
+        app_name (str): The name of the app of the test case.
+        test_title (str): The title of the test case.
+        error (Exception | None): The error that occurred, if the test case failed.
+        **details (Any): JSON-serializable details of the result (e.g. the IDs of the test case).
+
+    Returns:
+        Dict[str, Any]: The added result.
+    """
+    result = create_result(app_name, test_title, error=error, **details)
+    report["results"].append(result)
+    return result
+
+
+def count_successes(report: Dict[str, Any]) -> int:
+    """
+    Count the successful test cases of a report.
+
+    Args:
+        report (Dict[str, Any]): The report.
+
+    Returns:
+        int: The number of successful test cases.
+    """
+    return sum(result["status"] == "success" for result in report["results"])
+
+
+def write_report(report_path: str, report: Dict[str, Any]) -> None:
+    """
+    Write a report to a JSON file.
+
+    Args:
+        report_path (str): The path of the file.
+        report (Dict[str, Any]): The report.
+    """
+    with open(report_path, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=2)
+
+
+def load_report(report_path: str) -> Dict[str, Any]:
+    """
+    Load a report from a JSON file.
+
+    Args:
+        report_path (str): The path of the file.
+
+    Returns:
+        Dict[str, Any]: The report.
+
+    Raises:
+        ValueError: If the file is not a report of a supported version.
+    """
+    with open(report_path, "r", encoding="utf-8") as report_file:
+        report = json.load(report_file)
+
+    if not isinstance(report, dict) or report.get("version") != REPORT_VERSION:
+        raise ValueError(
+            f"[yellow]`{report_path}`[/yellow] is not a turbocase report (version {REPORT_VERSION})"
+        )
+    return report
+
+
+def merge_reports(reports: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Merge the reports written by the shards of a command into one report.
+
+    Args:
+        reports (List[Dict[str, Any]]): The reports of the shards.
+
+    Returns:
+        Tuple[Dict[str, Any], List[str]]: The merged report, and the missing shards (e.g. `["2/4"]`).
+
+    Raises:
+        ValueError: If the reports are of different commands or numbers of shards,
+            or if a shard is reported more than once.
+    """
+    if not reports:
+        raise ValueError("No reports to merge")
+
+    commands = {report["command"] for report in reports}
+    if len(commands) > 1:
+        raise ValueError(
+            f"Cannot merge reports of different commands: {', '.join(sorted(commands))}"
+        )
+
+    shards = [tuple(report["shard"]) for report in reports if report["shard"]]
+    shards_counts = {count for _, count in shards}
+    if len(shards_counts) > 1 or (shards and len(shards) != len(reports)):
+        raise ValueError("Cannot merge reports of different numbers of shards")
+    if len(set(shards)) != len(shards):
+        raise ValueError("Cannot merge reports of the same shard more than once")
+
+    missing_shards = []
+    if shards:
+        (count,) = shards_counts
+        reported_indexes = {index for index, _ in shards}
+        missing_shards = [
+            f"{index}/{count}"
+            for index in range(1, count + 1)
+            if index not in reported_indexes
+        ]
+
+    merged_report = create_report(commands.pop(), None)
+    for report in reports:
+        merged_report["results"].extend(report["results"])
+
+    return merged_report, missing_shards
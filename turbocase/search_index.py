@@ -0,0 +1,494 @@
+import json
+import math
+import os
+import re
+import unicodedata
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Tuple
+import yaml
+from turbocase.enums import App
+from turbocase.title_index import get_title_from_file_name
+from turbocase.utility import (
+    MULTI_DOCUMENT_SUFFIX,
+    Include,
+    TestCaseLoader,
+    get_documents_ranges,
+    get_multi_document_files,
+    get_test_files_index,
+    get_untitled_document_prefix,
+    open_atomically,
+    read_document,
+)
+
+SEARCH_INDEX_FILE_NAME = "search-index.json"
+SEARCH_INDEX_VERSION = 1
+
+# The searched fields, with the weight of a match in each field
+SEARCH_FIELDS = {
+    "title": 3.0,
+    "preconditions": 1.0,
+    "steps": 1.0,
+    "expected results": 1.0,
+}
+# Short names of the fields, for `field:term` queries
+SEARCH_FIELDS_ALIASES = {
+    "title": "title",
+    "preconditions": "preconditions",
+    "steps": "steps",
+    "expected": "expected results",
+}
+
+# The share of removed files above which the stored index is compacted
+MAX_REMOVED_RATIO = 0.25
+
+# BM25 parameters
+_K1 = 1.2
+_B = 0.75
+
+_TERM_PATTERN = re.compile(r"\w+")
+
+# The loaded search index of each project, kept across calls (see `turbocase daemon`)
+_search_index_cache: Dict[str, "SearchIndex"] = {}
+
+
+def get_terms(text: str) -> List[str]:
+    """
+    Split a text into search terms, folding case and Unicode forms.
+
+    Args:
+        text (str): The text.
+
+    Returns:
+        List[str]: The terms of the text, in order.
+    """
+    return _TERM_PATTERN.findall(unicodedata.normalize("NFKC", text).casefold())
+
+
+def get_fields_texts(test_title: str, test_case_content: Any) -> Dict[str, str]:
+    """
+    Get the text of each searched field of a test case.
+
+    Args:
+        test_title (str): The title of the test case.
+        test_case_content (Any): The loaded content of the test case file.
+
+    Returns:
+        Dict[str, str]: The text of each field (missing or malformed fields are empty).
+    """
+    fields_texts = {"title": test_title}
+    for field_name in SEARCH_FIELDS:
+        if field_name == "title":
+            continue
+        value = (
+            test_case_content.get(field_name)
+            if isinstance(test_case_content, dict)
+            else None
+        )
+        if isinstance(value, list):
+            value = "\n".join(
+                str(item)
+                for item in value
+                if item is not None and not isinstance(item, Include)
+            )
+        fields_texts[field_name] = value if isinstance(value, str) else ""
+    return fields_texts
+
+
+@dataclass
+class SearchResult:
+    """
+    Represents a test case matching a search query.
+
+    Attributes:
+        path (str): The path of the test case file, relative to the project folder.
+        title (str): The title of the test case.
+        score (float): The relevance of the test case to the query (higher is better).
+        fields (List[str]): The fields in which the query terms were found.
+    """
+
+    path: str
+    title: str
+    score: float
+    fields: List[str]
+
+
+class SearchIndex:
+    """
+    A full-text inverted index of the test case files of a project, stored in `.turbocase/search-index.json`.
+
+    The index is maintained incrementally: on each `refresh`, only the files added, removed or
+    modified (by modification time and size) since the last refresh are (re)indexed.
+
+    Test case files are numbered, and the postings of each term are flat lists of
+    `[file number, frequency, file number, frequency, ...]`, which keeps the stored index compact
+    and fast to load. Removed files are only dropped from the postings once they make up a large
+    share of the index.
+    """
+
+    def __init__(self, project_path: str | None):
+        """
+        Args:
+            project_path (str | None): The path to the project folder, or `None` for an empty in-memory index.
+        """
+        self.project_path = project_path
+        self.index_file_path = (
+            None
+            if project_path is None
+            else os.path.join(project_path, ".turbocase", SEARCH_INDEX_FILE_NAME)
+        )
+        # by file number: the path (None once removed), `[mtime_ns, size]`, title and field lengths
+        self.paths: List[str | None] = []
+        self.stats: List[List[int]] = []
+        self.titles: List[str] = []
+        self.lengths: List[List[int]] = []
+        # by field, then term: the flat postings of the term
+        self.postings: Dict[str, Dict[str, List[int]]] = {
+            field_name: {} for field_name in SEARCH_FIELDS
+        }
+
+        if self.index_file_path is not None and os.path.exists(self.index_file_path):
+            with open(self.index_file_path, "r", encoding="utf-8") as index_file:
+                index = json.load(index_file)
+            if index.get("version") == SEARCH_INDEX_VERSION:
+                self.paths = index["paths"]
+                self.stats = index["stats"]
+                self.titles = index["titles"]
+                self.lengths = index["lengths"]
+                self.postings = index["postings"]
+
+        self.numbers: Dict[str, int] = {
+            path: number for number, path in enumerate(self.paths) if path is not None
+        }
+        self.fields_lengths: List[int] = [
+            sum(self.lengths[number][i] for number in self.numbers.values())
+            for i in range(len(SEARCH_FIELDS))
+        ]
+
+    def __add(self, path: str, stat: os.stat_result) -> None:
+        title = get_title_from_file_name(os.path.basename(path))
+        try:
+            with open(
+                os.path.join(self.project_path, path), "r", encoding="utf-8"
+            ) as file:
+                test_case_content = yaml.load(file, Loader=TestCaseLoader)
+        except (OSError, yaml.YAMLError):
+            test_case_content = None  # still searchable by title
+        self.__index(path, [stat.st_mtime_ns, stat.st_size], title, test_case_content)
+
+    def __index(
+        self, path: str, stats: List[int], title: str, test_case_content: Any
+    ) -> None:
+        number = len(self.paths)
+        lengths = []
+        for i, (field_name, text) in enumerate(
+            get_fields_texts(title, test_case_content).items()
+        ):
+            field_terms: Dict[str, int] = {}
+            for term in get_terms(text):
+                field_terms[term] = field_terms.get(term, 0) + 1
+            field_postings = self.postings[field_name]
+            for term, frequency in field_terms.items():
+                term_postings = field_postings.get(term)
+                if term_postings is None:
+                    field_postings[term] = [number, frequency]
+                else:
+                    term_postings += (number, frequency)
+            lengths.append(sum(field_terms.values()))
+            self.fields_lengths[i] += lengths[-1]
+
+        self.paths.append(path)
+        self.stats.append(stats)
+        self.titles.append(title)
+        self.lengths.append(lengths)
+        self.numbers[path] = number
+
+    @classmethod
+    def from_bundle(cls, bundle: Iterable[Dict[str, Any]]) -> "SearchIndex":
+        """
+        Build an in-memory index of the test cases of a bundle (see `turbocase.bundle`).
+
+        No YAML is parsed and nothing is stored: the index is neither refreshed nor saved.
+
+        Args:
+            bundle (Iterable[Dict[str, Any]]): The records of the bundle.
+
+        Returns:
+            SearchIndex: The search index.
+        """
+        search_index = cls(None)
+        for record in bundle:
+            if record["path"].endswith(MULTI_DOCUMENT_SUFFIX):
+                record["path"] = f"{record['path']}#{record['title']}"
+            search_index.__index(
+                record["path"], [0, 0], record["title"], record["content"]
+            )
+        return search_index
+
+    def __remove(self, path: str) -> None:
+        # the postings of removed files are only dropped by `__compact`
+        number = self.numbers.pop(path)
+        self.paths[number] = None
+        for i, length in enumerate(self.lengths[number]):
+            self.fields_lengths[i] -= length
+
+    def refresh(self) -> int:
+        """
+        Bring the index up to date with the test case files, and save it if it changed.
+
+        Returns:
+            int: The number of files (re)indexed or removed.
+        """
+        _, files_index = get_test_files_index(self.project_path)
+        project_folder_path = os.path.join(os.path.abspath(self.project_path), "")
+
+        current_paths = set()
+        added_paths: List[Tuple[str, os.stat_result]] = []
+        removed_paths: List[str] = []
+        for file_name, folders_paths in files_index.items():
+            if get_title_from_file_name(file_name) is None:
+                continue
+            for folder_path in folders_paths:
+                file_path = f"{folder_path}{os.sep}{file_name}"
+                path = file_path[len(project_folder_path) :]
+                try:
+                    stat = os.stat(file_path)
+                except FileNotFoundError:
+                    continue
+                current_paths.add(path)
+                number = self.numbers.get(path)
+                if number is not None:
+                    if self.stats[number] == [stat.st_mtime_ns, stat.st_size]:
+                        continue
+                    removed_paths.append(path)
+                added_paths.append((path, stat))
+
+        # each document of a multi-document file is indexed as `<file path>#<title>`
+        added_documents: List[Tuple[str, os.stat_result, str, str]] = []
+        for files_paths in get_multi_document_files(self.project_path).values():
+            for file_path in files_paths:
+                try:
+                    stat = os.stat(file_path)
+                    documents_ranges = get_documents_ranges(file_path)
+                except FileNotFoundError:
+                    continue
+                untitled_prefix = get_untitled_document_prefix(file_path)
+                for title in documents_ranges:
+                    if title.startswith(untitled_prefix):
+                        continue
+                    path = f"{file_path[len(project_folder_path) :]}#{title}"
+                    current_paths.add(path)
+                    number = self.numbers.get(path)
+                    if number is not None:
+                        if self.stats[number] == [stat.st_mtime_ns, stat.st_size]:
+                            continue
+                        removed_paths.append(path)
+                    added_documents.append((path, stat, file_path, title))
+
+        removed_paths.extend(path for path in self.numbers if path not in current_paths)
+        for path in removed_paths:
+            self.__remove(path)
+        for path, stat in added_paths:
+            self.__add(path, stat)
+        for path, stat, file_path, title in added_documents:
+            try:
+                test_case_content = read_document(file_path, title)
+            except (OSError, KeyError, ValueError, yaml.YAMLError):
+                test_case_content = None  # still searchable by title
+            self.__index(
+                path, [stat.st_mtime_ns, stat.st_size], title, test_case_content
+            )
+
+        changes_n = len(added_paths) + len(added_documents) + len(removed_paths)
+        if changes_n:
+            self.save()
+        return changes_n
+
+    def __compact(self) -> None:
+        """Renumber the files, dropping the postings of the removed ones."""
+        new_numbers = {}
+        for number, path in enumerate(self.paths):
+            if path is not None:
+                new_numbers[number] = len(new_numbers)
+
+        for field_postings in self.postings.values():
+            for term in list(field_postings):
+                term_postings = field_postings[term]
+                kept_postings = []
+                for j in range(0, len(term_postings), 2):
+                    new_number = new_numbers.get(term_postings[j])
+                    if new_number is not None:
+                        kept_postings += (new_number, term_postings[j + 1])
+                if kept_postings:
+                    field_postings[term] = kept_postings
+                else:
+                    del field_postings[term]
+
+        kept_numbers = list(new_numbers)
+        self.paths = [self.paths[number] for number in kept_numbers]
+        self.stats = [self.stats[number] for number in kept_numbers]
+        self.titles = [self.titles[number] for number in kept_numbers]
+        self.lengths = [self.lengths[number] for number in kept_numbers]
+        self.numbers = {path: number for number, path in enumerate(self.paths)}
+
+    def save(self) -> None:
+        """Write the index atomically, compacting it first if many files were removed."""
+        if len(self.paths) - len(self.numbers) > MAX_REMOVED_RATIO * len(self.paths):
+            self.__compact()
+        with open_atomically(self.index_file_path, encoding="utf-8") as temporary_file:
+            # `dumps` uses the C encoder, unlike `dump`
+            temporary_file.write(
+                json.dumps(
+                    {
+                        "version": SEARCH_INDEX_VERSION,
+                        "paths": self.paths,
+                        "stats": self.stats,
+                        "titles": self.titles,
+                        "lengths": self.lengths,
+                        "postings": self.postings,
+                    },
+                    separators=(",", ":"),
+                    ensure_ascii=False,
+                )
+            )
+
+    def search(
+        self,
+        query: str,
+        *,
+        fields: List[str] | None = None,
+        app: App | None = None,
+        limit: int | None = None,
+    ) -> List[SearchResult]:
+        """
+        Find the test cases containing all terms of a query, ranked by relevance (BM25).
+
+        A term can be restricted to a field with `field:term` (e.g. `steps:refund`), where the field is
+        one of `title`, `preconditions`, `steps` or `expected`.
+
+        Args:
+            query (str): The query.
+            fields (List[str] | None): The fields searched by unrestricted terms. Default: all fields.
+            app (App | None): Only return the test cases of this app (including its sub-apps). Default: all apps.
+            limit (int | None): The maximum number of results. Default: no limit.
+
+        Returns:
+            List[SearchResult]: The matching test cases, most relevant first.
+
+        Raises:
+            ValueError: If a field is unknown.
+        """
+        default_fields = fields or list(SEARCH_FIELDS)
+        for field_name in default_fields:
+            if field_name not in SEARCH_FIELDS:
+                raise ValueError(f"Unknown search field: `{field_name}`")
+
+        query_terms: List[Tuple[str, List[str]]] = []
+        for word in query.split():
+            field_alias, separator, text = word.partition(":")
+            if separator and field_alias.casefold() in SEARCH_FIELDS_ALIASES:
+                terms_fields = [SEARCH_FIELDS_ALIASES[field_alias.casefold()]]
+            elif separator and not field_alias:
+                raise ValueError(f"Missing the field of: `{word}`")
+            else:
+                terms_fields, text = default_fields, word
+            query_terms.extend((term, terms_fields) for term in get_terms(text))
+        if not query_terms or not self.numbers:
+            return []
+
+        # the rarest terms first, so that the candidates shrink as early as possible
+        query_terms.sort(
+            key=lambda query_term: sum(
+                len(self.postings[field_name].get(query_term[0], ()))
+                for field_name in query_term[1]
+            )
+        )
+
+        app_path_prefix = None if app is None else app.value.path + os.sep
+        fields_numbers = {field_name: i for i, field_name in enumerate(SEARCH_FIELDS)}
+        documents_n = len(self.numbers)
+        scores: Dict[int, float] | None = None
+        matched_fields: Dict[int, set] = {}
+
+        for term, terms_fields in query_terms:
+            term_scores: Dict[int, float] = {}
+            for field_name in terms_fields:
+                term_postings = self.postings[field_name].get(term)
+                if not term_postings:
+                    continue
+                i = fields_numbers[field_name]
+                files_n = len(term_postings) // 2
+                idf = math.log(1 + (documents_n - files_n + 0.5) / (files_n + 0.5))
+                weighted_idf = SEARCH_FIELDS[field_name] * idf
+                length_ratio = _B / ((self.fields_lengths[i] / documents_n) or 1)
+                for j in range(0, len(term_postings), 2):
+                    number = term_postings[j]
+                    if scores is not None and number not in scores:
+                        continue  # already missing an earlier term
+                    path = self.paths[number]
+                    if path is None or (
+                        app_path_prefix is not None
+                        and not path.startswith(app_path_prefix)
+                    ):
+                        continue
+                    frequency = term_postings[j + 1]
+                    normalization = _K1 * (
+                        1 - _B + length_ratio * self.lengths[number][i]
+                    )
+                    term_scores[number] = term_scores.get(number, 0.0) + (
+                        weighted_idf
+                        * frequency
+                        * (_K1 + 1)
+                        / (frequency + normalization)
+                    )
+                    matched_fields.setdefault(number, set()).add(field_name)
+
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    number: score + term_scores[number]
+                    for number, score in scores.items()
+                    if number in term_scores
+                }
+            if not scores:
+                return []
+
+        ranked_numbers = sorted(
+            scores, key=lambda number: (-scores[number], self.paths[number])
+        )
+        if limit is not None:
+            ranked_numbers = ranked_numbers[:limit]
+        return [
+            SearchResult(
+                self.paths[number],
+                self.titles[number],
+                scores[number],
+                [
+                    field_name
+                    for field_name in SEARCH_FIELDS
+                    if field_name in matched_fields[number]
+                ],
+            )
+            for number in ranked_numbers
+        ]
+
+
+def get_search_index(project_path: str) -> SearchIndex:
+    """
+    Get the up-to-date search index of a project.
+
+    The index is loaded from `.turbocase` once per process, then refreshed incrementally on each call.
+
+    Args:
+        project_path (str): The path to the project folder.
+
+    Returns:
+        SearchIndex: The search index.
+    """
+    cache_key = os.path.abspath(project_path)
+    search_index = _search_index_cache.get(cache_key)
+    if search_index is None:
+        search_index = SearchIndex(cache_key)
+        _search_index_cache[cache_key] = search_index
+    search_index.refresh()
+    return search_index
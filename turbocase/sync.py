@@ -0,0 +1,314 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+import yaml
+from turbocase.enums import App, Project
+from turbocase.utility import (
+    TestCaseLoader,
+    find_document,
+    get_project_id_from_config_file,
+    includes_fragments,
+    open_atomically,
+    resolve_fragments,
+)
+from turbocase.Testiny import Testiny
+
+SYNC_STATE_FILE_NAME = "sync-state.json"
+SYNC_STATE_VERSION = 1
+
+# The fields of remote test cases needed to pull them
+_PULLED_FIELDS = [
+    "id",
+    "title",
+    "_etag",
+    "precondition_text",
+    "steps_text",
+    "expected_result_text",
+]
+
+
+def get_content_hash(text: str) -> str:
+    """
+    Get the hash of the content of a test case file.
+
+    Args:
+        text (str): The content of the file.
+
+    Returns:
+        str: The SHA-256 hash of the content.
+    """
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def get_test_case_content(test_case: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Convert a remote test case to the content of a test case file (the reverse of an upsert).
+
+    Args:
+        test_case (Dict[str, Any]): The test case, as returned by the API.
+
+    Returns:
+        Dict[str, List[str]]: The content of the test case file.
+    """
+    split_lines = lambda text: (text or "").split("\n")
+    return {
+        "preconditions": split_lines(test_case.get("precondition_text")),
+        "steps": split_lines(test_case.get("steps_text")),
+        "expected results": split_lines(test_case.get("expected_result_text")),
+    }
+
+
+def dump_test_case_content(test_case_content: Dict[str, Any]) -> str:
+    """
+    Format the content of a test case file as YAML.
+
+    Args:
+        test_case_content (Dict[str, Any]): The content of the test case file.
+
+    Returns:
+        str: The YAML text of the file.
+    """
+    return yaml.safe_dump(
+        test_case_content, sort_keys=False, allow_unicode=True, width=float("inf")
+    )
+
+
+class SyncState:
+    """
+    The state of the last pull of a project, stored in `.turbocase/sync-state.json`.
+
+    For each pulled remote test case, the state records the local file it was written to,
+    its `_etag` (the remote high-water mark) and the hash of the local file as written.
+    Comparing them with the current ones tells which side changed since the last sync.
+    """
+
+    def __init__(self, project_path: str):
+        self.state_file_path = os.path.join(
+            project_path, ".turbocase", SYNC_STATE_FILE_NAME
+        )
+        self.test_cases: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(self.state_file_path):
+            with open(self.state_file_path, "r", encoding="utf-8") as state_file:
+                state = json.load(state_file)
+            if state.get("version") == SYNC_STATE_VERSION:
+                self.test_cases = state["test_cases"]
+
+    @staticmethod
+    def __get_key(project: Project, test_case_id: int) -> str:
+        return f"{project.name}:{test_case_id}"
+
+    def get(self, project: Project, test_case_id: int) -> Dict[str, Any] | None:
+        """
+        Get the state of a remote test case.
+
+        Args:
+            project (Project): The project of the test case.
+            test_case_id (int): The ID of the test case.
+
+        Returns:
+            Dict[str, Any] | None: The `path`, `etag` and `hash` of the last sync, if any.
+        """
+        return self.test_cases.get(self.__get_key(project, test_case_id))
+
+    def set(
+        self,
+        project: Project,
+        test_case_id: int,
+        path: str,
+        etag: str,
+        content_hash: str,
+    ) -> None:
+        """
+        Record the sync of a remote test case.
+
+        Args:
+            project (Project): The project of the test case.
+            test_case_id (int): The ID of the test case.
+            path (str): The path of the local file, relative to the project folder.
+            etag (str): The `_etag` of the remote test case.
+            content_hash (str): The hash of the local file.
+        """
+        self.test_cases[self.__get_key(project, test_case_id)] = {
+            "path": path,
+            "etag": etag,
+            "hash": content_hash,
+        }
+
+    def save(self) -> None:
+        """Write the state atomically."""
+        with open_atomically(
+            self.state_file_path, encoding="utf-8", fsync=True
+        ) as temporary_file:
+            json.dump(
+                {"version": SYNC_STATE_VERSION, "test_cases": self.test_cases},
+                temporary_file,
+                separators=(",", ":"),
+            )
+
+
+@dataclass
+class PullSummary:
+    """
+    Represents the outcome of a pull.
+
+    Attributes:
+        created_paths (List[str]): The local files created for new remote test cases.
+        updated_paths (List[str]): The local files rewritten with remote changes.
+        conflicts (List[Tuple[str, int, Project]]): The local files changed on both sides, with the
+            ID and project of the remote test case. They are left untouched.
+        unchanged_n (int): The number of remote test cases not modified since the last pull.
+        errors (List[Tuple[int, Project, Exception]]): The remote test cases that could not be pulled.
+    """
+
+    created_paths: List[str] = field(default_factory=list)
+    updated_paths: List[str] = field(default_factory=list)
+    conflicts: List[Tuple[str, int, Project]] = field(default_factory=list)
+    unchanged_n: int = 0
+    errors: List[Tuple[int, Project, Exception]] = field(default_factory=list)
+
+
+def get_local_path(project_path: str, project: Project, test_title: str) -> str:
+    """
+    Get the local file of a remote test case, relative to the project folder.
+
+    The file is looked up by title in the folders of the apps of the project, most specific app first
+    (e.g. `app/mobile/ios`, then `app/mobile`, then `app` for the `IOS` project). A new file goes to
+    the folder of the app of the project only.
+
+    Args:
+        project_path (str): The path to the project folder.
+        project (Project): The project of the test case.
+        test_title (str): The title of the test case.
+
+    Returns:
+        str: The path of the file.
+
+    Raises:
+        ValueError: If the title contains a path separator, or if the test case is a document of a
+            multi-document file (which is not rewritten by pulls).
+    """
+    if os.sep in test_title or (os.altsep and os.altsep in test_title):
+        raise ValueError(f"Title cannot be used as a file name: `{test_title}`")
+
+    apps = sorted(
+        (app for app in App if project in app.value.projects),
+        key=lambda app: len(app.value.projects),
+    )
+    for app in apps:
+        path = os.path.join(app.value.path, f"{test_title}.yaml")
+        if os.path.exists(os.path.join(project_path, path)):
+            return path
+        document_file_path = find_document(project_path, app, test_title)
+        if document_file_path is not None:
+            raise ValueError(
+                f"Test case is a document of `{os.path.relpath(document_file_path, project_path)}`, "
+                "which is not updated by pulls"
+            )
+    return os.path.join(apps[0].value.path, f"{test_title}.yaml")
+
+
+def _write_file_atomically(file_path: str, text: str) -> None:
+    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    with open_atomically(file_path, encoding="utf-8") as temporary_file:
+        temporary_file.write(text)
+
+
+def _pull_test_case(
+    project_path: str,
+    project: Project,
+    test_case: Dict[str, Any],
+    state: SyncState,
+    summary: PullSummary,
+) -> None:
+    test_case_id = test_case["id"]
+    synced = state.get(project, test_case_id)
+    if synced is not None and synced["etag"] == test_case["_etag"]:
+        summary.unchanged_n += 1
+        return
+
+    path = (
+        synced["path"]
+        if synced is not None
+        else get_local_path(project_path, project, test_case["title"])
+    )
+    file_path = os.path.join(project_path, path)
+    remote_text = dump_test_case_content(get_test_case_content(test_case))
+    remote_hash = get_content_hash(remote_text)
+
+    local_text = None
+    if os.path.exists(file_path):
+        with open(file_path, "r", encoding="utf-8") as file:
+            local_text = file.read()
+
+    uses_fragments = False
+    if local_text is not None:
+        local_hash = get_content_hash(local_text)
+        local_content = yaml.load(local_text, Loader=TestCaseLoader)
+        uses_fragments = includes_fragments(local_content)
+        is_same_content = local_hash == remote_hash or resolve_fragments(
+            local_content, project_path
+        ) == yaml.safe_load(remote_text)
+        if is_same_content:
+            # e.g. the remote change was an upsert of the local file
+            state.set(project, test_case_id, path, test_case["_etag"], local_hash)
+            summary.unchanged_n += 1
+            return
+        if synced is None or synced["hash"] != local_hash:
+            summary.conflicts.append((path, test_case_id, project))
+            return
+
+    if uses_fragments:
+        raise ValueError(
+            f"`{path}` includes shared fragments, which would be lost by rewriting it"
+        )
+
+    _write_file_atomically(file_path, remote_text)
+    state.set(project, test_case_id, path, test_case["_etag"], remote_hash)
+    (summary.created_paths if local_text is None else summary.updated_paths).append(
+        path
+    )
+
+
+def pull_test_cases(
+    project_path: str,
+    projects: List[Project],
+    *,
+    on_progress: Callable[[PullSummary], None] | None = None,
+) -> PullSummary:
+    """
+    Pull the remote test cases modified since the last pull into the local test case files.
+
+    Remote test cases whose `_etag` is the one of the last pull are skipped. A modified test case is
+    written to its file only if the file did not change locally since the last pull, otherwise it is
+    reported as a conflict. Files whose content would not change are never rewritten.
+
+    Args:
+        project_path (str): The path to the project folder.
+        projects (List[Project]): The projects to pull from.
+        on_progress (Callable[[PullSummary], None] | None): Called after each remote test case.
+
+    Returns:
+        PullSummary: The outcome of the pull.
+    """
+    state = SyncState(project_path)
+    summary = PullSummary()
+    try:
+        for project in projects:
+            project_id = get_project_id_from_config_file(project, project_path)
+            for test_case in Testiny.iter_test_cases(
+                project_id,
+                fields=_PULLED_FIELDS,
+                prefetch=True,
+                project_path=project_path,
+            ):
+                try:
+                    _pull_test_case(project_path, project, test_case, state, summary)
+                except Exception as e:
+                    summary.errors.append((test_case["id"], project, e))
+                if on_progress is not None:
+                    on_progress(summary)
+    finally:
+        state.save()
+    return summary
@@ -0,0 +1,327 @@
+import math
+import os
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Set, Tuple
+from turbocase.utility import (
+    MULTI_DOCUMENT_SUFFIX,
+    get_documents_ranges,
+    get_multi_document_files,
+    get_test_files_index,
+    get_untitled_document_prefix,
+)
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a test case title for comparison, by folding case, Unicode forms and whitespace.
+
+    Args:
+        title (str): The title to normalize.
+
+    Returns:
+        str: The normalized title (e.g. `"Payment  Gateway Works "` -> `"payment gateway works"`).
+    """
+    title = unicodedata.normalize("NFKC", title).casefold()
+    return _WHITESPACE_PATTERN.sub(" ", title).strip()
+
+
+def get_trigrams(normalized_title: str) -> Set[str]:
+    """
+    Get the character trigrams of a normalized title (padded, so that short titles have trigrams).
+
+    Args:
+        normalized_title (str): The normalized title.
+
+    Returns:
+        Set[str]: The trigrams of the title.
+    """
+    padded_title = f"  {normalized_title} "
+    return {padded_title[i : i + 3] for i in range(len(padded_title) - 2)}
+
+
+@dataclass
+class TitleEntry:
+    """
+    Represents an indexed test case title.
+
+    Attributes:
+        title (str): The original title.
+        location (str): Where the title comes from (a local file path or a remote project and ID).
+        normalized_title (str): The normalized title.
+        trigrams (Set[str]): The trigrams of the normalized title.
+    """
+
+    title: str
+    location: str
+    normalized_title: str = field(init=False)
+    trigrams: Set[str] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.normalized_title = normalize_title(self.title)
+        self.trigrams = get_trigrams(self.normalized_title)
+
+
+class TitleIndex:
+    """
+    An index of test case titles supporting fast near-duplicate lookups.
+
+    Titles are compared by the Jaccard similarity of the trigrams of their normalized forms.
+    An inverted index from trigrams to entries restricts comparisons to titles sharing trigrams.
+    """
+
+    def __init__(self, entries: Iterable[TitleEntry] = ()):
+        self.entries: List[TitleEntry] = []
+        self.__postings: Dict[str, List[int]] = {}
+        for entry in entries:
+            self.add(entry)
+
+    def add(self, entry: TitleEntry) -> None:
+        """
+        Add a title to the index.
+
+        Args:
+            entry (TitleEntry): The title to add.
+        """
+        entry_id = len(self.entries)
+        self.entries.append(entry)
+        for trigram in entry.trigrams:
+            self.__postings.setdefault(trigram, []).append(entry_id)
+
+    def __find_similar_ids(
+        self, trigrams: Set[str], threshold: float
+    ) -> List[Tuple[int, float]]:
+        shared_counts: Dict[int, int] = {}
+        for trigram in trigrams:
+            for entry_id in self.__postings.get(trigram, ()):
+                shared_counts[entry_id] = shared_counts.get(entry_id, 0) + 1
+
+        similar_ids = []
+        for entry_id, shared_count in shared_counts.items():
+            union_count = (
+                len(trigrams) + len(self.entries[entry_id].trigrams) - shared_count
+            )
+            similarity = shared_count / union_count
+            if similarity >= threshold:
+                similar_ids.append((entry_id, similarity))
+        return similar_ids
+
+    def find_similar(
+        self, title: str, threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ) -> List[Tuple[TitleEntry, float]]:
+        """
+        Find the indexed titles similar to a title, including titles that are equal once normalized.
+
+        Args:
+            title (str): The title to look up.
+            threshold (float): The minimum similarity (between 0 and 1) of a match. Default: 0.8.
+
+        Returns:
+            List[Tuple[TitleEntry, float]]: The matches and their similarities, most similar first.
+        """
+        trigrams = get_trigrams(normalize_title(title))
+        matches = [
+            (self.entries[entry_id], similarity)
+            for entry_id, similarity in self.__find_similar_ids(trigrams, threshold)
+        ]
+        return sorted(matches, key=lambda match: match[1], reverse=True)
+
+    def find_near_duplicates(
+        self, title: str, threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ) -> List[Tuple[TitleEntry, float]]:
+        """
+        Find the indexed titles similar to a title, but not exactly equal to it.
+
+        Args:
+            title (str): The title to look up.
+            threshold (float): The minimum similarity (between 0 and 1) of a match. Default: 0.8.
+
+        Returns:
+            List[Tuple[TitleEntry, float]]: The matches and their similarities, most similar first.
+        """
+        return [
+            (entry, similarity)
+            for entry, similarity in self.find_similar(title, threshold)
+            if entry.title != title
+        ]
+
+    def find_clusters(
+        self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ) -> List[List[TitleEntry]]:
+        """
+        Group the indexed titles into clusters of (transitively) similar titles.
+
+        Args:
+            threshold (float): The minimum similarity (between 0 and 1) of two titles of a cluster. Default: 0.8.
+
+        Returns:
+            List[List[TitleEntry]]: The clusters having more than one title, largest first.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("Similarity threshold must be between 0 (exclusive) and 1")
+
+        parents = list(range(len(self.entries)))
+
+        def find_root(entry_id: int) -> int:
+            while parents[entry_id] != entry_id:
+                parents[entry_id] = parents[parents[entry_id]]
+                entry_id = parents[entry_id]
+            return entry_id
+
+        # PPJoin: with the trigrams of each title sorted rarest first, two titles can only
+        # reach the threshold if they share a trigram within their (short) prefixes, and
+        # a candidate is dropped as soon as its remaining trigrams cannot reach the overlap.
+        frequencies: Dict[str, int] = {}
+        for entry in self.entries:
+            for trigram in entry.trigrams:
+                frequencies[trigram] = frequencies.get(trigram, 0) + 1
+
+        # postings of indexed prefixes: (entry ID, size, position), sizes in increasing order
+        postings: Dict[str, List[Tuple[int, int, int]]] = {}
+        postings_starts: Dict[str, int] = {}
+        overlap_ratio = threshold / (1 + threshold)
+
+        for entry_id in sorted(
+            range(len(self.entries)), key=lambda i: len(self.entries[i].trigrams)
+        ):
+            trigrams = self.entries[entry_id].trigrams
+            size = len(trigrams)
+            sorted_trigrams = sorted(trigrams, key=lambda t: (frequencies[t], t))
+            probing_prefix_length = size - math.ceil(threshold * size) + 1
+            indexing_prefix_length = (
+                size - math.ceil(2 * overlap_ratio * size - 1e-9) + 1
+            )
+            min_size = threshold * size
+
+            overlaps: Dict[int, int] = {}
+            for position, trigram in enumerate(sorted_trigrams[:probing_prefix_length]):
+                trigram_postings = postings.get(trigram)
+                if not trigram_postings:
+                    continue
+                start = postings_starts[trigram]
+                while (
+                    start < len(trigram_postings)
+                    and trigram_postings[start][1] < min_size
+                ):
+                    start += 1  # too short for this title, hence for all later ones
+                postings_starts[trigram] = start
+
+                for posting_index in range(start, len(trigram_postings)):
+                    other_id, other_size, other_position = trigram_postings[
+                        posting_index
+                    ]
+                    overlap = overlaps.get(other_id, 0)
+                    if overlap < 0:
+                        continue
+                    min_overlap = math.ceil(overlap_ratio * (size + other_size) - 1e-9)
+                    remaining = min(size - position, other_size - other_position)
+                    overlaps[other_id] = (
+                        overlap + 1 if overlap + remaining >= min_overlap else -1
+                    )
+
+            for other_id, overlap in overlaps.items():
+                if overlap <= 0:
+                    continue
+                other_trigrams = self.entries[other_id].trigrams
+                shared_count = len(trigrams & other_trigrams)
+                union_count = size + len(other_trigrams) - shared_count
+                if shared_count / union_count >= threshold:
+                    parents[find_root(other_id)] = find_root(entry_id)
+
+            for position, trigram in enumerate(
+                sorted_trigrams[:indexing_prefix_length]
+            ):
+                postings.setdefault(trigram, []).append((entry_id, size, position))
+                postings_starts.setdefault(trigram, 0)
+
+        clusters: Dict[int, List[TitleEntry]] = {}
+        for entry_id, entry in enumerate(self.entries):
+            clusters.setdefault(find_root(entry_id), []).append(entry)
+
+        return sorted(
+            (cluster for cluster in clusters.values() if len(cluster) > 1),
+            key=len,
+            reverse=True,
+        )
+
+
+# The title index of each project, along with the test files index and documents ranges it was built from
+_local_title_index_cache: Dict[str, Tuple[Tuple[object, ...], TitleIndex]] = {}
+
+
+def get_title_from_file_name(file_name: str) -> str | None:
+    """
+    Get the title of a test case from the name of its file.
+
+    Args:
+        file_name (str): The name of the file.
+
+    Returns:
+        str | None: The title, or None if the file is not a YAML file or holds many test cases
+            (see `utility.MULTI_DOCUMENT_SUFFIX`).
+    """
+    if file_name.endswith(MULTI_DOCUMENT_SUFFIX):
+        return None
+    for extension in (".yaml", ".yml"):
+        if file_name.endswith(extension):
+            return file_name[: -len(extension)]
+    return None
+
+
+def get_local_title_index(project_path: str) -> TitleIndex:
+    """
+    Get the title index of the test case files of a project.
+
+    The index is rebuilt only when the test files index of the project, or a multi-document file, changes.
+
+    Args:
+        project_path (str): The path to the project folder.
+
+    Returns:
+        TitleIndex: The index of the local titles, located by file path.
+    """
+    _, files_index = get_test_files_index(project_path)
+    documents_files = [
+        (file_path, get_documents_ranges(file_path))
+        for files_paths in get_multi_document_files(project_path).values()
+        for file_path in files_paths
+    ]
+    # the cached objects are replaced whenever they change
+    sources = (files_index, *(ranges for _, ranges in documents_files))
+
+    cache_key = os.path.abspath(project_path)
+    cached = _local_title_index_cache.get(cache_key)
+    if (
+        cached is not None
+        and len(cached[0]) == len(sources)
+        and all(a is b for a, b in zip(cached[0], sources))
+    ):
+        return cached[1]
+
+    title_index = TitleIndex()
+    for file_name, folders_paths in files_index.items():
+        title = get_title_from_file_name(file_name)
+        if title is None:
+            continue
+        for folder_path in folders_paths:
+            title_index.add(
+                TitleEntry(
+                    title,
+                    os.path.relpath(os.path.join(folder_path, file_name), project_path),
+                )
+            )
+    for file_path, documents_ranges in documents_files:
+        untitled_prefix = get_untitled_document_prefix(file_path)
+        for title in documents_ranges:
+            if not title.startswith(untitled_prefix):
+                title_index.add(
+                    TitleEntry(title, os.path.relpath(file_path, project_path))
+                )
+
+    _local_title_index_cache[cache_key] = (sources, title_index)
+    return title_index
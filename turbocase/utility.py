@@ -1,14 +1,42 @@
-from typing import Any
+from typing import IO, Any, Callable, Dict, Iterator, List, Tuple
+from argparse import ArgumentTypeError
+from contextlib import contextmanager
+from dataclasses import dataclass
 from requests import HTTPError
 from rich.console import Console
+import csv
+import hashlib
+import re
+import stat
+import tempfile
 import toml
+import yaml
 import os
 from turbocase.__init__ import __version__
-from turbocase.enums import Color, Project
+from turbocase.enums import App, Color, Project
 
 HINT_PREFIX = "[blue][bold]Hint:[/bold]"
 SUCCESS_PREFIX = ":heavy_check_mark:"
 FAILURE_PREFIX = "[bold][ERR][/bold]"
+WARNING_PREFIX = "[bold][WARN][/bold]"
+
+# The maximum number of similar titles listed in a warning
+MAX_LISTED_SIMILAR_TITLES = 5
+
+# The C loader of PyYAML is much faster than the pure-Python one, when available
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# The suffix of the files holding many test cases, as a stream of YAML documents with a `title` each
+MULTI_DOCUMENT_SUFFIX = ".cases.yaml"
+
+# A `---` marker at the start of a line always starts a new YAML document
+_DOCUMENT_START_PATTERN = re.compile(rb"^---(?=[ \t\r\n]|$)", re.MULTILINE)
+
+# The folder of a project holding the fragments shared by test cases, next to the `app` folder
+SHARED_FOLDER_NAME = "shared"
+
+# The YAML tag referencing a shared fragment (e.g. `- !include logged-in.yaml`)
+INCLUDE_TAG = "!include"
 
 BANNER = r"""
 ████████╗██╗   ██╗██████╗ ██████╗  ██████╗        ██████╗ █████╗ ███████╗███████╗
@@ -19,6 +47,29 @@ BANNER = r"""
    ╚═╝    ╚═════╝ ╚═╝  ╚═╝╚═════╝  ╚═════╝        ╚═════╝╚═╝  ╚═╝╚══════╝╚══════╝
 """
 
+# The permission bits removed from new files, read once since the umask can only be read by replacing it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Parsed `project.toml` files, keyed by path and invalidated by modification time.
+_configuration_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+# Test file indexes of `app` folders, keyed by path (see `get_test_files_index`).
+_test_files_index_cache: Dict[str, Tuple[Dict[str, int], Dict[str, List[str]]]] = {}
+
+# The multi-document files of each folder, keyed by `app` folder and invalidated with its test files index.
+_multi_document_files_cache: Dict[str, Tuple[object, Dict[str, List[str]]]] = {}
+
+# The documents of multi-document files, keyed by path and invalidated by modification time and size
+# (see `get_documents_ranges`).
+_documents_ranges_cache: Dict[
+    str, Tuple[Tuple[int, int], Dict[str, Tuple[int, int]]]
+] = {}
+
+# Resolved shared fragments, keyed by path and invalidated by the modification time and size
+# of the fragment and of the fragments it includes (see `resolve_fragments`).
+_fragments_cache: Dict[str, Tuple[Dict[str, Tuple[int, int]], Any]] = {}
+
 
 class NotTurboCaseProject(Exception):
     """Base class for all TurboCase exceptions."""
@@ -34,6 +85,36 @@ class NotTurboCaseProject(Exception):
         super().__init__(self.message)
 
 
+class ConcurrentModificationError(Exception):
+    """Raised when a remote test case keeps changing while it is being updated, or when conflicts abort updates."""
+
+    def __init__(self, test_title: str, test_case_id: int, reason: str):
+        self.test_title = test_title
+        self.test_case_id = test_case_id
+        super().__init__(f"Test case `{test_title}` (ID: {test_case_id}) {reason}")
+
+
+@dataclass(frozen=True)
+class Include:
+    """
+    A reference to a shared fragment, loaded from an `!include <path>` tag.
+
+    Attributes:
+        path (str): The path of the fragment, relative to the `shared` folder of the project.
+    """
+
+    path: str
+
+
+class TestCaseLoader(YAML_LOADER):
+    """The YAML loader of test case files: `YAML_LOADER`, which also loads `!include` tags as `Include` references."""
+
+
+TestCaseLoader.add_constructor(
+    INCLUDE_TAG, lambda loader, node: Include(loader.construct_scalar(node))
+)
+
+
 def print_banner():
     """Print the banner and version of turbocase."""
     console = Console(width=len(BANNER.splitlines()[1]))
@@ -65,12 +146,99 @@ def get_turbocase_folder_path(*, __current_dir: str | None = None) -> str:
     return get_turbocase_folder_path(__current_dir=os.path.dirname(__current_dir))
 
 
-def get_project_configuration(configuration_name: str) -> Any:
+def load_configuration_file(config_file_path: str) -> Dict[str, Any]:
+    """
+    Load a `project.toml` file, reusing the parsed content as long as the file is unchanged.
+
+    Args:
+        config_file_path (str): The path to the `project.toml` file.
+
+    Returns:
+        Dict[str, Any]: The configurations stored in the file.
+    """
+    config_file_path = os.path.abspath(config_file_path)
+    modification_time = os.stat(config_file_path).st_mtime_ns
+
+    cached = _configuration_cache.get(config_file_path)
+    if cached is not None and cached[0] == modification_time:
+        return cached[1]
+
+    with open(config_file_path, "r") as config_file:
+        configurations = toml.load(config_file)
+
+    _configuration_cache[config_file_path] = (modification_time, configurations)
+    return configurations
+
+
+@contextmanager
+def open_atomically(
+    file_path: str,
+    mode: str = "w",
+    *,
+    encoding: str | None = None,
+    fsync: bool = False,
+) -> Iterator[IO]:
+    """
+    Open a temporary file that replaces a file once written, so that readers never see a partially written file.
+
+    The written file keeps the permissions of the file it replaces, or gets the default permissions of new
+    files. If writing fails, the file is left untouched.
+
+    Args:
+        file_path (str): The path of the file to write. Its folder must exist.
+        mode (str): The mode of the temporary file, `w` or `wb`. Default: `w`.
+        encoding (str | None): The encoding of a text file. Default: the encoding of the locale.
+        fsync (bool): Whether to flush the file to the disk before it replaces the file, so that it
+            survives a crash of the system. Default: False.
+
+    Yields:
+        IO: The temporary file.
+    """
+    file_descriptor, temporary_file_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(file_path)), suffix=".tmp"
+    )
+    try:
+        with os.fdopen(file_descriptor, mode, encoding=encoding) as temporary_file:
+            yield temporary_file
+            if fsync:
+                temporary_file.flush()
+                os.fsync(temporary_file.fileno())
+        # `mkstemp` creates the file private
+        try:
+            file_mode = stat.S_IMODE(os.stat(file_path).st_mode)
+        except FileNotFoundError:
+            file_mode = 0o666 & ~_UMASK
+        os.chmod(temporary_file_path, file_mode)
+        os.replace(temporary_file_path, file_path)
+    except BaseException:
+        os.unlink(temporary_file_path)
+        raise
+
+
+def write_configuration_file(
+    config_file_path: str, configurations: Dict[str, Any]
+) -> None:
+    """
+    Write a `project.toml` file atomically, so that readers never see a partially written file.
+
+    Args:
+        config_file_path (str): The path to the `project.toml` file.
+        configurations (Dict[str, Any]): The configurations to store in the file.
+    """
+    with open_atomically(config_file_path, fsync=True) as temporary_file:
+        toml.dump(configurations, temporary_file)
+
+
+def get_project_configuration(
+    configuration_name: str, project_path: str | None = None
+) -> Any:
     """
     Retrieve the value of a project configuration from the .turbocase/project.toml file.
 
     Args:
         configuration_name (str): The name of the configuration to retrieve.
+        project_path (str | None): The path to the project folder.
+            Default: the project containing the current directory.
 
     Returns:
         Any: The value of the configuration.
@@ -79,15 +247,18 @@ def get_project_configuration(configuration_name: str) -> Any:
         KeyError: If the configuration does not exist in the file.
             This can happen if the file is corrupted.
     """
-    config_file_path = os.path.join(get_turbocase_folder_path(), "project.toml")
-    with open(config_file_path, "r") as config_file:
-        configurations = toml.load(config_file)
-        try:
-            return configurations[configuration_name]
-        except KeyError:
-            raise KeyError(
-                "Turbocase folder is corrupted. Use [yellow]`turbocase init`[/yellow] to reinitialize it."
-            )
+    if project_path is None:
+        turbocase_folder_path = get_turbocase_folder_path()
+    else:
+        turbocase_folder_path = os.path.join(project_path, ".turbocase")
+    config_file_path = os.path.join(turbocase_folder_path, "project.toml")
+    configurations = load_configuration_file(config_file_path)
+    try:
+        return configurations[configuration_name]
+    except KeyError:
+        raise KeyError(
+            "Turbocase folder is corrupted. Use [yellow]`turbocase init`[/yellow] to reinitialize it."
+        )
 
 
 def get_project_id_from_config_file(project: Project, project_path: str) -> int:
@@ -105,16 +276,15 @@ def get_project_id_from_config_file(project: Project, project_path: str) -> int:
         KeyError: If the sub-app is not found in the project configurations.
     """
     project_config_file_path = os.path.join(project_path, ".turbocase/project.toml")
-    with open(project_config_file_path, "r") as project_config_file:
-        configurations = toml.load(project_config_file)
-        try:
-            return configurations[project.name]
-        except KeyError:
-            raise KeyError(
-                "Project folder is corrupted. "
-                "Run [yellow]`turbocase project --help`[/yellow] for more information "
-                "on how to re-initialize the project."
-            )
+    configurations = load_configuration_file(project_config_file_path)
+    try:
+        return configurations[project.name]
+    except KeyError:
+        raise KeyError(
+            "Project folder is corrupted. "
+            "Run [yellow]`turbocase project --help`[/yellow] for more information "
+            "on how to re-initialize the project."
+        )
 
 
 def print_error_hints(e: Exception, *, console: Console) -> None:
@@ -134,12 +304,48 @@ def print_error_hints(e: Exception, *, console: Console) -> None:
             console.print(
                 f"{HINT_PREFIX} Are you sure you used the correct test case ID?"
             )
+    elif isinstance(e, ConcurrentModificationError):
+        console.print(
+            f"{HINT_PREFIX} Use [yellow]`--on-conflict local-wins`[/yellow] to overwrite the remote changes, "
+            "or [yellow]`--on-conflict remote-wins`[/yellow] to keep them."
+        )
     elif isinstance(e, NotTurboCaseProject):
         console.print(
             f"{HINT_PREFIX} Use [yellow]`turbocase init`[/yellow] to initialize a new project."
         )
 
 
+def print_similar_titles_warning(
+    title: str, matches: List[Tuple[Any, float]], *, console: Console
+) -> None:
+    """
+    Prints a warning listing the existing titles that are similar to a title, if any.
+
+    Args:
+        title (str): The title of the test case.
+        matches (List[Tuple[TitleEntry, float]]): The similar titles and their similarities, most similar first.
+        console (Console): The console object used for printing.
+    """
+    if not matches:
+        return
+
+    console.print(
+        f"[yellow]{WARNING_PREFIX} Found {len(matches)} test case(s) with a title similar to "
+        f"[cyan]`{title}`[/cyan]:"
+    )
+    for entry, similarity in matches[:MAX_LISTED_SIMILAR_TITLES]:
+        console.print(
+            f"  - [cyan]`{entry.title}`[/cyan] ({entry.location}, {similarity:.0%} similar)",
+            highlight=False,
+        )
+    if len(matches) > MAX_LISTED_SIMILAR_TITLES:
+        console.print(f"  - ... and {len(matches) - MAX_LISTED_SIMILAR_TITLES} more")
+    console.print(
+        f"{HINT_PREFIX} Test cases are matched by their exact title. "
+        "Use [yellow]`turbocase dedupe`[/yellow] to list all similar titles."
+    )
+
+
 def get_result_color(created_files_n: int, file_n: int) -> Color:
     """
     Determines the color of the result based on the number of created files and the total number of files.
@@ -170,7 +376,567 @@ def file_exists_in_project(file_name, project_path) -> str | None:
     Returns:
         str | None: The name of the folder where the file exists, or None if the file is not found.
     """
-    for root, _, files in os.walk(os.path.join(project_path, "app")):
-        if file_name in files:
-            return os.path.basename(root)
+    _, files_index = get_test_files_index(project_path)
+    folders_paths = files_index.get(file_name)
+    if not folders_paths:
+        return None
+    return os.path.basename(folders_paths[0])
+
+
+def get_test_files_index(
+    project_path: str,
+) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+    """
+    Get an index of the files under the `app` folder of a project.
+
+    The index is cached per project and only rebuilt when a folder of the tree changes
+    (adding, removing or renaming a file updates the modification time of its folder).
+
+    Args:
+        project_path (str): The path to the project folder.
+
+    Returns:
+        Tuple[Dict[str, int], Dict[str, List[str]]]: The modification times of the indexed folders,
+            and a mapping of each file name to the paths of the folders containing it (top-down).
+    """
+    app_folder_path = os.path.abspath(os.path.join(project_path, "app"))
+
+    cached = _test_files_index_cache.get(app_folder_path)
+    if cached is not None:
+        folders_mtimes, _ = cached
+        try:
+            if all(
+                os.stat(folder_path).st_mtime_ns == mtime
+                for folder_path, mtime in folders_mtimes.items()
+            ):
+                return cached
+        except FileNotFoundError:
+            pass
+
+    folders_mtimes: Dict[str, int] = {}
+    files_index: Dict[str, List[str]] = {}
+    for root, _, files in os.walk(app_folder_path):
+        folders_mtimes[root] = os.stat(root).st_mtime_ns
+        for file_name in files:
+            files_index.setdefault(file_name, []).append(root)
+
+    _test_files_index_cache[app_folder_path] = (folders_mtimes, files_index)
+    return folders_mtimes, files_index
+
+
+def parse_shard(shard: str) -> Tuple[int, int]:
+    """
+    Parse a shard specification of the form `i/n` (the i-th of n shards, starting from 1).
+
+    Args:
+        shard (str): The shard specification.
+
+    Returns:
+        Tuple[int, int]: The index of the shard and the number of shards.
+
+    Raises:
+        ArgumentTypeError: If the specification is malformed.
+    """
+    try:
+        index, count = (int(part) for part in shard.split("/"))
+    except ValueError:
+        raise ArgumentTypeError(f"invalid shard `{shard}`, expected `i/n` (e.g. `1/4`)")
+    if not 1 <= index <= count:
+        raise ArgumentTypeError(
+            f"invalid shard `{shard}`, the index must be between 1 and {count}"
+        )
+    return index, count
+
+
+def parse_positive_int(value: str) -> int:
+    """
+    Parse a positive integer (e.g. a count or a limit).
+
+    Args:
+        value (str): The integer.
+
+    Returns:
+        int: The integer.
+
+    Raises:
+        ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise ArgumentTypeError(f"invalid value `{value}`, expected a positive integer")
+    return number
+
+
+def parse_project_name(project_name: str) -> Tuple[str, str]:
+    """
+    Parse a project name specification of the form `PROJECT=name` (e.g. `IOS=Shop iOS`).
+
+    Args:
+        project_name (str): The project name specification.
+
+    Returns:
+        Tuple[str, str]: The name of the `Project` and the full name of the project in Testiny.
+
+    Raises:
+        ArgumentTypeError: If the specification is malformed or the project is unknown.
+    """
+    project, separator, name = project_name.partition("=")
+    project = project.strip().upper()
+    if not separator or not name.strip():
+        raise ArgumentTypeError(
+            f"invalid project name `{project_name}`, expected `PROJECT=name` (e.g. `IOS=Shop iOS`)"
+        )
+    if project not in Project.__members__:
+        raise ArgumentTypeError(
+            f"invalid project `{project}`, choose from: {', '.join(Project.__members__)}"
+        )
+    return project, name.strip()
+
+
+def is_in_shard(app: App, test_title: str, shard: Tuple[int, int]) -> bool:
+    """
+    Check if a test case belongs to a shard.
+
+    Test cases are assigned to shards by a stable hash of their app and title, so that the same
+    test case always lands in the same shard, regardless of the machine or of the other files.
+
+    Args:
+        app (App): The app of the test case.
+        test_title (str): The title of the test case.
+        shard (Tuple[int, int]): The index of the shard and the number of shards.
+
+    Returns:
+        bool: True if the test case belongs to the shard.
+    """
+    index, count = shard
+    digest = hashlib.sha256(f"{app.value.name}\0{test_title}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count == index - 1
+
+
+def load_generate_manifest(
+    manifest_path: str,
+) -> List[Tuple[str | None, str, List[str] | None]]:
+    """
+    Load a manifest of test cases to generate, from a CSV or YAML file.
+
+    A CSV file has a header with a `title` column, and optional `app` and `steps` columns
+    (steps separated by new lines). A YAML file is a list of mappings with a `title` key,
+    and optional `app` and `steps` (a list) keys.
+
+    Args:
+        manifest_path (str): The path to the manifest.
+
+    Returns:
+        List[Tuple[str | None, str, List[str] | None]]: The app name (if any), title and steps (if any)
+            of each test case.
+
+    Raises:
+        ValueError: If the manifest is malformed.
+    """
+    with open(manifest_path, "r", encoding="utf-8", newline="") as manifest_file:
+        if manifest_path.endswith(".csv"):
+            rows = list(csv.DictReader(manifest_file))
+        elif manifest_path.endswith((".yaml", ".yml")):
+            rows = yaml.safe_load(manifest_file) or []
+        else:
+            raise ValueError("Manifest must be a `.csv`, `.yaml` or `.yml` file")
+
+    if not isinstance(rows, list):
+        raise ValueError("Manifest must be a list of test cases")
+
+    test_cases = []
+    for row_n, row in enumerate(rows, start=1):
+        if not isinstance(row, dict) or not str(row.get("title") or "").strip():
+            raise ValueError(f"Test case {row_n} of the manifest has no title")
+        app_name = str(row.get("app") or "").strip().lower() or None
+        if app_name is not None and app_name.upper() not in App.__members__:
+            raise ValueError(
+                f"Test case {row_n} of the manifest has an unknown app: `{app_name}`"
+            )
+        steps = row.get("steps") or None
+        if isinstance(steps, str):
+            steps = [step.strip() for step in steps.splitlines() if step.strip()]
+        elif steps is not None:
+            steps = [str(step) for step in steps]
+        test_cases.append((app_name, str(row["title"]).strip(), steps))
+    return test_cases
+
+
+def list_test_titles(project_path: str, app: App) -> List[str]:
+    """
+    List the titles of the test case files directly inside the folder of an app.
+
+    Args:
+        project_path (str): The path to the project folder.
+        app (App): The app whose folder to list.
+
+    Returns:
+        List[str]: The titles of the test cases, sorted.
+    """
+    app_folder_path = os.path.abspath(os.path.join(project_path, app.value.path))
+    _, files_index = get_test_files_index(project_path)
+    test_titles = [
+        file_name[: -len(".yaml")]
+        for file_name, folders_paths in files_index.items()
+        if file_name.endswith(".yaml")
+        and not file_name.endswith(MULTI_DOCUMENT_SUFFIX)
+        and app_folder_path in folders_paths
+    ]
+    for file_path in get_multi_document_files(project_path).get(app_folder_path, []):
+        test_titles.extend(get_documents_ranges(file_path))
+    return sorted(test_titles)
+
+
+def get_multi_document_files(project_path: str) -> Dict[str, List[str]]:
+    """
+    Get the multi-document test case files (see `MULTI_DOCUMENT_SUFFIX`) of a project.
+
+    Args:
+        project_path (str): The path to the project folder.
+
+    Returns:
+        Dict[str, List[str]]: By absolute folder path, the paths of the multi-document files directly inside it.
+    """
+    _, files_index = get_test_files_index(project_path)
+    cache_key = os.path.abspath(project_path)
+    cached = _multi_document_files_cache.get(cache_key)
+    if cached is not None and cached[0] is files_index:
+        return cached[1]
+
+    multi_document_files: Dict[str, List[str]] = {}
+    for file_name, folders_paths in files_index.items():
+        if file_name.endswith(MULTI_DOCUMENT_SUFFIX):
+            for folder_path in folders_paths:
+                multi_document_files.setdefault(folder_path, []).append(
+                    os.path.join(folder_path, file_name)
+                )
+    for files_paths in multi_document_files.values():
+        files_paths.sort()
+
+    _multi_document_files_cache[cache_key] = (files_index, multi_document_files)
+    return multi_document_files
+
+
+def get_documents_ranges(file_path: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Get the title and byte range of each test case of a multi-document file.
+
+    The documents are split at their `---` markers and parsed one at a time, so that a test case can later be
+    read without parsing the others (see `read_document`). A document without a title (or repeating the title
+    of an earlier document, or that cannot be parsed) is listed as `<file name>#<position>`, so that reading
+    it reports the problem.
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: The offset and length of each document, by title, in order.
+    """
+    stat = os.stat(file_path)
+    stats = (stat.st_mtime_ns, stat.st_size)
+    cached = _documents_ranges_cache.get(file_path)
+    if cached is not None and cached[0] == stats:
+        return cached[1]
+
+    with open(file_path, "rb") as file:
+        content = file.read()
+    starts = [0] + [
+        match.start()
+        for match in _DOCUMENT_START_PATTERN.finditer(content)
+        if match.start() != 0
+    ]
+
+    documents_ranges: Dict[str, Tuple[int, int]] = {}
+    for position, (start, end) in enumerate(
+        zip(starts, starts[1:] + [len(content)]), start=1
+    ):
+        try:
+            document = yaml.load(content[start:end], Loader=TestCaseLoader)
+        except yaml.YAMLError:
+            document = {}
+        if document is None:
+            continue  # e.g. a comment before the first `---`
+        title = document.get("title") if isinstance(document, dict) else None
+        if not isinstance(title, str) or title in documents_ranges:
+            title = f"{get_untitled_document_prefix(file_path)}{position}"
+        documents_ranges[title] = (start, end - start)
+
+    _documents_ranges_cache[file_path] = (stats, documents_ranges)
+    return documents_ranges
+
+
+def get_untitled_document_prefix(file_path: str) -> str:
+    """
+    Get the prefix of the titles listed for the untitled documents of a multi-document file (see `get_documents_ranges`).
+
+    Args:
+        file_path (str): The path of the file.
+
+    Returns:
+        str: The prefix (e.g. `checkout.cases.yaml#`).
+    """
+    return f"{os.path.basename(file_path)}#"
+
+
+def find_document(project_path: str, app: App, test_title: str) -> str | None:
+    """
+    Find the multi-document file holding a test case, directly inside the folder of an app.
+
+    Args:
+        project_path (str): The path to the project folder.
+        app (App): The app of the test case.
+        test_title (str): The title of the test case.
+
+    Returns:
+        str | None: The path of the file, or None if no multi-document file holds the test case.
+    """
+    app_folder_path = os.path.abspath(os.path.join(project_path, app.value.path))
+    for file_path in get_multi_document_files(project_path).get(app_folder_path, []):
+        if test_title in get_documents_ranges(file_path):
+            return file_path
     return None
+
+
+def get_test_case_path(project_path: str, app: App, test_title: str) -> str:
+    """
+    Get the file of a test case, relative to the project folder.
+
+    Args:
+        project_path (str): The path to the project folder.
+        app (App): The app of the test case.
+        test_title (str): The title of the test case.
+
+    Returns:
+        str: The path of `<title>.yaml` in the folder of the app or, if there is no such file,
+            of the multi-document file holding the test case, if any.
+    """
+    path = os.path.join(app.value.path, f"{test_title}.yaml")
+    if not os.path.exists(os.path.join(project_path, path)):
+        document_file_path = find_document(project_path, app, test_title)
+        if document_file_path is not None:
+            return os.path.relpath(document_file_path, project_path)
+    return path
+
+
+def read_document(file_path: str, test_title: str) -> Dict[str, Any]:
+    """
+    Read a single test case of a multi-document file.
+
+    Args:
+        file_path (str): The path of the file.
+        test_title (str): The title of the test case (as listed by `get_documents_ranges`).
+
+    Returns:
+        Dict[str, Any]: The content of the test case, without its title.
+
+    Raises:
+        KeyError: If the file holds no test case with this title.
+        ValueError: If the document has no title or repeats the title of an earlier document.
+    """
+    offset, length = get_documents_ranges(file_path)[test_title]
+    with open(file_path, "rb") as file:
+        file.seek(offset)
+        document = yaml.load(file.read(length), Loader=TestCaseLoader)
+
+    title = document.get("title") if isinstance(document, dict) else None
+    if not isinstance(title, str):
+        raise ValueError(
+            f"Document [yellow]`{test_title}`[/yellow] has no [yellow]`title`[/yellow]"
+        )
+    if title != test_title:
+        raise ValueError(
+            f"Document [yellow]`{test_title}`[/yellow] repeats the title [yellow]`{title}`[/yellow] "
+            "of an earlier document"
+        )
+    return {key: value for key, value in document.items() if key != "title"}
+
+
+def get_documents_titles(project_path: str) -> Dict[str, List[str]]:
+    """
+    Get the titles of the test cases of all multi-document files of a project.
+
+    Args:
+        project_path (str): The path to the project folder.
+
+    Returns:
+        Dict[str, List[str]]: By title, the paths of the files holding the test case, relative to the project folder.
+    """
+    documents_titles: Dict[str, List[str]] = {}
+    for files_paths in get_multi_document_files(project_path).values():
+        for file_path in files_paths:
+            relative_path = os.path.relpath(file_path, project_path)
+            untitled_prefix = get_untitled_document_prefix(file_path)
+            for test_title in get_documents_ranges(file_path):
+                if not test_title.startswith(untitled_prefix):
+                    documents_titles.setdefault(test_title, []).append(relative_path)
+    return documents_titles
+
+
+def includes_fragments(value: Any) -> bool:
+    """
+    Check whether loaded test case content references shared fragments.
+
+    Args:
+        value (Any): The content, as loaded with `TestCaseLoader`.
+
+    Returns:
+        bool: Whether the content holds an `Include` reference, at any depth.
+    """
+    if isinstance(value, Include):
+        return True
+    if isinstance(value, list):
+        return any(includes_fragments(item) for item in value)
+    if isinstance(value, dict):
+        return any(includes_fragments(item) for item in value.values())
+    return False
+
+
+def _get_file_stats(file_path: str) -> Tuple[int, int] | None:
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _load_fragment(
+    project_path: str, fragment_path: str, including: List[str]
+) -> Tuple[Any, Dict[str, Tuple[int, int]]]:
+    shared_folder_path = os.path.abspath(os.path.join(project_path, SHARED_FOLDER_NAME))
+    file_path = os.path.normpath(os.path.join(shared_folder_path, fragment_path))
+    if os.path.commonpath([shared_folder_path, file_path]) != shared_folder_path:
+        raise ValueError(
+            f"Fragment [yellow]`{fragment_path}`[/yellow] is outside of the "
+            f"[yellow]`{SHARED_FOLDER_NAME}`[/yellow] folder"
+        )
+    if file_path in including:
+        cycle = including[including.index(file_path) :] + [file_path]
+        raise ValueError(
+            "Fragments include each other in a cycle: "
+            + " -> ".join(
+                f"[yellow]`{os.path.relpath(path, shared_folder_path)}`[/yellow]"
+                for path in cycle
+            )
+        )
+
+    cached = _fragments_cache.get(file_path)
+    if cached is not None and all(
+        _get_file_stats(path) == stats for path, stats in cached[0].items()
+    ):
+        return cached[1], cached[0]
+
+    stats = _get_file_stats(file_path)
+    if stats is None:
+        raise ValueError(
+            f"Fragment [yellow]`{fragment_path}`[/yellow] does not exist in the "
+            f"[yellow]`{SHARED_FOLDER_NAME}`[/yellow] folder"
+        )
+    with open(file_path, "r", encoding="utf-8") as file:
+        fragment = yaml.load(file, Loader=TestCaseLoader)
+    dependencies = {file_path: stats}
+    fragment = _resolve(project_path, fragment, including + [file_path], dependencies)
+    _fragments_cache[file_path] = (dependencies, fragment)
+    return fragment, dependencies
+
+
+def _resolve(
+    project_path: str,
+    value: Any,
+    including: List[str],
+    dependencies: Dict[str, Tuple[int, int]],
+) -> Any:
+    if isinstance(value, Include):
+        fragment, fragment_dependencies = _load_fragment(
+            project_path, value.path, including
+        )
+        dependencies.update(fragment_dependencies)
+        # the cached fragment is shared by all test cases including it
+        return list(fragment) if isinstance(fragment, list) else fragment
+    if isinstance(value, list):
+        items = []
+        for item in value:
+            resolved_item = _resolve(project_path, item, including, dependencies)
+            if isinstance(item, Include) and isinstance(resolved_item, list):
+                items.extend(resolved_item)  # a list fragment is spliced into the list
+            else:
+                items.append(resolved_item)
+        return items
+    if isinstance(value, dict):
+        return {
+            key: _resolve(project_path, item, including, dependencies)
+            for key, item in value.items()
+        }
+    return value
+
+
+def resolve_fragments(test_case_content: Any, project_path: str) -> Any:
+    """
+    Replace the `!include <path>` references of a test case with the shared fragments they refer to.
+
+    Fragments are YAML files of the `shared` folder of the project, and may include other fragments.
+    A fragment included as a list item is spliced into the list if it is a list itself (e.g. the lines of
+    common preconditions), otherwise it replaces the reference. Each fragment is loaded and resolved once,
+    then reused until it or one of the fragments it includes is modified.
+
+    Args:
+        test_case_content (Any): The content of the test case, as loaded with `TestCaseLoader`.
+        project_path (str): The path to the project folder.
+
+    Returns:
+        Any: The content of the test case, with the fragments expanded.
+
+    Raises:
+        ValueError: If a fragment does not exist, is outside of the `shared` folder, or includes itself
+            (directly or not).
+    """
+    if not includes_fragments(test_case_content):
+        return test_case_content
+    return _resolve(project_path, test_case_content, [], {})
+
+
+def select_test_cases(
+    project_path: str,
+    app_name: str | None,
+    test_titles: List[str],
+    *,
+    select_all: bool = False,
+    shard: Tuple[int, int] | None = None,
+    list_titles: Callable[[App], List[str]] | None = None,
+) -> List[Tuple[App, str]]:
+    """
+    Select the test cases a command operates on.
+
+    Args:
+        project_path (str): The path to the project folder.
+        app_name (str | None): The name of the app. Default: `app`, or every app when selecting all test cases.
+        test_titles (List[str]): The titles of the test cases.
+        select_all (bool): Whether to select every test case file of the app(s) instead of `test_titles`.
+        shard (Tuple[int, int] | None): If given, only keep the test cases belonging to this shard.
+        list_titles (Callable[[App], List[str]] | None): Lists the test case titles of an app when selecting
+            all test cases (e.g. `Bundle.list_test_titles`). Default: the titles of the files of the app.
+
+    Returns:
+        List[Tuple[App, str]]: The selected test cases.
+    """
+    if select_all:
+        apps = list(App) if app_name is None else [App[app_name.upper()]]
+        if list_titles is None:
+            list_titles = lambda app: list_test_titles(project_path, app)
+        test_cases = [
+            (app, test_title) for app in apps for test_title in list_titles(app)
+        ]
+    else:
+        app = App[(app_name or "app").upper()]
+        test_cases = [(app, test_title) for test_title in test_titles]
+
+    if shard is not None:
+        test_cases = [
+            (app, test_title)
+            for app, test_title in test_cases
+            if is_in_shard(app, test_title, shard)
+        ]
+
+    return test_cases